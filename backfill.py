@@ -0,0 +1,183 @@
+"""지난 메뉴 일괄 수집 (backfill)
+
+기간 안의 메뉴/평점을 업스트림에서 가져와 지난 메뉴 저장소(menu_store)에 채웁니다.
+
+- 업스트림 요청은 --rate (초당 요청 수) 이하로 제한하고, 날짜는 --workers 개씩 동시에 조회
+- 이미 저장소에 있는 (식당, 식사, 날짜)는 건너뜀
+- 진행 상황을 data/backfill.json 에 주기적으로 남기므로 중단(Ctrl+C) 후 --resume 으로 이어서 실행
+- 조회에 실패한 날짜는 저장하지 않고 체크포인트의 failed 에 남겨 다음 실행에서 다시 시도
+
+    python -m backfill --start 20250101 --end 20251231 --meal-types 2 --rate 5
+    python -m backfill --resume
+"""
+import argparse
+import json
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+
+import storage
+from menu_store import MenuStore
+from resilience import RateLimiter
+from welplus_api import DEFAULT_RESTAURANT_CODE, DEFAULT_RANGE_WORKERS, KST, LUNCH, plan_dates
+
+CHECKPOINT_FILE = "backfill.json"
+# 업스트림 초당 요청 수 (메뉴 하루 = 메뉴 1 + 평점 5~6 요청)
+DEFAULT_RATE = 5.0
+# 이 개수만큼 저장할 때마다 체크포인트 기록
+CHECKPOINT_EVERY = 20
+
+
+def checkpoint_path():
+    return storage.DATA_DIR / CHECKPOINT_FILE
+
+
+def load_checkpoint(path=None):
+    path = path or checkpoint_path()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(checkpoint, path=None):
+    path = path or checkpoint_path()
+    checkpoint["updated_at"] = datetime.now(KST).isoformat(timespec="seconds")
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+class Backfill:
+    """job: start/end(YYYYMMDD), meal_types, restaurant_code, weekdays_only"""
+
+    def __init__(self, api, store, job, workers=DEFAULT_RANGE_WORKERS, checkpoint_every=CHECKPOINT_EVERY):
+        self.api = api
+        self.store = store
+        self.job = job
+        self.workers = workers
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint = {"job": job, "stored": 0, "skipped": 0, "failed": [], "finished": False}
+
+    def _dates(self):
+        start = datetime.strptime(self.job["start"], "%Y%m%d")
+        end = datetime.strptime(self.job["end"], "%Y%m%d")
+        return start, end
+
+    def run(self, progress=None):
+        """수집 실행, 체크포인트 dict 반환 (중단되어도 그때까지의 진행 상황을 저장)"""
+        start, end = self._dates()
+        restaurant_code = self.job["restaurant_code"]
+        meal_types = tuple(self.job["meal_types"])
+        failed = []
+        pending = []
+
+        def present(menu_dt, meal_type):
+            return True if self.store.has(menu_dt, meal_type, restaurant_code) else None
+
+        results = self.api.get_menus(start, end, meal_types, restaurant_code, max_workers=self.workers,
+                                     cached=present, weekdays_only=self.job.get("weekdays_only", False),
+                                     strict=True)
+        try:
+            for menu_dt, meal_type, day_menu in results:
+                if day_menu is True:
+                    self.checkpoint["skipped"] += 1
+                elif day_menu is None:
+                    failed.append([menu_dt, meal_type])
+                else:
+                    pending.append((meal_type, day_menu))
+                    if len(pending) >= self.checkpoint_every:
+                        self._flush(pending, failed)
+                if progress:
+                    progress(self.checkpoint, len(pending), len(failed))
+            self.checkpoint["finished"] = True
+        finally:
+            results.close()
+            self._flush(pending, failed)
+        return self.checkpoint
+
+    def _flush(self, pending, failed):
+        # 저장소에 먼저 쓰고 체크포인트를 남김 (중단되어도 저장소가 기준)
+        self.store.put_many(pending, self.job["restaurant_code"])
+        self.checkpoint["stored"] += len(pending)
+        pending.clear()
+        self.checkpoint["failed"] = list(failed)
+        save_checkpoint(self.checkpoint)
+
+
+def _progress_printer(total):
+    last = [0.0]
+
+    def progress(checkpoint, pending, failed):
+        now = time.monotonic()
+        if now - last[0] < 1.0:
+            return
+        last[0] = now
+        done = checkpoint["stored"] + pending + checkpoint["skipped"] + failed
+        print(f"\r{done}/{total} (저장 {checkpoint['stored'] + pending}, 건너뜀 {checkpoint['skipped']}, "
+              f"실패 {failed})", end="", flush=True)
+    return progress
+
+
+def main():
+    from menu_http import load_credentials
+    from welplus_api import WelplusAPI
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--start", help="YYYYMMDD")
+    parser.add_argument("--end", help="YYYYMMDD (생략 시 어제)")
+    parser.add_argument("--meal-types", default=LUNCH, help="쉼표 구분 (예: 1,2,3)")
+    parser.add_argument("--restaurant", default=DEFAULT_RESTAURANT_CODE)
+    parser.add_argument("--weekdays-only", action="store_true")
+    parser.add_argument("--resume", action="store_true", help="마지막 체크포인트의 조건으로 이어서 실행")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="업스트림 초당 요청 수")
+    parser.add_argument("--workers", type=int, default=DEFAULT_RANGE_WORKERS)
+    parser.add_argument("--secrets", default=".streamlit/secrets.toml")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(message)s")
+
+    if args.resume:
+        checkpoint = load_checkpoint()
+        if checkpoint is None:
+            parser.error(f"체크포인트가 없습니다: {checkpoint_path()}")
+        job = checkpoint["job"]
+    else:
+        if not args.start:
+            parser.error("--start 또는 --resume 이 필요합니다")
+        yesterday = datetime.now(KST).replace(tzinfo=None) - timedelta(days=1)
+        job = {
+            "start": args.start,
+            "end": args.end or yesterday.strftime("%Y%m%d"),
+            "meal_types": args.meal_types.split(","),
+            "restaurant_code": args.restaurant,
+            "weekdays_only": args.weekdays_only,
+        }
+
+    credentials = load_credentials(args.secrets)
+    api = WelplusAPI(base_url=credentials["base_url"], pool_size=args.workers,
+                     rate_limiter=RateLimiter(args.rate, burst=max(1, int(args.rate))))
+    if not api.login(credentials.get("username"), credentials.get("password")):
+        parser.exit(1, "로그인 실패\n")
+
+    store = MenuStore()
+    backfill = Backfill(api, store, job, workers=args.workers)
+    start, end = backfill._dates()
+    total = len(plan_dates(start, end, job.get("weekdays_only", False))) * len(job["meal_types"])
+    print(f"{job['start']} ~ {job['end']} ({job['restaurant_code']}, 식사 {','.join(job['meal_types'])}): "
+          f"{total}건, 초당 {args.rate:g}요청")
+
+    started = time.monotonic()
+    try:
+        checkpoint = backfill.run(_progress_printer(total))
+    except KeyboardInterrupt:
+        checkpoint = backfill.checkpoint
+        print("\n중단됨 - `python -m backfill --resume` 으로 이어서 실행할 수 있습니다")
+    print(f"\n저장 {checkpoint['stored']}, 건너뜀 {checkpoint['skipped']}, 실패 {len(checkpoint['failed'])} "
+          f"({time.monotonic() - started:.1f}s, 저장소 {len(store)}건)")
+
+
+if __name__ == "__main__":
+    main()
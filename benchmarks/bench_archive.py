@@ -0,0 +1,120 @@
+"""지난 메뉴 분석 벤치마크 (menu_store dict 순회 vs 컬럼형 아카이브)
+
+기간별 합성 menus.jsonl 로 "기간 내 코너별 평균 칼로리/평점" 질의를
+저장소 레코드(dict) 순회와 아카이브(mmap NumPy 배열) 벡터 연산으로 각각 실행해
+지연, 최대 메모리, 크기를 비교합니다.
+
+    python -m benchmarks.bench_archive --years 1 5 --repeat 20
+"""
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks import datagen
+from benchmarks.common import summarize, save_results
+
+
+def scan_records(store, start, end):
+    """저장소 레코드를 dict 그대로 순회"""
+    sums = {}
+    for (_, _, menu_dt), record in store._index.items():
+        if not start <= menu_dt <= end:
+            continue
+        extra = record["menu"]["추가배식대"]
+        for item in record["menu"]["점심"] + ([extra] if extra else []):
+            if not item["칼로리"]:
+                continue
+            total = sums.setdefault(item["코너"], [0.0, 0.0, 0])
+            total[0] += float(item["칼로리"])
+            total[1] += item["평균평점"]
+            total[2] += 1
+    return {corner: (k / n, r / n) for corner, (k, r, n) in sums.items()}
+
+
+def scan_archive(archive, start, end):
+    """아카이브 컬럼을 벡터 연산으로 집계"""
+    window = archive.date_range(start, end)
+    corner = archive["corner"][window]
+    kcal = archive["kcal"][window]
+    rating = archive["rating_avg"][window]
+    valid = ~np.isnan(kcal)
+    corner, kcal, rating = corner[valid], kcal[valid], rating[valid]
+    size = len(archive.dicts["corner"])
+    counts = np.bincount(corner, minlength=size)
+    kcal_sum = np.bincount(corner, weights=kcal, minlength=size)
+    rating_sum = np.bincount(corner, weights=rating, minlength=size)
+    return {archive.dicts["corner"][c]: (kcal_sum[c] / counts[c], rating_sum[c] / counts[c])
+            for c in np.flatnonzero(counts)}
+
+
+def measure(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, summarize(samples), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=float, nargs="+", default=[1, 5])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    os.environ.setdefault("BOB_DATA_DIR", tempfile.mkdtemp(prefix="bob_data_"))
+    from menu_archive import MenuArchive, build_archive
+    from menu_store import MenuStore
+
+    summary = {}
+    print(f"{'case':<24}{'rows':>8}{'p50 ms':>10}{'p95 ms':>10}{'peak KiB':>10}{'KiB':>10}")
+    for years in args.years:
+        data_dir = Path(tempfile.mkdtemp(prefix=f"bob_menus_{years}y_"))
+        datagen.generate_menu_store(data_dir / "menus.jsonl", years)
+
+        started = time.perf_counter()
+        store = MenuStore(data_dir / "menus.jsonl")
+        load_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        build_archive(store, data_dir / "archive")
+        build_ms = (time.perf_counter() - started) * 1000
+        archive = MenuArchive.open(data_dir / "archive")
+        print(f"{years:g}y: store load {load_ms:.0f}ms, archive build {build_ms:.0f}ms")
+
+        # 마지막 1년 구간 질의
+        dates = archive["date"]
+        end = str(dates[-1]).replace("-", "")
+        start = str(dates[-1] - np.timedelta64(365, "D")).replace("-", "")
+        sizes = {
+            "records": (data_dir / "menus.jsonl").stat().st_size,
+            "archive": archive.nbytes() + sum(p.stat().st_size for p in archive.path.glob("*.json")),
+        }
+        expected, _, _ = measure(lambda: scan_records(store, start, end), 1)
+        for name, func in (("records", lambda: scan_records(store, start, end)),
+                           ("archive", lambda: scan_archive(archive, start, end))):
+            result, stats, peak = measure(func, args.repeat)
+            assert set(result) == set(expected) and all(
+                abs(result[c][0] - expected[c][0]) < 1e-3 for c in expected), "집계 결과 불일치"
+            case = f"{years:g}y/{name}"
+            summary[case] = dict(stats, peak_kib=peak / 1024, size_kib=sizes[name] / 1024, rows=len(archive))
+            print(f"{case:<24}{len(archive):>8}{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}"
+                  f"{peak / 1024:>10.1f}{sizes[name] / 1024:>10.1f}")
+
+    if not args.no_save:
+        save_results("archive", summary, {"years": args.years, "repeat": args.repeat})
+
+
+if __name__ == "__main__":
+    main()
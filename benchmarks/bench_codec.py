@@ -0,0 +1,73 @@
+"""직렬화 코덱 벤치마크 (codec.CODECS)
+
+기간별 합성 데이터(votes / comments / board / 지난 메뉴 레코드)와 하루치 메뉴 응답(HTTP API 본문 크기)을
+코덱마다 encode/decode 해 지연과 크기를 비교합니다.
+
+    python -m benchmarks.bench_codec --years 1 5 --repeat 10
+"""
+import argparse
+import random
+import time
+from datetime import datetime
+
+import codec
+from benchmarks import datagen
+from benchmarks.common import summarize, save_results
+
+
+def payloads(years, seed=0):
+    """{이름: 직렬화할 객체}"""
+    rng = random.Random(seed)
+    days = datagen.workdays(datetime(2026, 1, 1), int(365 * years))
+    menus = list(datagen.generate_menu_records(days, rng))
+    return {
+        "votes": datagen.generate_votes(days, rng),
+        "comments": datagen.generate_comments(days, rng),
+        "board": datagen.generate_board(days, rng),
+        "menus": menus,
+        "menu_day": menus[-1]["menu"],
+    }
+
+
+def timeit(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=float, nargs="+", default=[1, 5])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    summary = {}
+    print(f"{'case':<32}{'enc p50':>10}{'dec p50':>10}{'KiB':>10}{'vs pretty':>10}")
+    for years in args.years:
+        for payload_name, obj in payloads(years).items():
+            # 하루치 응답은 작아서 반복을 늘려 측정
+            repeat = args.repeat * 100 if payload_name == "menu_day" else args.repeat
+            baseline = None
+            for codec_name, c in codec.CODECS.items():
+                data = c.encode(obj)
+                assert codec.decode(data, allow=(codec_name,)) == obj, f"{codec_name}: {payload_name} 왕복 불일치"
+                baseline = baseline or len(data)
+                case = f"{years:g}y/{payload_name}/{codec_name}"
+                encode = timeit(lambda: c.encode(obj), repeat)
+                decode = timeit(lambda: c.decode(data), repeat)
+                summary[f"{case}/encode"] = dict(encode, kib=len(data) / 1024)
+                summary[f"{case}/decode"] = decode
+                print(f"{case:<32}{encode['p50_ms']:>10.3f}{decode['p50_ms']:>10.3f}"
+                      f"{len(data) / 1024:>10.1f}{len(data) / baseline:>10.2f}")
+
+    if not args.no_save:
+        save_results("codec", summary, {"years": args.years, "repeat": args.repeat,
+                                        "codecs": list(codec.CODECS)})
+
+
+if __name__ == "__main__":
+    main()
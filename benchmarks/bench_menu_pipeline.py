@@ -0,0 +1,130 @@
+"""메뉴 페이지 파이프라인 벤치마크
+
+스텁 서버(welplus_stub)와 픽스처로 get_menu -> 파싱 -> 저장소 로드 -> HTML 생성을
+Streamlit 없이 반복 실행하고, 단계별 p50/p95/p99 를 출력/저장합니다.
+
+    python -m benchmarks.bench_menu_pipeline --days 20 --rounds 5 --latency 0.05 --jitter 0.02
+    python -m benchmarks.bench_menu_pipeline --client async
+    python -m benchmarks.bench_menu_pipeline --client async --meal-types 1,2,3
+
+--meal-types 를 주면 메뉴 페이지의 조회 방식도 비교합니다 (매번 캐시를 비우고 측정):
+page_lunch(중식만), page_eager(모든 식사를 기다림), page_prefetch(중식만 기다리고 나머지는 백그라운드)
+"""
+import argparse
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+
+from benchmarks.common import StageTimer, print_table, save_results
+
+
+def seed_storage(day_menus, rng):
+    """벤치마크용 투표/댓글 데이터 생성"""
+    import storage
+
+    votes, comments = {}, {}
+    for day_menu in day_menus:
+        for item in day_menu.items:
+            votes[item.menu_id] = {"좋아요": rng.randint(0, 50), "별로": rng.randint(0, 20)}
+            comments[item.menu_id] = [
+                {"author": "익명", "text": f"댓글 {i}", "timestamp": "2026-01-01 12:00"}
+                for i in range(rng.randint(0, 5))
+            ]
+    storage.save_votes(votes)
+    storage.save_comments(comments)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", help="픽스처 디렉토리 (없으면 임시로 생성)")
+    parser.add_argument("--start", default="20260202", help="YYYYMMDD")
+    parser.add_argument("--days", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5, help="날짜 목록 반복 횟수")
+    parser.add_argument("--latency", type=float, default=0.03, help="스텁 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--client", choices=["sync", "async"], default="sync")
+    parser.add_argument("--meal-types", help="메뉴 페이지 조회 방식 비교용 식사 구분, 쉼표 구분 (예: 1,2,3)")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="bench_menu_")
+    # storage 는 import 시점에 BOB_DATA_DIR 을 읽음
+    os.environ["BOB_DATA_DIR"] = os.path.join(work_dir, "data")
+
+    import storage
+    import welplus_stub
+    from menu_cache import CachedMenuClient, SWRCache
+    from menu_model import LUNCH, select_meals, build_day_menu
+    from menu_render import day_menu_html
+    from welplus_api import WelplusAPI, rating_args
+    from welplus_async import SyncWelplusAPI
+
+    start = datetime.strptime(args.start, "%Y%m%d")
+    dates = [start + timedelta(days=i) for i in range(args.days)]
+
+    meal_types = tuple(args.meal_types.split(",")) if args.meal_types else ()
+    fixture_dir = args.fixtures or os.path.join(work_dir, "fixtures")
+    if not args.fixtures:
+        welplus_stub.synthesize(dates, fixture_dir, meal_types=meal_types or (LUNCH,))
+
+    server = welplus_stub.start_stub_server(
+        welplus_stub.StubConfig(fixture_dir, args.latency, args.jitter, seed=0))
+    api = WelplusAPI(base_url=server.base_url)
+    api.login("bench", "bench")
+    async_api = SyncWelplusAPI(api=api) if args.client == "async" else None
+    page_client = CachedMenuClient(async_api or api, SWRCache())
+
+    # 저장소에 측정 대상 날짜들의 투표/댓글을 미리 채움
+    seed_storage([api.get_menu(d) for d in dates], random.Random(0))
+
+    timer = StageTimer()
+    for _ in range(args.rounds):
+        for date in dates:
+            menu_dt = date.strftime("%Y%m%d")
+            with timer.stage("total"):
+                with timer.stage("fetch"):
+                    menu_data = api.fetch_meal_data(menu_dt)
+                    selected = select_meals(menu_data["data"]["mealList"])
+                    if async_api:
+                        ratings = async_api.get_ratings(meal for _, meal in selected)
+                    else:
+                        ratings = [api.get_menu_rating(*rating_args(meal)) for _, meal in selected]
+
+                with timer.stage("parse"):
+                    day_menu = build_day_menu(menu_dt, selected, ratings)
+
+                with timer.stage("storage_load"):
+                    storage.load_votes()
+                    comments = storage.load_comments()
+
+                with timer.stage("html"):
+                    day_menu_html(day_menu, comments)
+
+            if meal_types:
+                others = [mt for mt in meal_types if mt != LUNCH]
+                page_client.cache.invalidate()
+                with timer.stage("page_lunch"):
+                    page_client.get_menu(date, LUNCH)
+                page_client.cache.invalidate()
+                with timer.stage("page_eager"):
+                    page_client.get_day_menus(date, meal_types)
+                page_client.cache.invalidate()
+                with timer.stage("page_prefetch"):
+                    page_client.get_menu(date, LUNCH)
+                    futures = page_client.prefetch(date, others)
+                # 다음 측정에 겹치지 않도록 백그라운드 조회가 끝날 때까지 대기 (측정 밖)
+                for future in futures:
+                    future.result()
+
+    server.shutdown()
+    summary = timer.summary()
+    print_table(summary)
+
+    if not args.no_save:
+        params = {k: v for k, v in vars(args).items() if k != "no_save"}
+        save_results("menu_pipeline", summary, params)
+
+
+if __name__ == "__main__":
+    main()
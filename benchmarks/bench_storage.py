@@ -0,0 +1,129 @@
+"""저장소 벤치마크 (votes / comments / board)
+
+기간별 합성 데이터를 만들고 저장소 백엔드마다 load/save 지연, 로드 시 최대 메모리, 파일 크기를 측정합니다.
+백엔드는 storage 의 저장 코덱별로 하나씩이며 (codec.CODECS, 기본 json-pretty),
+각 백엔드는 합성 데이터를 자기 코덱으로 다시 저장한 복사본에서 측정합니다.
+
+    python -m benchmarks.bench_storage --years 1 5 --repeat 5
+"""
+import argparse
+import gc
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks import datagen
+from benchmarks.common import summarize, save_results
+
+DATASETS = {
+    "votes": ("votes.json", "load_votes", "save_votes"),
+    "comments": ("comments.json", "load_comments", "save_comments"),
+    "board": ("board.json", "load_board_posts", "save_board_posts"),
+}
+
+
+class CodecBackend:
+    """storage 의 load_*/save_* 를 지정한 저장 코덱으로 실행"""
+
+    def __init__(self, codec_name):
+        self.codec_name = codec_name
+
+    def __getattr__(self, name):
+        import storage
+
+        func = getattr(storage, name)
+
+        def call(*args):
+            previous = storage.set_codec(self.codec_name)
+            try:
+                return func(*args)
+            finally:
+                storage.set_codec(previous)
+        return call
+
+
+def storage_backends():
+    """측정할 백엔드 {이름: storage 모듈과 같은 load_*/save_* 를 가진 객체}"""
+    import codec
+
+    return {name: CodecBackend(name) for name in codec.CODECS}
+
+
+def measure(backend, data_dir, dataset, repeat):
+    file_name, load_name, save_name = DATASETS[dataset]
+    load = getattr(backend, load_name)
+    save = getattr(backend, save_name)
+
+    load_samples, save_samples = [], []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        data = load()
+        load_samples.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        save(data)
+        save_samples.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    data = load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+
+    size = sum(p.stat().st_size for p in Path(data_dir).glob(Path(file_name).stem + "*"))
+    return {
+        "load": summarize(load_samples),
+        "save": summarize(save_samples),
+        "peak_load_mib": peak / 2**20,
+        "file_kib": size / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=float, nargs="+", default=[1, 5])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    # storage 는 import 시점에 BOB_DATA_DIR 을 만들기 때문에 임시 디렉토리로 지정
+    os.environ.setdefault("BOB_DATA_DIR", tempfile.mkdtemp(prefix="bob_data_"))
+    import storage
+
+    summary = {}
+    print(f"{'case':<28}{'load p50':>10}{'load p95':>10}{'save p50':>10}{'save p95':>10}{'peak MiB':>10}{'KiB':>10}")
+    for years in args.years:
+        source_dir = Path(tempfile.mkdtemp(prefix=f"bob_data_{years}y_"))
+        datagen.generate(source_dir, years)
+
+        for backend_name, backend in storage_backends().items():
+            backend_dir = Path(tempfile.mkdtemp(prefix=f"bob_data_{years}y_{backend_name}_"))
+            shutil.copytree(source_dir, backend_dir, dirs_exist_ok=True)
+            storage.DATA_DIR = backend_dir
+            for dataset in DATASETS:
+                # 합성 데이터(JSON)를 이 백엔드 형식으로 다시 저장한 뒤 측정
+                _, load_name, save_name = DATASETS[dataset]
+                getattr(backend, save_name)(getattr(backend, load_name)())
+                result = measure(backend, backend_dir, dataset, args.repeat)
+                case = f"{years:g}y/{backend_name}/{dataset}"
+                summary[case] = result
+                print(f"{case:<28}{result['load']['p50_ms']:>10.2f}{result['load']['p95_ms']:>10.2f}"
+                      f"{result['save']['p50_ms']:>10.2f}{result['save']['p95_ms']:>10.2f}"
+                      f"{result['peak_load_mib']:>10.2f}{result['file_kib']:>10.1f}")
+
+    if not args.no_save:
+        flat = {}
+        for case, result in summary.items():
+            flat[f"{case}/load"] = result["load"]
+            flat[f"{case}/save"] = dict(result["save"], peak_load_mib=result["peak_load_mib"],
+                                        file_kib=result["file_kib"])
+        save_results("storage", flat, {"years": args.years, "repeat": args.repeat})
+
+
+if __name__ == "__main__":
+    main()
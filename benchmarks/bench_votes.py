@@ -0,0 +1,79 @@
+"""투표 상태 벤치마크 (votes.json dict vs 인턴된 메뉴 ID + 배열)
+
+기간별 합성 votes.json 으로 메모리(tracemalloc)와 전체 합계/좋아요율 TOP 5 집계 지연을 비교합니다.
+
+    python -m benchmarks.bench_votes --years 1 5 --repeat 20
+"""
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks import datagen
+from benchmarks.common import summarize, save_results
+
+
+def traced(func):
+    """func() 결과와 그 결과가 차지하는 메모리(바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def timeit(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=float, nargs="+", default=[1, 5])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    os.environ.setdefault("BOB_DATA_DIR", tempfile.mkdtemp(prefix="bob_data_"))
+    from menu_stats import top_menus, vote_totals
+    from vote_counters import VoteCounters
+
+    summary = {}
+    print(f"{'case':<20}{'menus':>8}{'KiB':>10}{'totals p50':>12}{'top5 p50':>12}")
+    for years in args.years:
+        data_dir = Path(tempfile.mkdtemp(prefix=f"bob_votes_{years}y_"))
+        datagen.generate(data_dir, years)
+        with open(data_dir / "votes.json", 'r', encoding='utf-8') as f:
+            raw = f.read()
+
+        votes, dict_bytes = traced(lambda: json.loads(raw))
+        counters, counter_bytes = traced(lambda: VoteCounters.from_votes(votes))
+        assert counters.totals() == vote_totals(votes) and counters.top(5) == top_menus(votes, 5)
+
+        cases = {
+            "dict": (dict_bytes, lambda: vote_totals(votes), lambda: top_menus(votes, 5)),
+            "counters": (counter_bytes, counters.totals, lambda: counters.top(5)),
+        }
+        for name, (size, totals, top) in cases.items():
+            case = f"{years:g}y/{name}"
+            result = {"totals": timeit(totals, args.repeat), "top5": timeit(top, args.repeat)}
+            summary[f"{case}/totals"] = dict(result["totals"], kib=size / 1024, menus=len(votes))
+            summary[f"{case}/top5"] = result["top5"]
+            print(f"{case:<20}{len(votes):>8}{size / 1024:>10.1f}{result['totals']['p50_ms']:>12.3f}"
+                  f"{result['top5']['p50_ms']:>12.3f}")
+
+    if not args.no_save:
+        save_results("votes", summary, {"years": args.years, "repeat": args.repeat})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""벤치마크 공용 도구 (측정/백분위/결과 저장)"""
+import json
+import statistics
+import subprocess
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# 이전 실행 대비 p50 이 이만큼 느려지면 회귀로 표시
+REGRESSION_THRESHOLD = 0.10
+
+
+def percentile(sorted_samples, pct):
+    """선형 보간 백분위 (sorted_samples 는 정렬된 목록)"""
+    if not sorted_samples:
+        return 0.0
+    k = (len(sorted_samples) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_samples) - 1)
+    return sorted_samples[lo] + (sorted_samples[hi] - sorted_samples[lo]) * (k - lo)
+
+
+def summarize(samples):
+    """초 단위 샘플 -> ms 단위 요약"""
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000 if ordered else 0.0,
+        "p50_ms": percentile(ordered, 50) * 1000,
+        "p95_ms": percentile(ordered, 95) * 1000,
+        "p99_ms": percentile(ordered, 99) * 1000,
+        "max_ms": ordered[-1] * 1000 if ordered else 0.0,
+    }
+
+
+class StageTimer:
+    """단계별 소요 시간 수집"""
+
+    def __init__(self):
+        self.samples = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples.setdefault(name, []).append(time.perf_counter() - start)
+
+    def summary(self):
+        return {name: summarize(values) for name, values in self.samples.items()}
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_table(summary, columns=("p50_ms", "p95_ms", "p99_ms", "max_ms")):
+    width = max([len(name) for name in summary] + [8])
+    print(f"{'stage':<{width}}  " + "  ".join(f"{c:>10}" for c in columns))
+    for name, stats in summary.items():
+        print(f"{name:<{width}}  " + "  ".join(f"{stats[c]:>10.3f}" for c in columns))
+
+
+def save_results(bench_name, summary, params):
+    """결과를 benchmarks/results/<bench_name>/ 에 저장하고 직전 결과와 비교"""
+    target_dir = RESULTS_DIR / bench_name
+    target_dir.mkdir(parents=True, exist_ok=True)
+    previous = sorted(target_dir.glob("*.json"))
+
+    revision = git_revision()
+    result = {
+        "bench": bench_name,
+        "revision": revision,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "params": params,
+        "summary": summary,
+    }
+    target = target_dir / f"{datetime.now():%Y%m%d-%H%M%S}_{revision}.json"
+    with open(target, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {target}")
+
+    if previous:
+        with open(previous[-1], 'r', encoding='utf-8') as f:
+            compare(json.load(f), result)
+    return target
+
+
+def compare(before, after, key="p50_ms"):
+    """두 결과의 단계별 key 값 비교 출력"""
+    if before.get("params") != after.get("params"):
+        print("(직전 결과와 실행 조건이 달라 비교하지 않습니다)")
+        return
+    print(f"\n직전 결과 대비 ({before['revision']} -> {after['revision']}, {key}):")
+    for name, stats in after["summary"].items():
+        old = before["summary"].get(name, {}).get(key)
+        if not old or key not in stats:
+            continue
+        change = (stats[key] - old) / old
+        flag = "  <-- 회귀" if change > REGRESSION_THRESHOLD else ""
+        print(f"  {name}: {old:.3f} -> {stats[key]:.3f} ({change:+.1%}){flag}")
@@ -0,0 +1,160 @@
+"""votes.json / comments.json / board.json / menus.jsonl 합성 데이터 생성
+
+실제 사용 패턴(평일 점심, 코너 5~6개, 투표/댓글 수 편차)을 흉내 낸 데이터를 만듭니다.
+
+    python -m benchmarks.datagen --years 1 --out /tmp/bob_data_1y
+"""
+import argparse
+import json
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+CORNERS = ["한식", "양식", "일품", "샐러드", "마이보글"]
+DISHES = ["돼지불고기", "제육볶음", "치킨까스", "비빔밥", "김치찌개", "된장찌개", "카레라이스",
+          "스파게티", "함박스테이크", "닭갈비", "연어덮밥", "우동", "쌀국수", "냉면", "돈까스"]
+AUTHORS = ["익명", "김싸피", "이싸피", "박싸피", "최싸피", "정싸피"]
+PHRASES = ["맛있어요", "양이 적어요", "오늘 최고!", "국이 짜요", "또 나왔으면", "별로였어요",
+           "밥이 맛있네요", "반찬이 아쉬움", "줄이 너무 길어요", "추천합니다"]
+SIDES = ["쌀밥", "잡곡밥", "배추김치", "깍두기", "미역국", "계란국", "단무지", "샐러드", "요구르트", "어묵볶음"]
+# 코너별 평균 칼로리
+CORNER_KCAL = {"한식": 850, "양식": 950, "일품": 900, "샐러드": 450, "마이보글": 650}
+
+
+def workdays(start, days):
+    """start 부터 days 일 중 평일만"""
+    return [start + timedelta(days=i) for i in range(days) if (start + timedelta(days=i)).weekday() < 5]
+
+
+def _timestamp(day, rng):
+    minute = rng.randint(11 * 60 + 20, 14 * 60)
+    return f"{day:%Y-%m-%d} {minute // 60:02d}:{minute % 60:02d}"
+
+
+def _text(rng, words=(1, 3)):
+    return " ".join(rng.choice(PHRASES) for _ in range(rng.randint(*words)))
+
+
+def menu_ids(days):
+    """날짜별 메뉴 ID (welplus 메뉴 ID 형식: YYYYMMDD_코너_메뉴명)"""
+    rng = random.Random(1)
+    for day in days:
+        for corner in CORNERS:
+            yield day, f"{day:%Y%m%d}_{corner}_{rng.choice(DISHES)}"
+
+
+def generate_votes(days, rng, mean_voters=40):
+    votes = {}
+    for _, menu_id in menu_ids(days):
+        total = max(0, int(rng.gauss(mean_voters, mean_voters / 2)))
+        likes = int(total * rng.uniform(0.3, 0.9))
+        votes[menu_id] = {"좋아요": likes, "별로": total - likes}
+    return votes
+
+
+def generate_comments(days, rng, mean_comments=3):
+    comments = {}
+    for day, menu_id in menu_ids(days):
+        count = max(0, int(rng.expovariate(1 / mean_comments)))
+        if count:
+            comments[menu_id] = [
+                {"author": rng.choice(AUTHORS), "text": _text(rng), "timestamp": _timestamp(day, rng)}
+                for _ in range(count)
+            ]
+    return comments
+
+
+def generate_board(days, rng, posts_per_day=4):
+    posts = []
+    for day in days:
+        for _ in range(max(0, int(rng.gauss(posts_per_day, 2)))):
+            posts.append({
+                "title": _text(rng, (1, 2)),
+                "author": rng.choice(AUTHORS),
+                "content": _text(rng, (3, 15)),
+                "timestamp": _timestamp(day, rng),
+                "comments": [
+                    {"author": rng.choice(AUTHORS), "text": _text(rng), "timestamp": _timestamp(day, rng)}
+                    for _ in range(max(0, int(rng.expovariate(1 / 3))))
+                ],
+            })
+    # 게시판은 최신 글이 앞에 오고, id 는 작성 순서
+    for i, post in enumerate(posts):
+        post["id"] = i
+    posts.reverse()
+    return posts
+
+
+def generate_menu_records(days, rng, restaurant_code="REST000595", meal_type="2"):
+    """menu_store 레코드 (DayMenu.to_dict() 형태) - 평일 점심, 코너 5개 + 추가 배식대"""
+    for day in days:
+        menu_dt = f"{day:%Y%m%d}"
+        items = []
+        for corner in CORNERS:
+            name = rng.choice(DISHES)
+            kcal = max(150, int(rng.gauss(CORNER_KCAL[corner], 120)))
+            items.append({
+                "코너": corner, "메뉴명": name, "칼로리": str(kcal),
+                "구성": [name] + rng.sample(SIDES, 4), "이미지": None,
+                "평균평점": round(rng.uniform(2.5, 5.0), 1), "참여자수": rng.randint(0, 60),
+                "menu_id": f"{menu_dt}_{corner}_{name}",
+                "kind": "ramen" if corner == "마이보글" else "regular",
+            })
+        extra = {"코너": "추가 배식대", "메뉴명": "샐러드바", "칼로리": "120", "구성": ["샐러드바"],
+                 "이미지": None, "평균평점": 0.0, "참여자수": 0, "menu_id": f"{menu_dt}_추가_배식대_샐러드바",
+                 "kind": "extra"}
+        yield {"restaurant_code": restaurant_code, "meal_type": meal_type, "menu_dt": menu_dt,
+               "fetched_at": f"{day:%Y-%m-%d}T15:00:00+09:00", "menu": {"점심": items, "추가배식대": extra}}
+
+
+def generate_menu_store(path, years=1.0, start=None, seed=0):
+    """menus.jsonl (menu_store 형식) 생성, 파일 크기 반환"""
+    rng = random.Random(seed)
+    start = start or datetime(2026, 1, 1)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in generate_menu_records(workdays(start, int(365 * years)), rng):
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return path.stat().st_size
+
+
+def generate(out_dir, years=1.0, start=None, seed=0):
+    """out_dir 에 세 파일을 만들고 {파일명: 크기} 반환"""
+    rng = random.Random(seed)
+    start = start or datetime(2026, 1, 1)
+    days = workdays(start, int(365 * years))
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    data = {
+        "votes.json": generate_votes(days, rng),
+        "comments.json": generate_comments(days, rng),
+        "board.json": generate_board(days, rng),
+    }
+    sizes = {}
+    for name, value in data.items():
+        with open(out_dir / name, 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False, indent=2)
+        sizes[name] = (out_dir / name).stat().st_size
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장소 합성 데이터 생성")
+    parser.add_argument("--years", type=float, default=1.0)
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--menus", action="store_true", help="menus.jsonl (지난 메뉴 저장소)도 생성")
+    args = parser.parse_args()
+
+    if args.menus:
+        size = generate_menu_store(Path(args.out) / "menus.jsonl", args.years, seed=args.seed)
+        print(f"menus.jsonl: {size / 1024:.1f} KiB")
+
+    for name, size in generate(args.out, args.years, seed=args.seed).items():
+        print(f"{name}: {size / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
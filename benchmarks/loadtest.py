@@ -0,0 +1,215 @@
+"""동시 접속 부하 테스트
+
+점심 시간에 여러 사람이 한꺼번에 메뉴를 보고 투표/댓글/게시글을 쓰는 상황을
+스레드 세션으로 흉내 냅니다 (Streamlit 세션도 한 프로세스의 스레드).
+스텁 서버(welplus_stub)를 업스트림으로 쓰고, 앱과 같은 공유 캐시/저장소 함수를 호출합니다.
+
+세션 하나의 흐름: 날짜 보기 -> 댓글 열기 -> 투표 -> (가끔) 댓글 작성 -> 게시판 보기 -> (가끔) 글 작성
+
+결과: 처리량, 동작별 p50/p95/p99, 오류 수, votes.json 유실 업데이트 수, 메모리 증가량
+
+    python -m benchmarks.loadtest --sessions 200 --concurrency 50
+    python -m benchmarks.loadtest --legacy-votes   # 락 없는 예전 읽기-수정-쓰기 (유실 재현)
+"""
+import argparse
+import os
+import random
+import resource
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from benchmarks.common import StageTimer, print_table, save_results
+
+VOTE_FIELDS = ("좋아요", "별로")
+
+
+def legacy_add_vote(storage, menu_id, field):
+    """예전 앱 코드의 투표 처리 (락 없이 읽고 쓰기)"""
+    votes = storage.load_votes()
+    current_votes = votes.get(menu_id, {"좋아요": 0, "별로": 0})
+    current_votes[field] += 1
+    votes[menu_id] = current_votes
+    storage.save_votes(votes)
+
+
+class Session:
+    """한 사용자의 페이지 이용 흐름"""
+
+    def __init__(self, index, base_url, cache, dates, args, expected, expected_lock):
+        self.index = index
+        self.base_url = base_url
+        self.cache = cache
+        self.dates = dates
+        self.args = args
+        self.expected = expected
+        self.expected_lock = expected_lock
+        self.rng = random.Random(args.seed + index)
+
+    def run(self, timer, errors):
+        import storage
+        from menu_cache import CachedMenuClient
+        from welplus_api import WelplusAPI
+
+        api = WelplusAPI(base_url=self.base_url, pool_size=2)
+        client = CachedMenuClient(api, self.cache)
+        try:
+            self._step(timer, errors, "login", lambda: api.login(f"user{self.index}", "pw"))
+
+            date = self.rng.choice(self.dates)
+            day_menu = self._step(timer, errors, "browse_date", lambda: (
+                client.get_menu(date), storage.load_votes())[0])
+            if not day_menu:
+                return
+
+            self._step(timer, errors, "open_comments", storage.load_comments)
+            self._think()
+
+            item = self.rng.choice(day_menu.items)
+            field = self.rng.choice(VOTE_FIELDS)
+            if self.args.legacy_votes:
+                vote = lambda: legacy_add_vote(storage, item.menu_id, field)
+            else:
+                vote = lambda: storage.add_vote(item.menu_id, field)
+            if self._step(timer, errors, "vote", vote, ok=True):
+                with self.expected_lock:
+                    self.expected[(item.menu_id, field)] += 1
+
+            if self.rng.random() < self.args.comment_rate:
+                self._step(timer, errors, "post_comment", lambda: storage.add_menu_comment(item.menu_id, {
+                    "author": f"user{self.index}", "text": "부하 테스트 댓글",
+                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
+                }))
+            self._think()
+
+            self._step(timer, errors, "browse_board", storage.load_board_posts)
+            if self.rng.random() < self.args.post_rate:
+                self._step(timer, errors, "post_board", lambda: storage.add_board_post({
+                    "title": f"부하 테스트 {self.index}", "author": f"user{self.index}",
+                    "content": "본문", "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M"),
+                }))
+        finally:
+            api.session.close()
+
+    def _step(self, timer, errors, name, func, ok=False):
+        try:
+            with timer.stage(name):
+                result = func()
+        except Exception:
+            with self.expected_lock:
+                errors[name] += 1
+            return None if not ok else False
+        return True if ok else result
+
+    def _think(self):
+        if self.args.think:
+            time.sleep(self.rng.uniform(0, self.args.think))
+
+
+def count_lost_updates(storage, expected):
+    """의도한 투표 수와 votes.json 최종 값의 차이"""
+    votes = storage.load_votes()
+    lost = 0
+    for (menu_id, field), count in expected.items():
+        lost += count - votes.get(menu_id, {}).get(field, 0)
+    return lost
+
+
+def _rss_mib():
+    # 리눅스에서 ru_maxrss 는 KiB 단위
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=200, help="전체 세션 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시에 실행할 세션 수")
+    parser.add_argument("--start", default="20260202", help="YYYYMMDD")
+    parser.add_argument("--days", type=int, default=5, help="세션이 고를 날짜 수")
+    parser.add_argument("--latency", type=float, default=0.03, help="스텁 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="스텁 503 비율")
+    parser.add_argument("--think", type=float, default=0.05, help="동작 사이 최대 대기 (초)")
+    parser.add_argument("--comment-rate", type=float, default=0.3)
+    parser.add_argument("--post-rate", type=float, default=0.1)
+    parser.add_argument("--legacy-votes", action="store_true", help="락 없는 예전 투표 처리로 실행")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="bob_load_")
+    # storage 는 import 시점에 BOB_DATA_DIR 을 읽음
+    os.environ["BOB_DATA_DIR"] = os.path.join(work_dir, "data")
+
+    import storage
+    import welplus_stub
+    from menu_cache import SWRCache
+
+    start = datetime.strptime(args.start, "%Y%m%d")
+    dates = [start + timedelta(days=i) for i in range(args.days)]
+    fixture_dir = os.path.join(work_dir, "fixtures")
+    welplus_stub.synthesize(dates, fixture_dir)
+
+    config = welplus_stub.StubConfig(fixture_dir, args.latency, args.jitter, args.error_rate, seed=args.seed)
+    server = welplus_stub.start_stub_server(config)
+    # 앱의 get_menu_cache() 처럼 모든 세션이 캐시 하나를 공유
+    cache = SWRCache()
+
+    timer = StageTimer()
+    errors = Counter()
+    expected = Counter()
+    expected_lock = threading.Lock()
+
+    tracemalloc.start()
+    rss_before = _rss_mib()
+    mem_before, _ = tracemalloc.get_traced_memory()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        sessions = [Session(i, server.base_url, cache, dates, args, expected, expected_lock)
+                    for i in range(args.sessions)]
+        for future in [pool.submit(s.run, timer, errors) for s in sessions]:
+            future.result()
+    elapsed = time.perf_counter() - started
+
+    mem_after, mem_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    server.shutdown()
+
+    summary = timer.summary()
+    print_table(summary)
+
+    actions = sum(s["count"] for s in summary.values())
+    lost = count_lost_updates(storage, expected)
+    report = {
+        "elapsed_s": elapsed,
+        "sessions_per_s": args.sessions / elapsed,
+        "actions_per_s": actions / elapsed,
+        "errors": dict(errors),
+        "upstream_requests": config.request_count,
+        "votes_intended": sum(expected.values()),
+        "votes_lost": lost,
+        "mem_growth_mib": (mem_after - mem_before) / 2**20,
+        "mem_peak_mib": mem_peak / 2**20,
+        "rss_max_growth_mib": _rss_mib() - rss_before,
+    }
+    print()
+    print(f"처리량: 세션 {report['sessions_per_s']:.1f}/s, 동작 {report['actions_per_s']:.1f}/s "
+          f"({elapsed:.2f}s, 업스트림 요청 {config.request_count}건)")
+    print(f"오류: {dict(errors) or '없음'}")
+    print(f"투표: 의도 {report['votes_intended']}건, 유실 {lost}건")
+    print(f"메모리: tracemalloc 증가 {report['mem_growth_mib']:.2f} MiB (최대 {report['mem_peak_mib']:.2f} MiB), "
+          f"최대 RSS 증가 {report['rss_max_growth_mib']:.1f} MiB")
+
+    if not args.no_save:
+        params = {k: v for k, v in vars(args).items() if k != "no_save"}
+        name = "loadtest_legacy" if args.legacy_votes else "loadtest"
+        save_results(name, dict(summary, report=report), params)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""저장소/캐시 직렬화 코덱
+
+data/ 파일과 JSON API 응답, 지난 메뉴 저장소 줄을 어떤 형식으로 쓸지 고릅니다.
+
+- json-pretty: 들여쓰기 JSON (기존 형식, 사람이 읽기 쉬움 - 디버깅용)
+- json: 공백 없는 JSON
+- orjson: orjson 라이브러리 (설치되어 있을 때만, 공백 없는 JSON 과 같은 내용을 더 빨리 씀)
+- msgpack: MessagePack 바이너리 (msgpack 이 설치되어 있을 때만)
+- pickle: 파이썬 pickle 바이너리 (표준 라이브러리, 항상 사용 가능)
+
+바이너리 형식은 앞에 MAGIC + 코덱 표시 1바이트를 붙여 쓰고, 읽을 때는 내용을 보고 형식을 고르므로
+코덱을 바꿔도 기존 파일은 그대로 읽히고 다음 저장부터 새 형식으로 바뀝니다.
+decode() 는 JSON 을 orjson 이 있으면 orjson 으로 읽습니다 (들여쓰기 JSON 도 읽을 수 있음).
+단 pickle 은 읽기만 해도 코드가 실행될 수 있으므로 allow 로 명시한 경우(storage 는 저장 코덱이
+pickle 일 때)만 읽고, 그 밖에는 ValueError 를 냅니다.
+"""
+import json
+import pickle
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # 선택 의존성
+    msgpack = None
+
+MAGIC = b"BOB\x00"
+DEFAULT_CODEC = "json-pretty"
+
+
+def json_loads(data):
+    """JSON (str/bytes) 읽기 - orjson 이 있으면 orjson"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """공백 없는 JSON 문자열 (한 줄) - orjson 이 있으면 orjson"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def json_bytes(obj):
+    """공백 없는 JSON UTF-8 바이트 (HTTP 응답 본문 등)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class JSONCodec:
+    """표준 라이브러리 json"""
+    binary = False
+
+    def __init__(self, name, indent=None):
+        self.name = name
+        self.indent = indent
+        self.separators = None if indent else (",", ":")
+
+    def encode(self, obj):
+        return json.dumps(obj, ensure_ascii=False, indent=self.indent, separators=self.separators).encode("utf-8")
+
+    def decode(self, data):
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    binary = False
+    name = "orjson"
+
+    def encode(self, obj):
+        return orjson.dumps(obj)
+
+    def decode(self, data):
+        return orjson.loads(data)
+
+
+class BinaryCodec:
+    """MAGIC + 코덱 표시(tag) + 본문 (safe=False 면 decode() 에서 allow 로 명시해야 읽음)"""
+    binary = True
+
+    def __init__(self, name, tag, dumps, loads, safe=True):
+        self.name = name
+        self.tag = tag
+        self.safe = safe
+        self._dumps = dumps
+        self._loads = loads
+
+    def encode(self, obj):
+        return MAGIC + self.tag + self._dumps(obj)
+
+    def decode(self, data):
+        return self._loads(memoryview(data)[len(MAGIC) + 1:])
+
+
+def _build_codecs():
+    codecs = {
+        "json-pretty": JSONCodec("json-pretty", indent=2),
+        "json": JSONCodec("json"),
+    }
+    if orjson is not None:
+        codecs["orjson"] = OrjsonCodec()
+    if msgpack is not None:
+        codecs["msgpack"] = BinaryCodec("msgpack", b"M", msgpack.packb,
+                                        lambda data: msgpack.unpackb(data, strict_map_key=False))
+    codecs["pickle"] = BinaryCodec("pickle", b"P", lambda obj: pickle.dumps(obj, protocol=5),
+                                   lambda data: pickle.loads(data), safe=False)
+    return codecs
+
+
+CODECS = _build_codecs()
+_BY_TAG = {codec.tag: codec for codec in CODECS.values() if codec.binary}
+
+
+def get_codec(name):
+    """이름으로 코덱 찾기 (설치되지 않은 코덱이면 ValueError)"""
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"사용할 수 없는 코덱: {name} (가능: {', '.join(CODECS)})") from None
+
+
+def decode(data, allow=()):
+    """내용을 보고 형식을 골라 읽기 (바이너리 코덱 표시가 없으면 JSON)
+
+    allow: 안전하지 않은 코덱(pickle) 중 읽어도 되는 코덱 이름 - 직접 쓴 파일이라고 믿을 수 있을 때만
+    """
+    if data[:len(MAGIC)] == MAGIC:
+        tag = bytes(data[len(MAGIC):len(MAGIC) + 1])
+        codec = _BY_TAG.get(tag)
+        if codec is None:
+            raise ValueError(f"이 환경에서 읽을 수 없는 형식입니다 (코덱 표시 {tag!r})")
+        if not codec.safe and codec.name not in allow:
+            raise ValueError(f"{codec.name} 형식은 명시적으로 허용한 경우에만 읽습니다 "
+                             f"(저장 코덱을 {codec.name} 로 설정해 읽은 뒤 다른 코덱으로 다시 저장)")
+        return codec.decode(data)
+    return json_loads(data)
@@ -0,0 +1,301 @@
+"""오래된 투표/댓글 보관 (data/cold/)
+
+votes.json / comments.json 은 투표/댓글마다 통째로 읽고 쓰므로, 거의 보지 않는 지난 메뉴의
+항목까지 매번 파싱하게 됩니다. 메뉴 날짜(메뉴 ID 의 YYYYMMDD)가 hot_days 일보다 오래된 항목을
+월별 압축 세그먼트(data/cold/votes-YYYYMM.json.gz, comments-YYYYMM.json.gz)로 옮기고,
+지난 날짜 메뉴 화면/통계처럼 필요할 때만 해당 달의 세그먼트를 읽습니다.
+
+- 세그먼트는 읽기 전용으로 취급하고, 옮길 항목이 생기면 새 파일을 써서 교체합니다
+- 보관 후 지난 메뉴에 투표/댓글이 달리면 hot 파일에 새로 쌓이고, 화면에서는 세그먼트 값과 합쳐 보여주며
+  다음 보관 때 세그먼트에 합쳐집니다
+- 옮길 항목을 먼저 data/cold/pending.json 에 기록한 뒤 hot 파일 -> 세그먼트 순서로 고치므로,
+  도중에 중단되어도 다음 실행(recover)에서 같은 작업을 이어서 마칩니다 (hot 파일은 기록한 값만큼 빼고
+  고친 파일을 기록, 세그먼트는 반영한 작업 번호를 남겨 두 번 더하지 않음 - 복구 전에 쌓인 투표/댓글도 유지)
+
+    python -m cold_archive --hot-days 56
+    python -m cold_archive --info
+"""
+import argparse
+import gzip
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import codec
+import storage
+from metrics import timed
+from welplus_api import KST
+
+ARCHIVE_DIR = "cold"
+PENDING_FILE = "pending.json"
+KINDS = {"votes": "votes.json", "comments": "comments.json"}  # 종류 -> hot 파일 (storage.load_<종류>)
+# 최근 이 일수의 메뉴는 hot 파일에 유지
+DEFAULT_HOT_DAYS = 56
+# 메모리에 풀어 둘 세그먼트 수
+SEGMENT_CACHE_SIZE = 12
+
+logger = logging.getLogger(__name__)
+
+
+def menu_dt(menu_id):
+    """메뉴 ID 의 YYYYMMDD (날짜로 시작하지 않으면 None)"""
+    if len(menu_id) > 9 and menu_id[8] == "_" and menu_id[:8].isdigit():
+        return menu_id[:8]
+    return None
+
+
+def merge_votes(base, extra):
+    """투표 dict 두 개를 더한 새 dict (같은 메뉴는 좋아요/별로 합)"""
+    merged = {menu_id: dict(vote) for menu_id, vote in base.items()}
+    for menu_id, vote in extra.items():
+        current = merged.setdefault(menu_id, {"좋아요": 0, "별로": 0})
+        for field, count in vote.items():
+            current[field] = current.get(field, 0) + count
+    return merged
+
+
+def merge_comments(base, extra):
+    """댓글 dict 두 개를 합친 새 dict (같은 메뉴는 base 댓글 다음에 extra 댓글)"""
+    merged = {menu_id: list(comments) for menu_id, comments in base.items()}
+    for menu_id, comments in extra.items():
+        merged.setdefault(menu_id, []).extend(comments)
+    return merged
+
+
+MERGE = {"votes": merge_votes, "comments": merge_comments}
+
+
+def subtract_vote(current, archived):
+    """hot 투표에서 보관한 만큼 뺀 값 (남는 투표가 없으면 None)"""
+    rest = {field: count - archived.get(field, 0) for field, count in current.items()}
+    return rest if any(rest.values()) else None
+
+
+def subtract_comments(current, archived):
+    """hot 댓글에서 보관한 댓글을 뺀 목록 (남는 댓글이 없으면 None) - 댓글은 뒤에만 추가됨"""
+    if current[:len(archived)] == archived:
+        rest = current[len(archived):]
+    else:
+        rest = [c for c in current if c not in archived]
+    return rest or None
+
+
+SUBTRACT = {"votes": subtract_vote, "comments": subtract_comments}
+
+
+def _write_atomic(path, data):
+    tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class ColdArchive:
+    def __init__(self, root=None, cache_size=SEGMENT_CACHE_SIZE):
+        self.root = Path(root) if root else storage.DATA_DIR / ARCHIVE_DIR
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        # all_votes() 결과 - (세그먼트 파일, mtime) 목록이 같으면 다시 풀지 않음
+        self._all_votes = (None, {})
+
+    def segment_path(self, kind, month):
+        return self.root / f"{kind}-{month}.json.gz"
+
+    def months(self, kind):
+        """세그먼트가 있는 달(YYYYMM) 목록"""
+        if not self.root.exists():
+            return []
+        return sorted(p.name[len(kind) + 1:len(kind) + 7] for p in self.root.glob(f"{kind}-*.json.gz"))
+
+    def _read_segment(self, path):
+        try:
+            with open(path, 'rb') as f:
+                return codec.json_loads(gzip.decompress(f.read()))
+        except FileNotFoundError:
+            return {"batches": [], "entries": {}}
+
+    def segment(self, kind, month):
+        """그 달 세그먼트의 {메뉴 ID: 값} (없으면 빈 dict) - 파일이 바뀔 때만 다시 읽음"""
+        path = self.segment_path(kind, month)
+        try:
+            version = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        key = (kind, month)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == version:
+                self._cache.move_to_end(key)
+                return cached[1]
+        entries = self._read_segment(path)["entries"]
+        with self._lock:
+            self._cache[key] = (version, entries)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return entries
+
+    def _for_menu(self, kind, menu_id):
+        dt = menu_dt(menu_id)
+        return None if dt is None else self.segment(kind, dt[:6]).get(menu_id)
+
+    def vote(self, menu_id):
+        """보관된 메뉴 투표 수 (없으면 None)"""
+        return self._for_menu("votes", menu_id)
+
+    def comments(self, menu_id):
+        """보관된 메뉴 댓글 목록 (없으면 빈 목록)"""
+        return self._for_menu("comments", menu_id) or []
+
+    def _on_date(self, kind, date):
+        prefix = date + "_"
+        return {k: v for k, v in self.segment(kind, date[:6]).items() if k.startswith(prefix)}
+
+    def votes_on(self, date):
+        """YYYYMMDD 날짜 메뉴의 보관된 투표"""
+        return self._on_date("votes", date)
+
+    def comments_on(self, date):
+        """YYYYMMDD 날짜 메뉴의 보관된 댓글"""
+        return self._on_date("comments", date)
+
+    def all_votes(self):
+        """보관된 투표 전체 (날짜순) - 전체 기간 통계용, 반환값은 고치지 말 것
+
+        세그먼트 목록/수정 시각이 그대로면 합쳐 둔 결과를 그대로 반환하고,
+        달마다 읽는 LRU(segment)는 거치지 않아 지난 날짜 화면용 캐시를 밀어내지 않음
+        """
+        paths = sorted(self.root.glob("votes-*.json.gz")) if self.root.exists() else []
+        key = tuple((p.name, p.stat().st_mtime_ns) for p in paths)
+        with self._lock:
+            cached_key, votes = self._all_votes
+        if cached_key == key:
+            return votes
+        votes = {}
+        for path in paths:
+            votes.update(self._read_segment(path)["entries"])
+        with self._lock:
+            self._all_votes = (key, votes)
+        return votes
+
+    def merged_votes(self, hot):
+        """보관된 투표 + hot 투표 (votes.json 만 읽던 전체 기간 집계를 대신)
+
+        보관된 값은 복사하지 않고 공유하므로 반환값의 투표 dict 는 고치지 말 것
+        """
+        merged = dict(self.all_votes())
+        for menu_id, vote in hot.items():
+            archived = merged.get(menu_id)
+            merged[menu_id] = vote if archived is None else merge_votes({menu_id: archived}, {menu_id: vote})[menu_id]
+        return merged
+
+    def nbytes(self):
+        """세그먼트 파일 크기 합"""
+        return sum(p.stat().st_size for p in self.root.glob("*.json.gz")) if self.root.exists() else 0
+
+    # 보관 작업
+
+    def _pending_path(self):
+        return self.root / PENDING_FILE
+
+    def _write_pending(self, job):
+        _write_atomic(self._pending_path(), codec.json_bytes(job))
+
+    @timed("cold_archive.archive")
+    def archive(self, hot_days=DEFAULT_HOT_DAYS, today=None):
+        """메뉴 날짜가 hot_days 일보다 오래된 투표/댓글을 세그먼트로 옮김 -> {종류: 옮긴 메뉴 수}"""
+        today = today or datetime.now(KST).date()
+        cutoff = f"{today - timedelta(days=hot_days):%Y%m%d}"
+        with storage.write_locked():
+            self.recover()
+            job = {"batch": str(time.time_ns()), "cutoff": cutoff, "hot_done": []}
+            hot = {"votes": storage.load_votes(), "comments": storage.load_comments()}
+            for kind, data in hot.items():
+                job[kind] = {k: v for k, v in data.items() if (menu_dt(k) or cutoff) < cutoff}
+            moved = {kind: len(job[kind]) for kind in KINDS}
+            if not any(moved.values()):
+                return moved
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._write_pending(job)
+            self._apply(job)
+            logger.info("보관 완료 (%s 이전): %s", cutoff, moved)
+            return moved
+
+    def recover(self):
+        """중단된 보관 작업이 있으면 이어서 마침"""
+        with storage.write_locked():
+            try:
+                with open(self._pending_path(), 'rb') as f:
+                    job = codec.json_loads(f.read())
+            except FileNotFoundError:
+                return False
+            logger.warning("중단된 보관 작업 %s 이어서 진행", job["batch"])
+            self._apply(job)
+            return True
+
+    def _apply(self, job):
+        # 1. hot 파일에서 기록한 만큼 빼기 - 종류마다 끝나면 기록해 두므로, 아직 고치지 않은 hot 파일에는
+        #    기록한 값이 그대로 있음 (중단 후 복구 전에 새로 쌓인 투표/댓글만 남음)
+        done = job.setdefault("hot_done", list(KINDS) if job.pop("hot_saved", False) else [])
+        for kind in KINDS:
+            if kind in done:
+                continue
+            data = getattr(storage, f"load_{kind}")()
+            hits = [k for k in job[kind] if k in data]
+            for k in hits:
+                rest = SUBTRACT[kind](data[k], job[kind][k])
+                if rest is None:
+                    del data[k]
+                else:
+                    data[k] = rest
+            if hits:
+                getattr(storage, f"save_{kind}")(data)
+            done.append(kind)
+            self._write_pending(job)
+
+        # 2. 월별 세그먼트에 합침 (이미 이 작업을 반영한 세그먼트는 건너뜀)
+        for kind in KINDS:
+            by_month = {}
+            for k, v in job[kind].items():
+                by_month.setdefault(menu_dt(k)[:6], {})[k] = v
+            for month, entries in by_month.items():
+                path = self.segment_path(kind, month)
+                segment = self._read_segment(path)
+                if job["batch"] in segment["batches"]:
+                    continue
+                segment["entries"] = dict(sorted(MERGE[kind](segment["entries"], entries).items()))
+                segment["batches"].append(job["batch"])
+                _write_atomic(path, gzip.compress(codec.json_bytes(segment)))
+
+        # 3. 작업 기록 삭제
+        self._pending_path().unlink()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hot-days", type=int, default=DEFAULT_HOT_DAYS,
+                        help=f"최근 이 일수의 메뉴는 hot 파일에 유지 (기본 {DEFAULT_HOT_DAYS})")
+    parser.add_argument("--info", action="store_true", help="보관 현황만 출력")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    archive = ColdArchive()
+    if not args.info:
+        moved = archive.archive(args.hot_days)
+        print(f"옮긴 메뉴: 투표 {moved['votes']}개, 댓글 {moved['comments']}개")
+    for kind, file_name in KINDS.items():
+        months = archive.months(kind)
+        hot = storage.DATA_DIR / file_name
+        hot_size = hot.stat().st_size if hot.exists() else 0
+        print(f"{kind}: hot {hot_size / 1024:.1f} KiB, 세그먼트 {len(months)}개"
+              + (f" ({months[0]} ~ {months[-1]})" if months else ""))
+    print(f"세그먼트 합계 {archive.nbytes() / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""지난 메뉴 컬럼형 아카이브 (data/archive/)
+
+지난 메뉴 저장소(menu_store)를 분석용으로 필드마다 배열 하나씩 저장합니다.
+몇 년치(수만 행)를 DayMenu/dict 로 올리지 않고 np.load(mmap_mode="r") 로 매핑해
+NumPy 벡터 연산으로 바로 훑을 수 있습니다.
+
+- 행 하나 = 메뉴 항목 하나 (일반/라면/추가 배식대), 날짜순 정렬이라 기간은 searchsorted 로 자름
+- 식당/코너/메뉴명/구성 항목은 사전 인코딩 (dicts.json 의 목록 위치를 정수 코드로 저장)
+- 칼로리/평점은 숫자 배열 (칼로리 없음은 NaN)
+- 구성(밥, 국 ...)은 가변 길이라 comp_offsets/comp_codes 두 배열 (행 i = codes[offsets[i]:offsets[i+1]])
+
+    data/archive/
+      CURRENT               현재 빌드 디렉토리 이름
+      <build>/meta.json     행 수, 원본 저장소 버전, 컬럼 dtype
+      <build>/dicts.json    사전 (restaurant, corner, name, component)
+      <build>/<column>.npy  컬럼 배열
+
+다시 빌드하면 새 디렉토리에 쓰고 CURRENT 를 바꾼 뒤 이전 빌드를 지웁니다.
+이미 매핑해 둔 이전 파일은 지워도 열어 둔 쪽에서 계속 읽을 수 있습니다.
+
+    python -m menu_archive build
+    python -m menu_archive info
+"""
+import argparse
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+import storage
+from menu_model import MEAL_EXTRA, MEAL_RAMEN, MEAL_REGULAR
+from metrics import timed
+
+ARCHIVE_DIR = "archive"
+CURRENT_FILE = "CURRENT"
+# 컬럼 구성을 바꾸면 올려서 다시 빌드
+ARCHIVE_VERSION = 1
+
+# kind 컬럼 코드
+KINDS = (MEAL_REGULAR, MEAL_RAMEN, MEAL_EXTRA)
+
+COLUMNS = {
+    "date": "datetime64[D]",
+    "restaurant": np.uint16,
+    "meal_type": np.uint8,
+    "kind": np.uint8,
+    "corner": np.uint32,
+    "name": np.uint32,
+    "kcal": np.float32,
+    "rating_avg": np.float32,
+    "rating_count": np.uint32,
+    "comp_offsets": np.int64,
+    "comp_codes": np.uint32,
+}
+DICTS = ("restaurant", "corner", "name", "component")
+
+# 같은 프로세스의 세션들이 동시에 다시 빌드하지 않도록
+_build_lock = threading.Lock()
+
+
+def archive_root():
+    return storage.DATA_DIR / ARCHIVE_DIR
+
+
+def to_datetime64(value):
+    """YYYYMMDD 문자열 / date / datetime -> numpy datetime64[D]"""
+    if isinstance(value, str):
+        value = datetime.strptime(value, "%Y%m%d")
+    if isinstance(value, datetime):
+        value = value.date()
+    return np.datetime64(value, "D")
+
+
+class _Encoder:
+    """문자열 -> 처음 나온 순서의 정수 코드"""
+
+    def __init__(self):
+        self.codes = {}
+
+    def __call__(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.codes)
+        return code
+
+    def values(self):
+        return list(self.codes)
+
+
+@timed("menu_archive.build")
+def build_archive(store, root=None):
+    """store(MenuStore) 전체를 컬럼형으로 다시 써서 빌드 디렉토리 경로 반환"""
+    root = root or archive_root()
+    encoders = {name: _Encoder() for name in DICTS}
+    columns = {name: [] for name in COLUMNS}
+    comp_offsets = columns["comp_offsets"]
+    comp_codes = columns["comp_codes"]
+    comp_offsets.append(0)
+    source_version = store.version()
+
+    kind_codes = {kind: code for code, kind in enumerate(KINDS)}
+    for (restaurant_code, meal_type, menu_dt), day_menu in store.items():
+        day = f"{menu_dt[:4]}-{menu_dt[4:6]}-{menu_dt[6:]}"
+        restaurant = encoders["restaurant"](restaurant_code)
+        items = day_menu.items + ((day_menu.extra,) if day_menu.extra else ())
+        for item in items:
+            columns["date"].append(day)
+            columns["restaurant"].append(restaurant)
+            columns["meal_type"].append(int(meal_type))
+            columns["kind"].append(kind_codes.get(item.kind, 0))
+            columns["corner"].append(encoders["corner"](item.corner))
+            columns["name"].append(encoders["name"](item.name))
+            columns["kcal"].append(np.nan if item.kcal is None else item.kcal)
+            columns["rating_avg"].append(item.rating_avg)
+            columns["rating_count"].append(item.rating_count)
+            comp_codes.extend(encoders["component"](c) for c in item.components)
+            comp_offsets.append(len(comp_codes))
+
+    build_id = f"{time.strftime('%Y%m%d%H%M%S')}-{time.time_ns() % 10**9:09d}"
+    build_dir = root / build_id
+    build_dir.mkdir(parents=True)
+    for name, dtype in COLUMNS.items():
+        np.save(build_dir / f"{name}.npy", np.asarray(columns[name], dtype=dtype))
+    with open(build_dir / "dicts.json", 'w', encoding='utf-8') as f:
+        json.dump({name: encoders[name].values() for name in DICTS}, f, ensure_ascii=False)
+    meta = {
+        "version": ARCHIVE_VERSION,
+        "rows": len(columns["date"]),
+        "source_version": list(source_version) if source_version else None,
+        "built_at": datetime.now().isoformat(timespec="seconds"),
+        "columns": {name: np.dtype(dtype).str for name, dtype in COLUMNS.items()},
+    }
+    with open(build_dir / "meta.json", 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+
+    # CURRENT 를 원자적으로 바꾼 뒤 이전 빌드 정리
+    tmp_path = root / f".{CURRENT_FILE}.tmp"
+    tmp_path.write_text(build_id, encoding="utf-8")
+    os.replace(tmp_path, root / CURRENT_FILE)
+    for old in root.iterdir():
+        if old.is_dir() and old.name != build_id:
+            shutil.rmtree(old, ignore_errors=True)
+    return build_dir
+
+
+class MenuArchive:
+    """읽기 전용 아카이브 (컬럼은 mmap 된 NumPy 배열)
+
+        archive = MenuArchive.open()
+        rows = archive.select("20250101", "20251231", kinds=(MEAL_REGULAR,))
+        archive["kcal"][rows]
+    """
+
+    def __init__(self, build_dir):
+        self.path = build_dir
+        with open(build_dir / "meta.json", 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        with open(build_dir / "dicts.json", 'r', encoding='utf-8') as f:
+            self.dicts = json.load(f)
+        self.columns = {name: np.load(build_dir / f"{name}.npy", mmap_mode="r") for name in COLUMNS}
+        self._code_maps = {}
+
+    @classmethod
+    def open(cls, root=None):
+        """현재 빌드를 열기 (없으면 None)"""
+        root = root or archive_root()
+        try:
+            build_id = (root / CURRENT_FILE).read_text(encoding="utf-8").strip()
+            archive = cls(root / build_id)
+        except FileNotFoundError:
+            return None
+        if archive.meta.get("version") != ARCHIVE_VERSION:
+            return None
+        return archive
+
+    @classmethod
+    def open_for(cls, store, root=None):
+        """store 가 바뀌었으면 다시 빌드해서 열기 (다른 프로세스가 추가한 줄도 반영)"""
+        store.refresh()
+        archive = cls.open(root)
+        if archive is not None and not archive.is_stale(store):
+            return archive
+        with _build_lock:
+            archive = cls.open(root)
+            if archive is None or archive.is_stale(store):
+                build_archive(store, root)
+                archive = cls.open(root)
+        return archive
+
+    def is_stale(self, store):
+        version = store.version()
+        return self.meta.get("source_version") != (list(version) if version else None)
+
+    def __len__(self):
+        return self.meta["rows"]
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def code(self, dict_name, value):
+        """사전 값 -> 코드 (없으면 None)"""
+        codes = self._code_maps.get(dict_name)
+        if codes is None:
+            codes = self._code_maps[dict_name] = {v: i for i, v in enumerate(self.dicts[dict_name])}
+        return codes.get(value)
+
+    def decode(self, dict_name, codes):
+        """코드 배열 -> 문자열 배열"""
+        return np.asarray(self.dicts[dict_name], dtype=object)[np.asarray(codes, dtype=np.intp)]
+
+    def date_range(self, start=None, end=None):
+        """start ~ end (포함) 행 구간 slice - date 컬럼이 정렬되어 있어 O(log n)"""
+        dates = self.columns["date"]
+        lo = 0 if start is None else int(np.searchsorted(dates, to_datetime64(start), side="left"))
+        hi = len(dates) if end is None else int(np.searchsorted(dates, to_datetime64(end), side="right"))
+        return slice(lo, hi)
+
+    def select(self, start=None, end=None, restaurant_code=None, meal_type=None, kinds=None):
+        """조건에 맞는 행 번호 배열"""
+        window = self.date_range(start, end)
+        mask = np.ones(window.stop - window.start, dtype=bool)
+        if restaurant_code is not None:
+            code = self.code("restaurant", restaurant_code)
+            if code is None:
+                return np.empty(0, dtype=np.intp)
+            mask &= self.columns["restaurant"][window] == code
+        if meal_type is not None:
+            mask &= self.columns["meal_type"][window] == int(meal_type)
+        if kinds is not None:
+            mask &= np.isin(self.columns["kind"][window], [KINDS.index(k) for k in kinds])
+        return np.flatnonzero(mask) + window.start
+
+    def components(self, row):
+        offsets = self.columns["comp_offsets"]
+        codes = self.columns["comp_codes"][offsets[row]:offsets[row + 1]]
+        return tuple(self.decode("component", codes))
+
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns.values())
+
+
+def main():
+    from menu_store import MenuStore
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["build", "info"])
+    args = parser.parse_args()
+
+    if args.command == "build":
+        store = MenuStore()
+        started = time.perf_counter()
+        build_dir = build_archive(store)
+        print(f"{build_dir} ({len(store)}일치, {(time.perf_counter() - started) * 1000:.0f}ms)")
+
+    archive = MenuArchive.open()
+    if archive is None:
+        parser.exit(1, f"아카이브가 없습니다: {archive_root()} (python -m menu_archive build)\n")
+    dates = archive["date"]
+    print(f"{archive.path}: {len(archive)}행, {archive.nbytes() / 1024:.1f} KiB")
+    if len(archive):
+        print(f"기간 {dates[0]} ~ {dates[-1]}")
+    for name in DICTS:
+        print(f"  {name}: {len(archive.dicts[name])}종")
+
+
+if __name__ == "__main__":
+    main()
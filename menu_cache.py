@@ -0,0 +1,214 @@
+"""메뉴/평점 캐시 (stale-while-revalidate)
+
+- soft_ttl 이내: 캐시된 값을 그대로 반환
+- soft_ttl ~ hard_ttl: 캐시된 값을 바로 반환하고, 백그라운드에서 다시 조회
+- hard_ttl 초과 또는 캐시 없음: 직접 조회 후 반환
+
+같은 키에 대한 조회는 한 번만 실행되며 (single-flight), 나머지 요청은 그 결과를 기다리거나
+이전 값을 받습니다. 백그라운드 조회가 실패하면 이전 값을 hard_ttl 까지 계속 사용합니다.
+(그래서 CachedMenuClient 는 조회 실패를 빈 메뉴가 아니라 예외로 받도록 strict 로 조회합니다)
+hard_ttl 이 지난 항목은 prune_interval 마다 저장할 때 함께 정리합니다.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+
+from welplus_api import (
+    LUNCH, MEAL_TYPES, DEFAULT_RESTAURANT_CODE, DEFAULT_RANGE_WORKERS, UpstreamUnavailable, empty_rating, to_menu_dt,
+)
+
+# 평점(MENU_GRADE_AVG, TOT_CNT)이 점심시간 동안 1분 안에 반영되도록
+MENU_SOFT_TTL = 30
+MENU_HARD_TTL = 6 * 60 * 60
+# 만료 항목 정리 주기 (초)
+PRUNE_INTERVAL = 10 * 60
+
+logger = logging.getLogger(__name__)
+
+# 여러 식당/식사를 동시에 조회할 때 쓰는 공용 스레드 풀 (CachedMenuClient 는 실행마다 새로 만들어지므로)
+_fetch_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="menu-fetch")
+
+
+class _Entry:
+    __slots__ = ("value", "stored_at")
+
+    def __init__(self, value, stored_at):
+        self.value = value
+        self.stored_at = stored_at
+
+
+class SWRCache:
+    def __init__(self, soft_ttl=MENU_SOFT_TTL, hard_ttl=MENU_HARD_TTL, max_workers=2,
+                 clock=time.monotonic, prune_interval=PRUNE_INTERVAL):
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self.prune_interval = prune_interval
+        self._clock = clock
+        self._pruned_at = clock()
+        self._entries = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="swr-revalidate")
+
+    def get(self, key, loader):
+        """캐시 조회 (loader: 인자 없는 조회 함수)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            age = None if entry is None else self._clock() - entry.stored_at
+
+            if entry is not None and age < self.soft_ttl:
+                return entry.value
+
+            if entry is not None and age < self.hard_ttl:
+                # 오래된 값을 즉시 반환하고 백그라운드에서 갱신
+                if key not in self._inflight:
+                    future = Future()
+                    self._inflight[key] = future
+                    self._executor.submit(self._load, key, loader, future)
+                return entry.value
+
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if owner:
+            self._load(key, loader, future)
+        return future.result()
+
+    def _load(self, key, loader, future):
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            logger.warning("캐시 갱신 실패 (%s): %s", key, e)
+            future.set_exception(e)
+            return
+
+        with self._lock:
+            self._store(key, value)
+            self._inflight.pop(key, None)
+        future.set_result(value)
+
+    def _store(self, key, value):
+        """(락 안에서) 저장 - prune_interval 이 지났으면 만료 항목도 정리"""
+        now = self._clock()
+        self._entries[key] = _Entry(value, now)
+        if now - self._pruned_at >= self.prune_interval:
+            self._prune(now)
+
+    def put(self, key, value):
+        """값을 직접 저장 (기간 조회처럼 캐시 밖에서 가져온 결과)"""
+        with self._lock:
+            self._store(key, value)
+
+    def peek(self, key):
+        """저장된 값 (없거나 hard_ttl 초과 시 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._clock() - entry.stored_at >= self.hard_ttl:
+                return None
+            return entry.value
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def prune(self):
+        """hard_ttl 이 지난 항목 제거"""
+        with self._lock:
+            return self._prune(self._clock())
+
+    def _prune(self, now):
+        expired = [k for k, e in self._entries.items() if now - e.stored_at >= self.hard_ttl]
+        for k in expired:
+            del self._entries[k]
+        self._pruned_at = now
+        return len(expired)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class CachedMenuClient:
+    """WelplusAPI(또는 SyncWelplusAPI) 앞단의 SWR 캐시
+
+    메뉴는 세션과 무관하므로 캐시는 프로세스 전체에서 공유합니다.
+    키에 식당 코드가 들어가므로 식당마다 따로 캐시되고 갱신됩니다.
+    """
+
+    def __init__(self, api, cache):
+        self.api = api
+        self.cache = cache
+
+    def get_menu(self, date=None, meal_type=LUNCH, restaurant_code=DEFAULT_RESTAURANT_CODE, strict=False):
+        """메뉴 조회 - 조회 실패는 캐시에 넣지 않음 (갱신 실패 시 이전 값을 계속 사용)
+
+        캐시된 값도 없이 조회에 실패하면 strict 가 아닐 때만 캐시 없이 다시 조회해 돌려주고
+        (평점만 실패했으면 0점/0명으로 메뉴는 보여줌, 메뉴 조회도 실패하면 빈 메뉴),
+        strict 이면 UpstreamUnavailable 을 올림
+        """
+        try:
+            return self.cache.get(("menu", restaurant_code, to_menu_dt(date), meal_type),
+                                  lambda: self.api.get_menu(date, meal_type, restaurant_code, strict=True))
+        except UpstreamUnavailable:
+            if strict:
+                raise
+            return self.api.get_menu(date, meal_type, restaurant_code)
+
+    def get_menus(self, start, end, meal_types=(LUNCH,), restaurant_code=DEFAULT_RESTAURANT_CODE,
+                  max_workers=DEFAULT_RANGE_WORKERS, weekdays_only=False):
+        """api.get_menus 와 같음 (캐시에 있는 날짜는 건너뛰고, 새로 조회한 결과는 캐시에 저장)
+
+        get_menu 와 같이 조회에 실패한 날짜는 캐시에 넣지 않고, 캐시 없이 다시 조회한 결과를 내보냄
+        """
+        def cached(menu_dt, meal_type):
+            return self.cache.peek(("menu", restaurant_code, menu_dt, meal_type))
+
+        for menu_dt, meal_type, day_menu in self.api.get_menus(
+                start, end, meal_types, restaurant_code, max_workers, cached, weekdays_only, strict=True):
+            if day_menu is None:
+                yield menu_dt, meal_type, self.api.get_menu(
+                    datetime.strptime(menu_dt, "%Y%m%d"), meal_type, restaurant_code)
+                continue
+            key = ("menu", restaurant_code, menu_dt, meal_type)
+            if self.cache.peek(key) is not day_menu:
+                self.cache.put(key, day_menu)
+            yield menu_dt, meal_type, day_menu
+
+    def _get_menus(self, calls):
+        """{키: get_menu 인자} 를 동시에 조회 -> {키: DayMenu} (캐시에 있는 항목은 바로 반환)"""
+        futures = {key: _fetch_pool.submit(self.get_menu, *args) for key, args in calls.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+    def get_menus_for_restaurants(self, date, restaurant_codes, meal_type=LUNCH):
+        """여러 식당 메뉴를 동시에 조회 -> {식당 코드: DayMenu}"""
+        return self._get_menus({code: (date, meal_type, code) for code in restaurant_codes})
+
+    def get_day_menus(self, date=None, meal_types=MEAL_TYPES, restaurant_code=DEFAULT_RESTAURANT_CODE):
+        """하루의 식사별 메뉴를 동시에 조회 -> {식사 구분: DayMenu} (식사마다 따로 캐시)"""
+        return self._get_menus({mt: (date, mt, restaurant_code) for mt in meal_types})
+
+    def prefetch(self, date=None, meal_types=MEAL_TYPES, restaurant_code=DEFAULT_RESTAURANT_CODE):
+        """식사별 메뉴를 백그라운드에서 캐시에 채움 (기다리지 않음, 캐시에 있는 식사는 건너뜀) -> Future 목록"""
+        menu_dt = to_menu_dt(date)
+        return [_fetch_pool.submit(self.get_menu, date, mt, restaurant_code) for mt in meal_types
+                if self.cache.peek(("menu", restaurant_code, menu_dt, mt)) is None]
+
+    def get_menu_rating(self, menu_dt, hall_no, menu_course_type,
+                        menu_meal_type, restaurant_code):
+        """평점 조회 - get_menu 와 같이 실패는 캐시에 넣지 않음 (캐시도 없으면 0점/0명)"""
+        key = ("rating", menu_dt, hall_no, menu_course_type, menu_meal_type, restaurant_code)
+        try:
+            return self.cache.get(key, lambda: self.api.get_menu_rating(
+                menu_dt, hall_no, menu_course_type, menu_meal_type, restaurant_code, strict=True))
+        except UpstreamUnavailable:
+            return empty_rating()
@@ -0,0 +1,372 @@
+"""메뉴/평점/투표/통계 JSON HTTP API
+
+챗봇, 사이니지 같은 내부 도구가 Streamlit 세션 없이 메뉴를 가져갈 수 있도록
+앱과 같은 메뉴 캐시(SWRCache)와 저장소(storage)를 JSON 으로 제공합니다.
+
+    GET /api/menu?date=YYYYMMDD      메뉴 (date 생략 시 오늘)
+    GET /api/ratings?date=YYYYMMDD   메뉴별 평점
+    GET /api/votes?date=YYYYMMDD     그날 메뉴의 투표 수 (date 생략 시 전체)
+    GET /api/stats/top?limit=5       투표 합계와 인기 메뉴
+    GET /healthz
+
+응답 본문은 원본(캐시된 DayMenu 객체, 저장소 파일의 mtime/크기)이 바뀔 때만 다시 만들고,
+ETag/Last-Modified 로 조건부 요청(If-None-Match, If-Modified-Since)에 304 를 돌려주므로
+폴링하는 클라이언트가 많아도 비용이 거의 들지 않습니다.
+
+앱 안에서 실행 (secrets.toml):
+
+    [http_api]
+    enabled = true
+    port = 8600
+
+별도 프로세스로 실행 (계정은 WELSTORY_USERNAME/WELSTORY_PASSWORD 또는 .streamlit/secrets.toml):
+
+    python -m menu_http --port 8600
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import codec
+import storage
+from cold_archive import ColdArchive, merge_votes
+from menu_cache import MENU_SOFT_TTL
+from menu_stats import vote_totals, top_menus
+from metrics import span
+from welplus_api import KST, LUNCH, UpstreamUnavailable
+
+HTTP_API_PORT = 8600
+# 투표/통계는 자주 바뀌므로 짧게
+VOTES_MAX_AGE = 5
+# 메뉴 조회 실패(503) 시 다시 시도할 때까지 (초)
+RETRY_AFTER = 30
+# 조회 실패로 다시 로그인하는 최소 간격 (장애 중 요청마다 로그인하지 않도록)
+RELOGIN_INTERVAL = 60
+
+logger = logging.getLogger(__name__)
+
+
+class _Representation:
+    __slots__ = ("source", "body", "etag", "last_modified")
+
+    def __init__(self, source, body, etag, last_modified):
+        self.source = source
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class ResponseCache:
+    """원본이 같으면 직렬화된 본문을 재사용하는 응답 캐시
+
+    source 는 원본의 버전 (같은 객체이거나 같은 값이면 같은 버전).
+    """
+
+    def __init__(self, maxsize=256, clock=time.time):
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, source, render):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and (entry.source is source or entry.source == source):
+            return entry
+
+        body = codec.json_bytes(render())
+        etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+        if entry is not None and entry.etag == etag:
+            # 원본 버전만 바뀌고 내용은 같으면 Last-Modified 유지
+            last_modified = entry.last_modified
+        else:
+            last_modified = int(self._clock())
+        entry = _Representation(source, body, etag, last_modified)
+
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = entry
+        return entry
+
+
+def _not_modified(headers, entry):
+    """조건부 요청에 304 로 답해도 되는지 (If-None-Match 가 있으면 그쪽 우선)"""
+    if_none_match = headers.get("If-None-Match")
+    if if_none_match is not None:
+        tags = [t.strip() for t in if_none_match.split(",")]
+        return "*" in tags or any(t.removeprefix("W/") == entry.etag for t in tags)
+
+    if_modified_since = headers.get("If-Modified-Since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return entry.last_modified <= since
+    return False
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.retry_after = retry_after
+
+
+def _parse_date(params):
+    value = params.get("date")
+    if not value:
+        return datetime.now(KST)
+    try:
+        return datetime.strptime(value, "%Y%m%d")
+    except ValueError:
+        raise HTTPError(400, "date 는 YYYYMMDD 형식이어야 합니다")
+
+
+class MenuService:
+    """엔드포인트별 (원본 버전, 응답 생성 함수)
+
+    메뉴 조회에 실패하면 빈 메뉴 대신 503 (Retry-After) 을 돌려주고, login 을 주면
+    (최대 RELOGIN_INTERVAL 초에 한 번) 다시 로그인한 뒤 한 번 더 조회합니다 (토큰 만료 대비).
+    """
+
+    def __init__(self, client, meal_type=LUNCH, responses=None, archive=None, login=None, clock=time.monotonic):
+        self.client = client
+        self.meal_type = meal_type
+        self.responses = responses or ResponseCache()
+        # 보관된 지난 투표 (cold_archive) - 보관 작업은 votes.json 도 바꾸므로 원본 버전은 votes.json 그대로
+        self.archive = archive or ColdArchive()
+        self.login = login
+        self._clock = clock
+        self._login_lock = threading.Lock()
+        self._login_at = None
+
+    def _relogin(self):
+        """다시 로그인 (다른 요청이 최근에 시도했으면 건너뜀) -> 이번에 로그인했으면 True"""
+        with self._login_lock:
+            now = self._clock()
+            if self._login_at is not None and now - self._login_at < RELOGIN_INTERVAL:
+                return False
+            self._login_at = now
+            try:
+                return bool(self.login())
+            except UpstreamUnavailable as e:
+                logger.warning("다시 로그인 실패: %s", e)
+                return False
+
+    def _day_menu(self, params):
+        date = _parse_date(params)
+        try:
+            return self.client.get_menu(date, self.meal_type, strict=True)
+        except Exception as e:
+            logger.warning("메뉴 조회 실패: %s", e)
+            if self.login is not None and self._relogin():
+                try:
+                    return self.client.get_menu(date, self.meal_type, strict=True)
+                except Exception as e:
+                    logger.warning("다시 로그인 후에도 메뉴 조회 실패: %s", e)
+            raise HTTPError(503, "메뉴를 가져오지 못했습니다", retry_after=RETRY_AFTER)
+
+    def menu(self, params):
+        day_menu = self._day_menu(params)
+        return ("menu", day_menu.menu_dt), day_menu, MENU_SOFT_TTL, lambda: dict(
+            day_menu.to_dict(), date=day_menu.menu_dt)
+
+    def ratings(self, params):
+        day_menu = self._day_menu(params)
+        return ("ratings", day_menu.menu_dt), day_menu, MENU_SOFT_TTL, lambda: {
+            "date": day_menu.menu_dt,
+            "ratings": [
+                {"menu_id": item.menu_id, "메뉴명": item.name,
+                 "평균평점": item.rating_avg, "참여자수": item.rating_count}
+                for item in day_menu.items
+            ],
+        }
+
+    def votes(self, params):
+        date = params.get("date")
+        if date:
+            _parse_date(params)
+
+        def render():
+            votes = storage.load_votes()
+            if date:
+                votes = {k: v for k, v in votes.items() if k.startswith(date + "_")}
+                votes = merge_votes(self.archive.votes_on(date), votes)
+            else:
+                votes = self.archive.merged_votes(votes)
+            return {"date": date, "votes": votes}
+
+        return ("votes", date), storage.data_version("votes.json"), VOTES_MAX_AGE, render
+
+    def top_stats(self, params):
+        try:
+            limit = max(1, min(100, int(params.get("limit", 5))))
+        except ValueError:
+            raise HTTPError(400, "limit 은 정수여야 합니다")
+
+        def render():
+            votes = self.archive.merged_votes(storage.load_votes())
+            total_likes, total_dislikes, total_votes = vote_totals(votes)
+            return {
+                "좋아요": total_likes,
+                "별로": total_dislikes,
+                "총투표": total_votes,
+                "top": top_menus(votes, limit),
+            }
+
+        return ("stats_top", limit), storage.data_version("votes.json"), VOTES_MAX_AGE, render
+
+    def handle(self, path, params):
+        """(응답 표현, max-age) 반환, 없는 경로면 None"""
+        endpoint = ROUTES.get(path)
+        if endpoint is None:
+            return None
+        with span(f"http_api.{endpoint}"):
+            key, source, max_age, render = getattr(self, endpoint)(params)
+            return self.responses.get(key, source, render), max_age
+
+
+ROUTES = {
+    "/api/menu": "menu",
+    "/api/ratings": "ratings",
+    "/api/votes": "votes",
+    "/api/stats/top": "top_stats",
+}
+
+
+class _MenuAPIHandler(BaseHTTPRequestHandler):
+    service = None  # make_menu_api_server 에서 지정
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        if status != 304:
+            self.send_header("Content-Type", "application/json;charset=UTF-8")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304 and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_error_json(self, status, message, retry_after=None):
+        body = json.dumps({"error": message}, ensure_ascii=False).encode("utf-8")
+        headers = {"Cache-Control": "no-store"}
+        if retry_after is not None:
+            headers["Retry-After"] = str(retry_after)
+        self._send(status, body, headers)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/healthz":
+            self._send(200, b'{"status":"ok"}', {"Cache-Control": "no-store"})
+            return
+
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        try:
+            result = self.service.handle(url.path, params)
+        except HTTPError as e:
+            self._send_error_json(e.status, e.message, e.retry_after)
+            return
+        if result is None:
+            self._send_error_json(404, "not found")
+            return
+
+        entry, max_age = result
+        headers = {
+            "ETag": entry.etag,
+            "Last-Modified": formatdate(entry.last_modified, usegmt=True),
+            "Cache-Control": f"public, max-age={max_age}",
+        }
+        if _not_modified(self.headers, entry):
+            self._send(304, headers=headers)
+        else:
+            self._send(200, entry.body, headers)
+
+    do_HEAD = do_GET
+
+
+class _MenuAPIServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def make_menu_api_server(client, host="127.0.0.1", port=HTTP_API_PORT, login=None):
+    """client: get_menu(date, meal_type, strict=True) 를 가진 객체 (보통 CachedMenuClient)
+    login: 메뉴 조회 실패 시 다시 로그인하는 함수 (없으면 503 만)"""
+    handler = type("MenuAPIHandler", (_MenuAPIHandler,), {"service": MenuService(client, login=login)})
+    server = _MenuAPIServer((host, port), handler)
+    server.base_url = f"http://{host}:{server.server_address[1]}"
+    return server
+
+
+def start_menu_api_server(client, host="127.0.0.1", port=HTTP_API_PORT, login=None):
+    """백그라운드 스레드에서 JSON API 실행"""
+    server = make_menu_api_server(client, host, port, login)
+    threading.Thread(target=server.serve_forever, name="menu-http-api", daemon=True).start()
+    return server
+
+
+def load_credentials(secrets_path=".streamlit/secrets.toml"):
+    """환경 변수 또는 secrets.toml 의 [welstory] 계정 정보"""
+    from welplus_api import BASE_URL
+
+    credentials = {}
+    if os.path.exists(secrets_path):
+        import tomllib
+
+        with open(secrets_path, 'rb') as f:
+            credentials = dict(tomllib.load(f).get("welstory", {}))
+    for key in ("username", "password", "base_url"):
+        value = os.environ.get(f"WELSTORY_{key.upper()}")
+        if value:
+            credentials[key] = value
+    credentials.setdefault("base_url", BASE_URL)
+    return credentials
+
+
+def main():
+    from menu_cache import SWRCache, CachedMenuClient
+    from welplus_api import WelplusAPI
+
+    parser = argparse.ArgumentParser(description="메뉴 JSON HTTP API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=HTTP_API_PORT)
+    parser.add_argument("--secrets", default=".streamlit/secrets.toml")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    credentials = load_credentials(args.secrets)
+    api = WelplusAPI(base_url=credentials["base_url"])
+
+    def login():
+        return api.login(credentials.get("username"), credentials.get("password"))
+
+    if not login():
+        parser.exit(1, "로그인 실패\n")
+
+    server = make_menu_api_server(CachedMenuClient(api, SWRCache()), args.host, args.port, login)
+    print(f"JSON API: {server.base_url}/api/menu")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""웰스토리 메뉴 데이터 모델
+
+API 응답(mealList 항목)을 __slots__ 기반의 불변 객체로 변환합니다.
+세션/캐시에 주 단위 메뉴를 여러 식당분 보관해도 dict 보다 메모리를 적게 쓰고,
+렌더링 시 속성 접근으로 바로 값을 꺼낼 수 있습니다.
+기존 한글 키 dict 형태가 필요한 곳은 to_dict()/from_dict() 를 사용하세요.
+"""
+import sys
+
+# 메뉴 분류 태그
+MEAL_REGULAR = "regular"     # 일반 코너
+MEAL_EXTRA = "extra"         # 추가 배식대
+MEAL_RAMEN = "ramen"         # 라면 (마이보글)
+MEAL_SELF = "self"           # SELF 배식대 (표시하지 않음)
+
+MAX_REGULAR_CORNERS = 4
+
+# 식사 구분 (welplus menuMealType)
+BREAKFAST = "1"
+LUNCH = "2"
+DINNER = "3"
+MEAL_TYPE_NAMES = {BREAKFAST: "조식", LUNCH: "중식", DINNER: "석식"}
+
+
+def classify_course(course_txt, menu_name):
+    """코너명/메뉴명으로 메뉴 분류 태그 결정"""
+    if "추가 배식대" in course_txt or "추가배식대" in course_txt:
+        return MEAL_EXTRA
+    if course_txt == "SELF 배식대":
+        return MEAL_SELF
+    if course_txt == "마이보글" or "[라면" in menu_name:
+        return MEAL_RAMEN
+    return MEAL_REGULAR
+
+
+def classify_meal(meal):
+    """mealList 항목의 분류 태그"""
+    return classify_course(meal.get("courseTxt", ""), meal.get("menuName", ""))
+
+
+def select_meals(meal_list):
+    """mealList 를 한 번 순회하며 표시할 항목을 (분류, 항목) 목록으로 선택
+
+    추가 배식대/라면은 첫 항목만, 일반 메뉴는 최대 4개까지 (SELF 배식대 제외)
+    """
+    selected = []
+    regular_count = 0
+    seen_extra = seen_ramen = False
+
+    for meal in meal_list:
+        kind = classify_meal(meal)
+
+        if kind == MEAL_EXTRA and not seen_extra:
+            seen_extra = True
+        elif kind == MEAL_REGULAR and regular_count < MAX_REGULAR_CORNERS:
+            regular_count += 1
+        elif kind == MEAL_RAMEN and not seen_ramen:
+            seen_ramen = True
+        else:
+            continue
+        selected.append((kind, meal))
+
+    return selected
+
+
+def build_day_menu(menu_dt, selected, ratings, meal_type=None):
+    """select_meals() 결과와 항목별 평점으로 DayMenu 생성 (meal_type: 조회한 식사 구분)"""
+    regular, ramen, extra = [], [], None
+    for (kind, meal), rating in zip(selected, ratings):
+        item = MenuItem.from_meal(meal, menu_dt, rating, kind, meal_type)
+        if kind == MEAL_EXTRA:
+            extra = item
+        elif kind == MEAL_RAMEN:
+            ramen.append(item)
+        else:
+            regular.append(item)
+    return DayMenu(menu_dt, regular, ramen, extra)
+
+
+def _find_topping_idx(components):
+    for i, item in enumerate(components):
+        if "[토핑" in item:
+            return i
+    return -1
+
+
+def _parse_kcal(value):
+    """sumKcal 문자열을 정수로 변환 (실패 시 None)"""
+    if value is None or value == "":
+        return None
+    try:
+        return int(float(str(value).replace(",", "").strip()))
+    except ValueError:
+        return None
+
+
+def _parse_float(value):
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _parse_int(value):
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class _Frozen:
+    """생성 후 속성 변경을 막는 공통 베이스"""
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} 객체는 변경할 수 없습니다")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} 객체는 변경할 수 없습니다")
+
+    def _init(self, **fields):
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, s) == getattr(other, s) for s in self.__slots__)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, s) for s in self.__slots__))
+
+    def __repr__(self):
+        fields = ", ".join(f"{s}={getattr(self, s)!r}" for s in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self):
+        # st.cache_data 등 pickle 기반 캐시 지원
+        return (_rebuild, (type(self), tuple(getattr(self, s) for s in self.__slots__)))
+
+
+def _rebuild(cls, values):
+    obj = cls.__new__(cls)
+    obj._init(**dict(zip(cls.__slots__, values)))
+    return obj
+
+
+class MenuItem(_Frozen):
+    """코너 하나의 메뉴 정보"""
+    __slots__ = ("corner", "name", "kcal", "components", "image_url",
+                 "rating_avg", "rating_count", "menu_id", "kind", "topping_idx")
+
+    def __init__(self, corner, name, kcal=None, components=(), image_url=None,
+                 rating_avg=0.0, rating_count=0, menu_id="", kind=None):
+        corner = corner or ""
+        name = name or ""
+        # 구성 항목(밥, 김치 ...)은 날짜/식당 간에 반복되므로 intern 해서 공유
+        components = tuple(sys.intern(c) for c in components)
+        kind = kind or classify_course(corner, name)
+        self._init(
+            corner=sys.intern(corner),
+            name=sys.intern(name),
+            kcal=kcal,
+            components=components,
+            image_url=image_url,
+            rating_avg=float(rating_avg),
+            rating_count=int(rating_count),
+            menu_id=menu_id,
+            kind=kind,
+            # 라면 메뉴는 '[토핑' 위치를 미리 찾아 두어 렌더링 시 재검색하지 않음
+            topping_idx=_find_topping_idx(components) if kind == MEAL_RAMEN else -1,
+        )
+
+    @classmethod
+    def from_meal(cls, meal, menu_dt, rating=None, kind=None, meal_type=None):
+        """mealList 항목 + 평점 정보로 생성 (meal_type 을 주지 않으면 항목의 menuMealType)"""
+        course_txt = meal.get("courseTxt", "")
+        menu_name = meal.get("menuName", "")
+        sub_menu_txt = meal.get("subMenuTxt", "") or ""
+
+        photo_url = meal.get("photoUrl", "")
+        photo_cd = meal.get("photoCd", "")
+        image_url = f"{photo_url}{photo_cd}" if photo_url and photo_cd else None
+
+        # 기존 투표/댓글과 맞도록 점심은 "날짜_코너_메뉴명", 다른 식사는 코너 앞에 식사 이름을 붙임
+        # (업스트림이 숫자로 보내도 같은 ID 가 되도록 문자열로 맞춤)
+        meal_type = str(meal_type or meal.get("menuMealType") or LUNCH)
+        if meal_type != LUNCH:
+            course_id = f"{MEAL_TYPE_NAMES.get(meal_type, meal_type)}-{course_txt}"
+        else:
+            course_id = course_txt
+
+        rating = rating or {}
+        return cls(
+            corner=course_txt,
+            name=menu_name,
+            kcal=_parse_kcal(meal.get("sumKcal")),
+            components=(c for c in sub_menu_txt.split(",") if c),
+            image_url=image_url,
+            rating_avg=_parse_float(rating.get("평균평점")),
+            rating_count=_parse_int(rating.get("참여자수")),
+            menu_id=f"{menu_dt}_{course_id}_{menu_name}".replace(" ", "_"),
+            kind=kind,
+        )
+
+    @property
+    def kcal_label(self):
+        """화면 표시용 칼로리 문자열"""
+        return "" if self.kcal is None else str(self.kcal)
+
+    @property
+    def ramen_types(self):
+        """라면 종류 (첫 항목 제외, 토핑 구분자 전까지)"""
+        if self.topping_idx > 0:
+            return self.components[1:self.topping_idx]
+        return self.components[1:]
+
+    @property
+    def toppings(self):
+        """라면 토핑 (토핑 구분자 이후)"""
+        if self.topping_idx > 0:
+            return self.components[self.topping_idx + 1:]
+        return ()
+
+    def to_dict(self):
+        """기존 한글 키 dict 형태로 변환"""
+        return {
+            "코너": self.corner,
+            "메뉴명": self.name,
+            "칼로리": self.kcal_label,
+            "구성": list(self.components),
+            "이미지": self.image_url,
+            "평균평점": self.rating_avg,
+            "참여자수": self.rating_count,
+            "menu_id": self.menu_id,
+            "kind": self.kind,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """한글 키 dict 에서 생성"""
+        return cls(
+            corner=data.get("코너", ""),
+            name=data.get("메뉴명", ""),
+            kcal=_parse_kcal(data.get("칼로리")),
+            components=(c for c in data.get("구성", []) if c),
+            image_url=data.get("이미지"),
+            rating_avg=_parse_float(data.get("평균평점")),
+            rating_count=_parse_int(data.get("참여자수")),
+            menu_id=data.get("menu_id", ""),
+            kind=data.get("kind"),
+        )
+
+
+class DayMenu(_Frozen):
+    """하루치 메뉴 (일반/라면 메뉴 + 추가 배식대)"""
+    __slots__ = ("menu_dt", "regular", "ramen", "extra")
+
+    def __init__(self, menu_dt, regular=(), ramen=(), extra=None):
+        self._init(menu_dt=menu_dt, regular=tuple(regular), ramen=tuple(ramen), extra=extra)
+
+    @classmethod
+    def empty(cls, menu_dt=""):
+        return cls(menu_dt)
+
+    @classmethod
+    def from_items(cls, menu_dt, items, extra=None):
+        """분류 태그에 따라 일반/라면 메뉴로 나눠서 생성"""
+        items = list(items)
+        return cls(
+            menu_dt,
+            regular=(m for m in items if m.kind == MEAL_REGULAR),
+            ramen=(m for m in items if m.kind == MEAL_RAMEN),
+            extra=extra,
+        )
+
+    @property
+    def items(self):
+        """일반 메뉴 + 라면 메뉴 (기존 "점심" 목록 순서)"""
+        return self.regular + self.ramen
+
+    def __bool__(self):
+        return bool(self.regular) or bool(self.ramen) or self.extra is not None
+
+    def to_dict(self):
+        """기존 {"점심": [...], "추가배식대": ...} 형태로 변환"""
+        return {
+            "점심": [item.to_dict() for item in self.items],
+            "추가배식대": self.extra.to_dict() if self.extra else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data, menu_dt=""):
+        extra = data.get("추가배식대")
+        return cls.from_items(
+            menu_dt,
+            (MenuItem.from_dict(m) for m in data.get("점심", [])),
+            extra=MenuItem.from_dict(extra) if extra else None,
+        )
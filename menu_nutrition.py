@@ -0,0 +1,161 @@
+"""칼로리 통계 (영양 페이지에서 사용)
+
+컬럼형 아카이브(menu_archive)의 배열을 코너별로 묶어 NumPy 벡터 연산으로 집계합니다.
+행마다 파이썬 루프를 돌지 않으므로 몇 년치도 수 ms 안에 끝납니다.
+칼로리가 없는 항목(NaN)은 모든 집계에서 빠집니다.
+"""
+import numpy as np
+
+from menu_model import MEAL_RAMEN, MEAL_REGULAR
+
+PERIODS = ("day", "week", "month")
+# 기본 집계 대상 (추가 배식대는 코너 식사가 아니므로 제외)
+MEAL_KINDS = (MEAL_REGULAR, MEAL_RAMEN)
+# |z| 가 이 값보다 크면 이상치
+OUTLIER_Z = 2.5
+
+
+def period_start(dates, period):
+    """datetime64[D] 배열 -> 기간 시작일 (week 는 월요일, month 는 1일)"""
+    if period == "day":
+        return dates
+    if period == "week":
+        # 1970-01-01 은 목요일 -> (일수 + 3) % 7 이 월요일 기준 요일
+        days = dates.astype(np.int64)
+        return (days - (days + 3) % 7).astype("datetime64[D]")
+    if period == "month":
+        return dates.astype("datetime64[M]").astype("datetime64[D]")
+    raise ValueError(f"알 수 없는 기간: {period}")
+
+
+def _kcal_rows(archive, start=None, end=None, restaurant_code=None, meal_type=None, kinds=MEAL_KINDS):
+    """조건에 맞고 칼로리가 있는 행의 (corner 코드, kcal, 행 번호)"""
+    rows = archive.select(start, end, restaurant_code, meal_type, kinds)
+    kcal = archive["kcal"][rows]
+    valid = ~np.isnan(kcal)
+    rows = rows[valid]
+    return archive["corner"][rows], kcal[valid].astype(np.float64), rows
+
+
+def kcal_trend(archive, start=None, end=None, period="day", restaurant_code=None, meal_type=None,
+               kinds=MEAL_KINDS):
+    """기간(일/주/월) x 코너 평균 칼로리
+
+    {"periods": datetime64 배열, "corners": 코너명 목록, "mean": (기간, 코너) 배열 (없으면 NaN),
+     "count": 같은 모양의 항목 수}
+    """
+    corner, kcal, rows = _kcal_rows(archive, start, end, restaurant_code, meal_type, kinds)
+    periods, period_idx = np.unique(period_start(archive["date"][rows], period), return_inverse=True)
+    corner_codes, corner_idx = np.unique(corner, return_inverse=True)
+
+    shape = (len(periods), len(corner_codes))
+    flat = period_idx * len(corner_codes) + corner_idx
+    count = np.bincount(flat, minlength=shape[0] * shape[1]).reshape(shape)
+    total = np.bincount(flat, weights=kcal, minlength=shape[0] * shape[1]).reshape(shape)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(count > 0, total / count, np.nan)
+    return {
+        "periods": periods,
+        "corners": list(archive.decode("corner", corner_codes)),
+        "mean": mean,
+        "count": count,
+    }
+
+
+def _group_percentile(sorted_values, starts, counts, q):
+    """그룹별로 정렬된 값에서 q(0~1) 백분위 (선형 보간)"""
+    pos = starts + (counts - 1) * q
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.minimum(lo + 1, starts + counts - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def kcal_distribution(archive, start=None, end=None, restaurant_code=None, meal_type=None, kinds=MEAL_KINDS):
+    """코너별 칼로리 분포 목록 (평균 높은 순)
+
+    각 항목: 코너, 항목수, 평균, 표준편차, 최소, p10, 중앙값, p90, 최대
+    """
+    corner, kcal, _ = _kcal_rows(archive, start, end, restaurant_code, meal_type, kinds)
+    if not len(kcal):
+        return []
+    # 코너 -> 칼로리 순으로 정렬하면 코너마다 연속 구간이 됨
+    order = np.lexsort((kcal, corner))
+    corner, kcal = corner[order], kcal[order]
+    corner_codes, starts, counts = np.unique(corner, return_index=True, return_counts=True)
+
+    total = np.add.reduceat(kcal, starts)
+    mean = total / counts
+    square = np.add.reduceat((kcal - np.repeat(mean, counts)) ** 2, starts)
+    std = np.sqrt(square / counts)
+    percentiles = {q: _group_percentile(kcal, starts, counts, q) for q in (0.1, 0.5, 0.9)}
+
+    names = archive.decode("corner", corner_codes)
+    result = [
+        {
+            "코너": names[i],
+            "항목수": int(counts[i]),
+            "평균": float(mean[i]),
+            "표준편차": float(std[i]),
+            "최소": float(kcal[starts[i]]),
+            "p10": float(percentiles[0.1][i]),
+            "중앙값": float(percentiles[0.5][i]),
+            "p90": float(percentiles[0.9][i]),
+            "최대": float(kcal[starts[i] + counts[i] - 1]),
+        }
+        for i in range(len(corner_codes))
+    ]
+    result.sort(key=lambda x: x["평균"], reverse=True)
+    return result
+
+
+def kcal_histogram(archive, start=None, end=None, bin_width=100, restaurant_code=None, meal_type=None,
+                   kinds=MEAL_KINDS):
+    """칼로리 구간 x 코너 항목 수
+
+    {"bins": 구간 시작값 배열, "corners": 코너명 목록, "count": (구간, 코너) 배열}
+    """
+    corner, kcal, _ = _kcal_rows(archive, start, end, restaurant_code, meal_type, kinds)
+    if not len(kcal):
+        return {"bins": np.empty(0), "corners": [], "count": np.empty((0, 0), dtype=np.int64)}
+    low = np.floor(kcal.min() / bin_width) * bin_width
+    bin_idx = ((kcal - low) // bin_width).astype(np.int64)
+    corner_codes, corner_idx = np.unique(corner, return_inverse=True)
+    shape = (int(bin_idx.max()) + 1, len(corner_codes))
+    count = np.bincount(bin_idx * shape[1] + corner_idx, minlength=shape[0] * shape[1]).reshape(shape)
+    return {
+        "bins": low + np.arange(shape[0]) * bin_width,
+        "corners": list(archive.decode("corner", corner_codes)),
+        "count": count,
+    }
+
+
+def kcal_outliers(archive, start=None, end=None, z=OUTLIER_Z, limit=20, restaurant_code=None, meal_type=None,
+                  kinds=MEAL_KINDS):
+    """같은 코너 평균에서 크게 벗어난 메뉴 (|z| 큰 순)"""
+    corner, kcal, rows = _kcal_rows(archive, start, end, restaurant_code, meal_type, kinds)
+    if not len(kcal):
+        return []
+    corner_codes, corner_idx = np.unique(corner, return_inverse=True)
+    counts = np.bincount(corner_idx)
+    mean = np.bincount(corner_idx, weights=kcal) / counts
+    std = np.sqrt(np.bincount(corner_idx, weights=(kcal - mean[corner_idx]) ** 2) / counts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scores = (kcal - mean[corner_idx]) / std[corner_idx]
+    scores = np.nan_to_num(scores, nan=0.0, posinf=0.0, neginf=0.0)
+
+    hits = np.flatnonzero(np.abs(scores) > z)
+    hits = hits[np.argsort(-np.abs(scores[hits]), kind="stable")][:limit]
+    dates = archive["date"][rows[hits]]
+    names = archive.decode("name", archive["name"][rows[hits]])
+    corners = archive.decode("corner", corner[hits])
+    return [
+        {
+            "날짜": str(dates[i]),
+            "코너": corners[i],
+            "메뉴명": names[i],
+            "칼로리": float(kcal[h]),
+            "코너 평균": float(mean[corner_idx[h]]),
+            "z": float(scores[h]),
+        }
+        for i, h in enumerate(hits)
+    ]
@@ -0,0 +1,410 @@
+"""메뉴 페이지 HTML 조각 생성
+
+Streamlit 호출 없이 문자열만 만들기 때문에 벤치마크나 정적 내보내기에서도 그대로 사용합니다.
+클래스 이름(menu-corner, menu-image ...)은 MENU_CSS 와 맞춰야 합니다.
+"""
+
+# 앱(welstory_app.py)과 정적 내보내기(snapshot.py)가 같이 쓰는 스타일
+MENU_CSS = """
+    /* 다크모드/라이트모드 대응 */
+    .main-header {
+        font-size: 2.5rem;
+        font-weight: 900;
+        text-align: center;
+        margin-bottom: 2rem;
+        padding: 1rem;
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+    }
+    
+    .menu-card {
+        border: 2px solid rgba(102, 126, 234, 0.3);
+        border-radius: 20px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        box-shadow: 0 8px 20px rgba(0,0,0,0.1);
+        transition: transform 0.3s, box-shadow 0.3s;
+        background: rgba(255, 255, 255, 0.05);
+        height: 100%;
+        display: flex;
+        flex-direction: column;
+    }
+    
+    .menu-card:hover {
+        transform: translateY(-8px);
+        box-shadow: 0 12px 30px rgba(102, 126, 234, 0.2);
+        border-color: rgba(102, 126, 234, 0.6);
+    }
+    
+    .menu-header {
+        display: flex;
+        align-items: center;
+        gap: 1rem;
+        margin-bottom: 1rem;
+        padding-bottom: 1rem;
+        border-bottom: 2px solid rgba(102, 126, 234, 0.2);
+    }
+    
+    .menu-corner {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 0.5rem 1.2rem;
+        border-radius: 25px;
+        font-size: 0.9rem;
+        font-weight: bold;
+        display: inline-block;
+        box-shadow: 0 4px 10px rgba(102, 126, 234, 0.3);
+        white-space: nowrap;
+    }
+    
+    .menu-name {
+        font-size: 1.3rem;
+        font-weight: 900;
+        flex: 1;
+        line-height: 1.3;
+    }
+    
+    .menu-content {
+        flex: 1;
+        display: flex;
+        flex-direction: column;
+        gap: 1rem;
+    }
+    
+    .menu-image-container {
+        width: 100%;
+        height: 200px;
+        border-radius: 15px;
+        overflow: hidden;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+    }
+    
+    .menu-image {
+        width: 100%;
+        height: 100%;
+        object-fit: cover;
+    }
+    
+    .menu-image-placeholder {
+        width: 100%;
+        height: 100%;
+        background: linear-gradient(135deg, #e0e0e0 0%, #f5f5f5 100%);
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        color: #999;
+        font-size: 1rem;
+    }
+    
+    .menu-rating-small {
+        display: inline-flex;
+        align-items: center;
+        gap: 0.3rem;
+        background: linear-gradient(135deg, #FFD93D 0%, #FF6B35 100%);
+        color: white;
+        padding: 0.4rem 0.8rem;
+        border-radius: 10px;
+        font-size: 0.85rem;
+        font-weight: bold;
+        box-shadow: 0 2px 8px rgba(255, 107, 53, 0.2);
+        margin-top: 0.5rem;
+    }
+    
+    .menu-rating-small .score {
+        font-size: 1rem;
+    }
+    
+    .menu-rating-small .count {
+        font-size: 0.75rem;
+        opacity: 0.9;
+    }
+    
+    .menu-calories {
+        font-size: 1rem;
+        font-weight: bold;
+        color: #667eea;
+        margin-top: 0.8rem;
+        padding: 0.5rem;
+        background: rgba(102, 126, 234, 0.1);
+        border-radius: 8px;
+        text-align: center;
+    }
+
+    .menu-votes {
+        font-size: 0.95rem;
+        text-align: center;
+        margin: 0.5rem 0 1rem;
+        color: #555;
+    }
+    
+    .menu-ingredients {
+        font-size: 0.9rem;
+        line-height: 1.8;
+        padding: 1rem;
+        background: rgba(102, 126, 234, 0.05);
+        border-radius: 10px;
+        border-left: 4px solid #667eea;
+        margin-top: 1rem;
+        flex: 1;
+    }
+    
+    .ingredient-item {
+        padding: 0.3rem 0;
+        border-bottom: 1px solid rgba(102, 126, 234, 0.1);
+    }
+    
+    .ingredient-item:last-child {
+        border-bottom: none;
+    }
+    
+    .comment-box {
+        background: rgba(102, 126, 234, 0.08);
+        padding: 1rem;
+        border-radius: 12px;
+        margin: 0.8rem 0;
+        border-left: 4px solid #667eea;
+    }
+    
+    .comment-author {
+        color: #667eea;
+        font-weight: bold;
+        font-size: 1rem;
+    }
+    
+    .stat-card {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 2rem;
+        border-radius: 20px;
+        text-align: center;
+        box-shadow: 0 8px 20px rgba(102, 126, 234, 0.3);
+    }
+    
+    .board-post {
+        border: 2px solid rgba(102, 126, 234, 0.2);
+        border-radius: 15px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        transition: all 0.3s;
+    }
+    
+    .board-post:hover {
+        box-shadow: 0 8px 20px rgba(102, 126, 234, 0.15);
+        border-color: rgba(102, 126, 234, 0.4);
+    }
+    
+    /* 버튼 스타일 */
+    .stButton>button {
+        border-radius: 12px;
+        font-weight: 600;
+        transition: all 0.2s;
+        font-size: 1rem;
+    }
+    
+    .stButton>button:hover {
+        transform: translateY(-3px);
+        box-shadow: 0 6px 12px rgba(0,0,0,0.2);
+    }
+    
+    /* 통계 히트맵 */
+    .heatmap {
+        border-collapse: collapse;
+        font-size: 0.8rem;
+        margin: 0.5rem 0 1rem 0;
+    }
+    
+    .heatmap th, .heatmap td {
+        padding: 0.3rem 0.5rem;
+        text-align: center;
+        border: 1px solid #f0f0f0;
+    }
+    
+    /* 반응형 */
+    @media (max-width: 768px) {
+        .menu-name {
+            font-size: 1.1rem;
+        }
+    }
+"""
+
+
+def menu_title_html(menu):
+    """코너 + 메뉴명 (일반 메뉴 카드 상단)"""
+    return f"""
+    <div style="
+        display: flex;
+        flex-direction: column;
+        align-items: center;
+        gap: 0.8rem;
+        margin-bottom: 1rem;
+        padding-bottom: 1rem;
+        border-bottom: 2px solid rgba(102, 126, 234, 0.2);
+    ">
+        <div class="menu-corner">{menu.corner}</div>
+        <div style="
+            font-size: 1.2rem;
+            font-weight: 700;
+            line-height: 1.3;
+            text-align: center;
+            color: #667eea;
+        ">{menu.name}</div>
+    </div>
+    """
+
+
+def menu_header_html(menu):
+    """코너 + 메뉴명 한 줄 (라면 메뉴)"""
+    return f"""
+    <div class="menu-header">
+        <div class="menu-corner">{menu.corner}</div>
+        <div class="menu-name">{menu.name}</div>
+    </div>
+    """
+
+
+def menu_image_html(menu, height=None):
+    style = f' style="height: {height}px;"' if height else ""
+    if menu.image_url:
+        return f"""
+        <div class="menu-image-container"{style}>
+            <img src="{menu.image_url}" class="menu-image">
+        </div>
+        """
+    return f"""
+        <div class="menu-image-container"{style}>
+            <div class="menu-image-placeholder">이미지 없음</div>
+        </div>
+        """
+
+
+def rating_html(menu):
+    if menu.rating_avg > 0:
+        return f"""
+        <div class="menu-rating-small">
+            <span class="score">⭐ {menu.rating_avg:.1f}</span>
+            <span class="count">({menu.rating_count}명)</span>
+        </div>
+        """
+    return """
+        <div class="menu-rating-small">
+            <span class="score">⭐</span>
+            <span class="count">(평가 없음)</span>
+        </div>
+        """
+
+
+def calories_html(menu):
+    return f'<div class="menu-calories">🔥 {menu.kcal_label}kcal</div>'
+
+
+def item_list_html(title, items):
+    """구성/라면 종류/토핑 목록 박스"""
+    rows = ''.join([f'<div class="ingredient-item">• {item}</div>' for item in items])
+    return f"""
+    <div class="menu-ingredients" style="min-height: 150px; max-height: 150px; overflow-y: auto;">
+        📋 <strong>{title}</strong><br>
+        {rows}
+    </div>
+    """
+
+
+def ingredients_html(menu):
+    if menu.components:
+        return item_list_html("구성", menu.components)
+    return """
+    <div class="menu-ingredients" style="min-height: 150px; max-height: 150px;">
+        📋 <strong>구성</strong><br>
+        <div style="color: #999;">구성 정보 없음</div>
+    </div>
+    """
+
+
+def extra_station_html(extra):
+    return f"""
+    <div style="background: rgba(102, 126, 234, 0.05); padding: 1.5rem; border-radius: 15px; border: 1px">
+        <div class="menu-corner" style="background: #FF6B35; margin-bottom: 10px;">{extra.name}</div>
+        <div style="font-size: 0.9rem; color: #555;">📋 <strong>구성:</strong> {' / '.join(extra.components)}</div>
+    </div>
+    """
+
+
+def comment_html(comment):
+    return f"""
+    <div class="comment-box">
+        <div>
+            <span class="comment-author">{comment['author']}</span>
+            <span style="color: #999; font-size: 0.85rem;">· {comment['timestamp']}</span>
+        </div>
+        <div style="margin-top: 0.5rem;">{comment['text']}</div>
+    </div>
+    """
+
+
+def vote_counts_html(vote):
+    """투표 수 (정적 페이지용, 버튼 없음)"""
+    return f'<div class="menu-votes">👍 {vote.get("좋아요", 0)} · 👎 {vote.get("별로", 0)}</div>'
+
+
+def heatmap_html(row_labels, col_labels, values, fmt="{:.0f}"):
+    """2차원 값(NaN 은 빈 칸)을 값이 클수록 진한 표로 (통계 페이지 히트맵)"""
+    finite = [v for row in values for v in row if v == v]
+    low, high = (min(finite), max(finite)) if finite else (0, 0)
+    span = (high - low) or 1
+    header = "".join(f"<th>{label}</th>" for label in col_labels)
+    rows = []
+    for label, row in zip(row_labels, values):
+        cells = []
+        for v in row:
+            if v != v:
+                cells.append("<td></td>")
+                continue
+            alpha = 0.08 + 0.82 * (v - low) / span
+            color = "white" if alpha > 0.55 else "#333"
+            cells.append(f'<td style="background: rgba(102, 126, 234, {alpha:.2f}); color: {color};">'
+                         f'{fmt.format(v)}</td>')
+        rows.append(f"<tr><th>{label}</th>{''.join(cells)}</tr>")
+    return f'<table class="heatmap"><tr><th></th>{header}</tr>{"".join(rows)}</table>'
+
+
+def regular_card_html(menu):
+    """일반 메뉴 카드 전체 (투표/댓글 위젯 제외)"""
+    return (menu_title_html(menu) + menu_image_html(menu) + rating_html(menu)
+            + calories_html(menu) + ingredients_html(menu))
+
+
+def ramen_card_html(menu):
+    html = menu_header_html(menu) + menu_image_html(menu, height=250)
+    if menu.ramen_types:
+        html += item_list_html("라면 종류", menu.ramen_types)
+    if menu.toppings:
+        html += item_list_html("🥚 토핑", menu.toppings)
+    return html
+
+
+def day_menu_html(day_menu, comments=None, votes=None):
+    """하루치 메뉴 페이지 본문 HTML (벤치마크/정적 내보내기용)
+
+    comments: {menu_id: [댓글, ...]}, votes: {menu_id: {"좋아요": n, "별로": n}} (선택)
+    """
+    comments = comments or {}
+    parts = []
+    if day_menu.regular:
+        parts.append("<h3>🍱 메인 메뉴</h3>")
+        for menu in day_menu.regular:
+            parts.append(regular_card_html(menu))
+            if votes is not None:
+                parts.append(vote_counts_html(votes.get(menu.menu_id, {})))
+            parts.extend(comment_html(c) for c in comments.get(menu.menu_id, []))
+    if day_menu.extra:
+        parts.append("<h3>➕ 추가 배식대</h3>")
+        parts.append(menu_image_html(day_menu.extra, height=200))
+        parts.append(extra_station_html(day_menu.extra))
+    if day_menu.ramen:
+        parts.append("<h3>🍜 라면 메뉴</h3>")
+        for menu in day_menu.ramen:
+            parts.append(ramen_card_html(menu))
+            if votes is not None:
+                parts.append(vote_counts_html(votes.get(menu.menu_id, {})))
+    return "".join(parts)
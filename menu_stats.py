@@ -0,0 +1,35 @@
+"""투표 통계 (통계 페이지와 JSON API 에서 공용)"""
+
+
+def menu_name_from_id(menu_id):
+    """메뉴 ID(YYYYMMDD_코너_메뉴명)에서 메뉴명"""
+    return menu_id.split('_')[-1] if '_' in menu_id else menu_id
+
+
+def vote_totals(votes):
+    """(총 좋아요, 총 별로, 총 투표수)"""
+    total_likes = sum(v['좋아요'] for v in votes.values())
+    total_dislikes = sum(v['별로'] for v in votes.values())
+    return total_likes, total_dislikes, total_likes + total_dislikes
+
+
+def menu_scores(votes):
+    """메뉴별 좋아요율 목록 (좋아요율 높은 순)"""
+    scores = []
+    for menu_id, vote_data in votes.items():
+        total = vote_data['좋아요'] + vote_data['별로']
+        if total > 0:
+            scores.append({
+                "menu_id": menu_id,
+                "메뉴": menu_name_from_id(menu_id),
+                "좋아요": vote_data['좋아요'],
+                "별로": vote_data['별로'],
+                "좋아요율": vote_data['좋아요'] / total * 100,
+                "총투표": total
+            })
+    scores.sort(key=lambda x: x['좋아요율'], reverse=True)
+    return scores
+
+
+def top_menus(votes, limit=5):
+    return menu_scores(votes)[:limit]
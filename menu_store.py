@@ -0,0 +1,156 @@
+"""지난 메뉴 저장소 (data/menus.jsonl)
+
+파싱된 DayMenu 를 (식당, 식사 구분, 날짜) 단위로 한 줄씩 추가 저장합니다.
+통계/추이/검색처럼 과거 메뉴가 필요한 기능이 업스트림 대신 여기서 읽습니다.
+
+- 추가 전용 JSON Lines 라서 backfill 도중 중단되어도 이미 쓴 줄은 그대로 남습니다
+  (쓰다 만 마지막 줄은 읽을 때 건너뛰고, 다음에 추가하는 쪽이 쓰기 락을 잡고 잘라냄)
+- 같은 키가 여러 번 있으면 마지막 줄이 유효합니다
+- 메뉴가 없는 날(주말/휴일)도 빈 메뉴로 저장해 다시 조회하지 않습니다
+"""
+import logging
+import threading
+from datetime import datetime
+
+import codec
+from menu_model import DayMenu, LUNCH
+from metrics import timed
+import storage
+from welplus_api import DEFAULT_RESTAURANT_CODE, KST
+
+MENU_STORE_FILE = "menus.jsonl"
+
+logger = logging.getLogger(__name__)
+
+
+class MenuStore:
+    def __init__(self, path=None):
+        self.path = path or storage.DATA_DIR / MENU_STORE_FILE
+        self._lock = threading.Lock()
+        # (식당 코드, 식사 구분, menu_dt) -> 저장된 레코드 (menu 는 DayMenu.to_dict() 형태)
+        self._index = {}
+        # 읽은 위치와 파일 inode (refresh 에서 추가된 줄만 읽기 위해)
+        self._offset = 0
+        self._inode = None
+        self._load()
+
+    @timed("menu_store.load")
+    def _load(self):
+        """offset 부터 끝까지 완성된 줄만 읽음 (파일은 고치지 않음)"""
+        if not self.path.exists():
+            return
+        stat = self.path.stat()
+        good_end = self._offset
+        with open(self.path, 'rb') as f:
+            f.seek(self._offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # 쓰다가 중단된 (또는 다른 프로세스가 쓰는 중인) 마지막 줄 - 다음에 다시 읽음
+                    break
+                good_end += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = codec.json_loads(line)
+                    self._index[(record["restaurant_code"], record["meal_type"], record["menu_dt"])] = record
+                except (ValueError, KeyError, TypeError):
+                    # 깨진 JSON 이나 키가 빠진/잘못된 줄 (예: 배열, 다른 형식의 레코드)
+                    logger.warning("%s: %d 바이트 위치의 읽을 수 없는 줄 건너뜀", self.path, good_end - len(line))
+                    continue
+        self._offset = good_end
+        self._inode = stat.st_ino
+
+    def _catch_up(self):
+        # self._lock 안에서 호출
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            # 지워졌으면 다음에 새로 만드는 파일은 처음부터 씀
+            self._offset, self._inode = 0, None
+            return
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._index = {}
+            self._offset = 0
+        elif stat.st_size == self._offset:
+            return
+        self._load()
+
+    def refresh(self):
+        """다른 프로세스(backfill 등)가 추가한 줄 반영 (compact 로 파일이 바뀌었으면 다시 읽음)"""
+        with self._lock:
+            self._catch_up()
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def version(self):
+        """파일 (mtime_ns, size) - 바뀌었는지 확인용 (없으면 None)"""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def has(self, menu_dt, meal_type=LUNCH, restaurant_code=DEFAULT_RESTAURANT_CODE):
+        return (restaurant_code, meal_type, menu_dt) in self._index
+
+    def get(self, menu_dt, meal_type=LUNCH, restaurant_code=DEFAULT_RESTAURANT_CODE):
+        """저장된 DayMenu (없으면 None)"""
+        record = self._index.get((restaurant_code, meal_type, menu_dt))
+        return None if record is None else DayMenu.from_dict(record["menu"], menu_dt)
+
+    def put_many(self, entries, restaurant_code=DEFAULT_RESTAURANT_CODE):
+        """entries: (meal_type, DayMenu) 목록을 한 번에 추가"""
+        fetched_at = datetime.now(KST).isoformat(timespec="seconds")
+        lines = []
+        records = []
+        for meal_type, day_menu in entries:
+            record = {
+                "restaurant_code": restaurant_code,
+                "meal_type": meal_type,
+                "menu_dt": day_menu.menu_dt,
+                "fetched_at": fetched_at,
+                "menu": day_menu.to_dict(),
+            }
+            records.append(record)
+            lines.append(codec.json_dumps(record) + "\n")
+        if not lines:
+            return
+        # 쓰는 쪽만 프로세스 간 락을 잡고, 다른 프로세스가 추가한 줄을 읽은 뒤에도 남은 불완전한 줄
+        # (락을 잡고 쓰던 프로세스가 중단된 것)을 잘라내고 이어 씀
+        with self._lock, storage.write_locked():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._catch_up()
+            with open(self.path, 'ab') as f:
+                if f.tell() > self._offset:
+                    logger.warning("%s 끝의 불완전한 줄 제거", self.path)
+                    f.truncate(self._offset)
+                data = "".join(lines).encode("utf-8")
+                f.write(data)
+            self._offset += len(data)
+            self._inode = self.path.stat().st_ino
+            for record in records:
+                self._index[(record["restaurant_code"], record["meal_type"], record["menu_dt"])] = record
+
+    def put(self, day_menu, meal_type=LUNCH, restaurant_code=DEFAULT_RESTAURANT_CODE):
+        self.put_many([(meal_type, day_menu)], restaurant_code)
+
+    def items(self):
+        """((식당 코드, 식사 구분, menu_dt), DayMenu) 를 날짜순으로"""
+        for key in sorted(self._index, key=lambda k: (k[2], k[0], k[1])):
+            yield key, DayMenu.from_dict(self._index[key]["menu"], key[2])
+
+    def compact(self):
+        """중복 키를 정리해 파일을 다시 씀 (키마다 마지막 값만 유지)"""
+        with self._lock, storage.write_locked():
+            self._catch_up()
+            tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for key in sorted(self._index, key=lambda k: (k[2], k[0], k[1])):
+                    f.write(codec.json_dumps(self._index[key]) + "\n")
+            tmp_path.replace(self.path)
+            stat = self.path.stat()
+            self._offset, self._inode = stat.st_size, stat.st_ino
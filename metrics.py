@@ -0,0 +1,178 @@
+"""가벼운 시간 측정과 Prometheus 형식 메트릭
+
+주요 함수(WelplusAPI 메서드, load_*/save_*, show_*_page)에 @timed 를 붙여
+호출 수/오류 수/소요 시간 히스토그램을 모으고, 로컬 HTTP 엔드포인트(/metrics)로 내보냅니다.
+
+샘플링 비율(BOB_METRICS_SAMPLE_RATE, 기본 1.0)을 낮추면 나머지 호출은 측정하지 않으므로
+오버헤드가 거의 없습니다. 0 이면 측정을 끕니다. 카운터/히스토그램은 샘플링된 호출 기준입니다.
+"""
+import bisect
+import functools
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 초 단위 히스토그램 버킷 (로컬 I/O ~ 업스트림 타임아웃까지)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRICS_PORT = 9464
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class Registry:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._errors = {}
+
+    def observe(self, name, seconds, error=False):
+        with self._lock:
+            hist = self._histograms.get(name)
+            if hist is None:
+                hist = self._histograms[name] = _Histogram(self.buckets)
+            hist.observe(seconds)
+            if error:
+                self._errors[name] = self._errors.get(name, 0) + 1
+
+    def snapshot(self):
+        """{span: (bucket 누적 전 개수 목록, 합계, 개수, 오류 수)}"""
+        with self._lock:
+            return {
+                name: (list(h.counts), h.total, h.count, self._errors.get(name, 0))
+                for name, h in self._histograms.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._errors.clear()
+
+    def render_prometheus(self):
+        """Prometheus 텍스트 형식 (exposition format 0.0.4)"""
+        lines = [
+            "# HELP bob_span_seconds 구간별 소요 시간 (샘플링된 호출)",
+            "# TYPE bob_span_seconds histogram",
+        ]
+        snapshot = self.snapshot()
+        for name in sorted(snapshot):
+            counts, total, count, _ = snapshot[name]
+            cumulative = 0
+            for bound, c in zip(self.buckets, counts):
+                cumulative += c
+                lines.append(f'bob_span_seconds_bucket{{span="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'bob_span_seconds_bucket{{span="{name}",le="+Inf"}} {count}')
+            lines.append(f'bob_span_seconds_sum{{span="{name}"}} {total:.6f}')
+            lines.append(f'bob_span_seconds_count{{span="{name}"}} {count}')
+
+        lines.append("# HELP bob_span_errors_total 예외로 끝난 호출 수 (샘플링된 호출)")
+        lines.append("# TYPE bob_span_errors_total counter")
+        for name in sorted(snapshot):
+            lines.append(f'bob_span_errors_total{{span="{name}"}} {snapshot[name][3]}')
+
+        lines.append("# HELP bob_metrics_sample_rate 측정 샘플링 비율")
+        lines.append("# TYPE bob_metrics_sample_rate gauge")
+        lines.append(f"bob_metrics_sample_rate {_sample_rate}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+_sample_rate = float(os.environ.get("BOB_METRICS_SAMPLE_RATE", "1.0"))
+
+
+def set_sample_rate(rate):
+    """측정 비율 설정 (0 = 끔, 1 = 모든 호출)"""
+    global _sample_rate
+    _sample_rate = max(0.0, min(1.0, float(rate)))
+
+
+def get_sample_rate():
+    return _sample_rate
+
+
+def _sampled():
+    rate = _sample_rate
+    return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+
+@contextmanager
+def span(name):
+    """with span("이름"): 블록 소요 시간 측정"""
+    if not _sampled():
+        yield
+        return
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except Exception:
+        error = True
+        raise
+    finally:
+        REGISTRY.observe(name, time.perf_counter() - start, error)
+
+
+def timed(name):
+    """함수 소요 시간 측정 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _sampled():
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            error = False
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                # st.rerun() 등 BaseException 기반 제어 흐름은 오류로 세지 않음
+                error = True
+                raise
+            finally:
+                REGISTRY.observe(name, time.perf_counter() - start, error)
+        return wrapper
+    return decorator
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.registry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_metrics_server(port=METRICS_PORT, host="127.0.0.1", registry=REGISTRY):
+    """백그라운드 스레드에서 /metrics 엔드포인트 실행"""
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    return server
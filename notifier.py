@@ -0,0 +1,359 @@
+"""Mattermost 메뉴 알림 (웹훅 일괄 전송)
+
+그날 메뉴를 캐시된 클라이언트로 한 번만 조회/포맷한 뒤, 같은 본문을 여러 웹훅에
+동시에 보냅니다. 웹훅마다 재시도(지터가 있는 지수 백오프, 429 의 Retry-After 반영)합니다.
+
+설정 (.streamlit/secrets.toml):
+
+    [mattermost]
+    webhooks = ["https://chat.example.com/hooks/xxx", "https://chat.example.com/hooks/yyy"]
+    at = "11:20"          # schedule 실행 시각 (KST, 평일)
+    username = "BOB SSAFY"
+
+    python -m notifier send                    # 오늘 메뉴를 지금 전송
+    python -m notifier schedule                # 평일 at 시각마다 전송
+    python -m notifier receive --port 8065     # 로컬 테스트용 웹훅 수신기
+"""
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from metrics import timed
+from resilience import RetryPolicy
+from welplus_api import KST, LUNCH, UpstreamUnavailable
+
+DEFAULT_USERNAME = "BOB SSAFY"
+DEFAULT_SEND_AT = "11:20"
+WEEKDAYS = "월화수목금토일"
+# Retry-After 를 따르더라도 이보다 오래 기다리지 않음
+MAX_RETRY_AFTER = 30.0
+
+logger = logging.getLogger(__name__)
+
+
+def format_menu_message(day_menu):
+    """Mattermost 마크다운 본문"""
+    date = datetime.strptime(day_menu.menu_dt, "%Y%m%d")
+    lines = [f"#### 🍽️ {date.month}월 {date.day}일 ({WEEKDAYS[date.weekday()]}) 점심 메뉴", ""]
+    if not day_menu:
+        lines.append("메뉴 정보가 없습니다.")
+        return "\n".join(lines)
+
+    lines += ["| 코너 | 메뉴 | 칼로리 | 평점 |", "|:--|:--|--:|--:|"]
+    for item in day_menu.items:
+        rating = f"⭐ {item.rating_avg} ({item.rating_count})" if item.rating_count else "-"
+        kcal = f"{item.kcal_label} kcal" if item.kcal is not None else "-"
+        lines.append(f"| {item.corner} | **{item.name}** | {kcal} | {rating} |")
+    if day_menu.extra:
+        lines += ["", f"**추가 배식대**: {', '.join(day_menu.extra.components) or day_menu.extra.name}"]
+    return "\n".join(lines)
+
+
+class DeliveryResult:
+    __slots__ = ("url", "status", "attempts", "error", "elapsed")
+
+    def __init__(self, url, status=None, attempts=0, error=None, elapsed=0.0):
+        self.url = url
+        self.status = status
+        self.attempts = attempts
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.status is not None and 200 <= self.status < 300
+
+    def __repr__(self):
+        return f"DeliveryResult({self.url!r}, status={self.status}, attempts={self.attempts}, error={self.error!r})"
+
+
+def _retry_after(response):
+    """Retry-After (초) 를 0 ~ MAX_RETRY_AFTER 로 제한, 없거나 숫자가 아니면 None"""
+    try:
+        return max(0.0, min(MAX_RETRY_AFTER, float(response.headers.get("Retry-After", ""))))
+    except ValueError:
+        return None
+
+
+class WebhookSender:
+    """같은 본문을 여러 웹훅에 동시에 전송"""
+
+    def __init__(self, max_workers=8, timeout=(3.05, 10), retry=None):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.retry = retry or RetryPolicy(max_attempts=4, base_delay=0.5, max_delay=5.0)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _post(self, url, body):
+        started = time.perf_counter()
+        result = DeliveryResult(url)
+        for attempt in range(self.retry.max_attempts):
+            result.attempts = attempt + 1
+            wait = None
+            try:
+                response = self.session.post(url, data=body, timeout=self.timeout,
+                                             headers={"Content-Type": "application/json"})
+            except (requests.ConnectionError, requests.Timeout) as e:
+                result.error = str(e)
+            except requests.RequestException as e:
+                # 잘못된 URL, 리다이렉트 초과 등은 다시 보내도 같음 -> 이 웹훅만 실패로 기록
+                result.error = str(e)
+                break
+            else:
+                result.status = response.status_code
+                if response.status_code not in self.retry.retry_statuses:
+                    result.error = None if result.ok else response.text[:200]
+                    break
+                result.error = f"HTTP {response.status_code}"
+                if response.status_code == 429:
+                    wait = _retry_after(response)
+
+            if attempt + 1 < self.retry.max_attempts:
+                time.sleep(wait if wait is not None else self.retry.delay(attempt))
+        result.elapsed = time.perf_counter() - started
+        if not result.ok:
+            logger.warning("웹훅 전송 실패 %s: %s", url, result.error)
+        return result
+
+    @timed("notifier.send_all")
+    def send_all(self, urls, payload):
+        """payload(dict)를 urls 전체에 전송하고 DeliveryResult 목록 반환 (중복 URL 은 한 번만)"""
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls)),
+                                thread_name_prefix="webhook") as pool:
+            return list(pool.map(lambda url: self._post(url, body), urls))
+
+    def close(self):
+        self.session.close()
+
+
+class MenuNotifier:
+    """메뉴 조회 -> 포맷 (한 번) -> 웹훅 일괄 전송
+
+    client 는 get_menu(date, meal_type, strict=True) 를 가진 객체 (보통 CachedMenuClient)
+    login 을 주면 메뉴 조회에 실패했을 때 다시 로그인한 뒤 한 번 더 조회합니다 (토큰 만료 대비).
+    """
+
+    def __init__(self, client, webhooks, sender=None, username=DEFAULT_USERNAME, meal_type=LUNCH, login=None):
+        self.client = client
+        self.webhooks = list(webhooks)
+        self.sender = sender or WebhookSender()
+        self.username = username
+        self.meal_type = meal_type
+        self.login = login
+
+    def build_payload(self, date=None):
+        """(DayMenu, payload) - 조회 실패는 빈 메뉴가 아니라 UpstreamUnavailable"""
+        try:
+            day_menu = self.client.get_menu(date, self.meal_type, strict=True)
+        except UpstreamUnavailable as e:
+            if self.login is None:
+                raise
+            logger.warning("메뉴 조회 실패, 다시 로그인 후 재시도: %s", e)
+            if not self.login():
+                raise UpstreamUnavailable("다시 로그인 실패") from e
+            day_menu = self.client.get_menu(date, self.meal_type, strict=True)
+        return day_menu, {"username": self.username, "text": format_menu_message(day_menu)}
+
+    def notify(self, date=None, skip_empty=True):
+        """전송 결과 목록 반환 (메뉴가 없는 날은 skip_empty 면 보내지 않음)
+
+        메뉴 조회에 실패하면 (메뉴 없는 날과 달리) UpstreamUnavailable 을 올림
+        """
+        day_menu, payload = self.build_payload(date)
+        if skip_empty and not day_menu:
+            logger.info("%s 메뉴가 없어 전송하지 않음", day_menu.menu_dt)
+            return []
+        return self.sender.send_all(self.webhooks, payload)
+
+
+def next_run(now, at=DEFAULT_SEND_AT):
+    """now 이후 가장 가까운 평일 at(HH:MM) 시각"""
+    hour, minute = map(int, at.split(":"))
+    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if candidate <= now:
+        candidate += timedelta(days=1)
+    while candidate.weekday() >= 5:
+        candidate += timedelta(days=1)
+    return candidate
+
+
+def run_schedule(notifier, at=DEFAULT_SEND_AT, stop=None):
+    """평일 at 시각마다 notifier.notify() (stop: threading.Event)"""
+    stop = stop or threading.Event()
+    while not stop.is_set():
+        now = datetime.now(KST)
+        target = next_run(now, at)
+        logger.info("다음 전송: %s", target.isoformat())
+        if stop.wait((target - now).total_seconds()):
+            break
+        try:
+            results = notifier.notify(target)
+            logger.info("전송 완료: %d/%d", sum(r.ok for r in results), len(results))
+        except Exception:
+            logger.exception("메뉴 알림 실패")
+
+
+class _ReceiverHandler(BaseHTTPRequestHandler):
+    receiver = None  # start_webhook_receiver 에서 지정
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        status = self.receiver.next_status()
+        if status == 200:
+            with self.receiver.lock:
+                self.receiver.received.append((self.path, json.loads(body)))
+        payload = b"ok" if status == 200 else b"error"
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _ReceiverServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class WebhookReceiver:
+    """로컬 테스트용 Mattermost 웹훅 수신기 (경로와 무관하게 모든 POST 수신)
+
+    fail_rate 비율로 503/429 를 돌려줘 재시도를 확인할 수 있습니다.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, fail_rate=0.0, seed=None):
+        self.fail_rate = fail_rate
+        self.received = []
+        self.lock = threading.Lock()
+        self._rng = random.Random(seed)
+        handler = type("ReceiverHandler", (_ReceiverHandler,), {"receiver": self})
+        self.server = _ReceiverServer((host, port), handler)
+        self.base_url = f"http://{host}:{self.server.server_address[1]}"
+
+    def next_status(self):
+        with self.lock:
+            if self._rng.random() < self.fail_rate:
+                return self._rng.choice((429, 503))
+        return 200
+
+    def url(self, name):
+        return f"{self.base_url}/hooks/{name}"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, name="webhook-receiver", daemon=True).start()
+        return self
+
+    def shutdown(self):
+        self.server.shutdown()
+
+
+def start_webhook_receiver(host="127.0.0.1", port=0, fail_rate=0.0, seed=None):
+    return WebhookReceiver(host, port, fail_rate, seed).start()
+
+
+def load_config(secrets_path=".streamlit/secrets.toml"):
+    """secrets.toml 의 [mattermost]"""
+    import tomllib
+
+    try:
+        with open(secrets_path, 'rb') as f:
+            return dict(tomllib.load(f).get("mattermost", {}))
+    except FileNotFoundError:
+        return {}
+
+
+def _make_notifier(args):
+    from menu_cache import SWRCache, CachedMenuClient
+    from menu_http import load_credentials
+    from welplus_api import WelplusAPI
+
+    config = load_config(args.secrets)
+    webhooks = args.webhook or config.get("webhooks", [])
+    if not webhooks:
+        raise SystemExit("웹훅이 없습니다 ([mattermost] webhooks 또는 --webhook)")
+
+    credentials = load_credentials(args.secrets)
+    api = WelplusAPI(base_url=credentials["base_url"])
+
+    def login():
+        return api.login(credentials.get("username"), credentials.get("password"))
+
+    if not login():
+        raise SystemExit("로그인 실패")
+    # 스케줄 실행 동안 캐시를 유지하므로 같은 날 재전송은 업스트림을 다시 부르지 않음
+    client = CachedMenuClient(api, SWRCache())
+    return MenuNotifier(client, webhooks, username=config.get("username", DEFAULT_USERNAME), login=login), config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    send = sub.add_parser("send", help="메뉴 알림 지금 전송")
+    send.add_argument("--date", help="YYYYMMDD (생략 시 오늘)")
+    schedule = sub.add_parser("schedule", help="평일 정해진 시각에 전송")
+    schedule.add_argument("--at", help="HH:MM (KST)")
+    for p in (send, schedule):
+        p.add_argument("--webhook", action="append", help="웹훅 URL (여러 번 지정 가능)")
+        p.add_argument("--secrets", default=".streamlit/secrets.toml")
+
+    receive = sub.add_parser("receive", help="로컬 테스트용 웹훅 수신기")
+    receive.add_argument("--port", type=int, default=8065)
+    receive.add_argument("--fail-rate", type=float, default=0.0)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    if args.command == "receive":
+        receiver = start_webhook_receiver(port=args.port, fail_rate=args.fail_rate)
+        print(f"웹훅 수신기: {receiver.url('test')}")
+        seen = 0
+        try:
+            while True:
+                time.sleep(0.5)
+                with receiver.lock:
+                    new = receiver.received[seen:]
+                    seen = len(receiver.received)
+                for path, payload in new:
+                    print(f"--- {path}\n{payload.get('text', '')}")
+        except KeyboardInterrupt:
+            pass
+        return
+
+    notifier, config = _make_notifier(args)
+    if args.command == "send":
+        date = datetime.strptime(args.date, "%Y%m%d") if args.date else None
+        for result in notifier.notify(date, skip_empty=False):
+            print(result)
+    else:
+        try:
+            run_schedule(notifier, at=args.at or config.get("at", DEFAULT_SEND_AT))
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
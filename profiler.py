@@ -0,0 +1,122 @@
+"""Streamlit 실행(rerun) 단위 샘플링 프로파일러
+
+대상 스레드의 호출 스택을 일정 간격으로 수집해 collapsed stack 형식
+("a;b;c 횟수" 한 줄씩)으로 저장합니다. speedscope(https://www.speedscope.app)나
+flamegraph.pl 에 그대로 넣어 플레임그래프로 볼 수 있습니다.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_INTERVAL = 0.005
+# 보관할 최근 실행 수 (초과분은 오래된 것부터 삭제)
+MAX_PROFILES = 200
+INDEX_FILE = "runs.jsonl"
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class SamplingProfiler:
+    def __init__(self, thread_id=None, interval=DEFAULT_INTERVAL):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        stack = []
+        while frame is not None:
+            stack.append(_frame_label(frame))
+            frame = frame.f_back
+        self.stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def collapsed(self):
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+@contextmanager
+def profile_run(out_dir, label="run", interval=DEFAULT_INTERVAL):
+    """with 블록 실행을 프로파일링해 out_dir 에 .collapsed 파일과 색인을 남김"""
+    out_dir = Path(out_dir)
+    profiler = SamplingProfiler(interval=interval)
+    started = time.perf_counter()
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        duration = time.perf_counter() - started
+        _save(out_dir, label, duration, profiler)
+
+
+def _save(out_dir, label, duration, profiler):
+    out_dir.mkdir(parents=True, exist_ok=True)
+    now = datetime.now()
+    name = f"{now:%Y%m%d-%H%M%S-%f}_{label}.collapsed"
+    with open(out_dir / name, 'w', encoding='utf-8') as f:
+        f.write(profiler.collapsed())
+
+    entry = {
+        "file": name,
+        "label": label,
+        "started_at": now.isoformat(timespec="seconds"),
+        "duration_ms": round(duration * 1000, 1),
+        "samples": profiler.samples,
+    }
+    with open(out_dir / INDEX_FILE, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    _prune(out_dir)
+
+
+def _prune(out_dir, keep=MAX_PROFILES):
+    files = sorted(out_dir.glob("*.collapsed"))
+    for old in files[:-keep]:
+        old.unlink(missing_ok=True)
+    if len(files) > keep:
+        # 색인도 남아 있는 파일만 유지
+        entries = [e for e in _read_index(out_dir) if (out_dir / e["file"]).exists()]
+        with open(out_dir / INDEX_FILE, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(e, ensure_ascii=False) + "\n" for e in entries)
+
+
+def _read_index(out_dir):
+    index = Path(out_dir) / INDEX_FILE
+    if not index.exists():
+        return []
+    with open(index, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def slowest_runs(out_dir, limit=20, recent=MAX_PROFILES):
+    """최근 recent 개 실행 중 느린 순으로 limit 개"""
+    entries = _read_index(out_dir)[-recent:]
+    entries = [e for e in entries if (Path(out_dir) / e["file"]).exists()]
+    return sorted(entries, key=lambda e: e["duration_ms"], reverse=True)[:limit]
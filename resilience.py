@@ -0,0 +1,112 @@
+"""업스트림 호출 안정화 도구 (재시도/서킷 브레이커/요청 속도 제한)"""
+import random
+import threading
+import time
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출을 바로 거절함"""
+
+
+class RetryPolicy:
+    """지터가 있는 지수 백오프 재시도 정책
+
+    delay(n) = min(max_delay, base_delay * 2**n) 범위 안에서 균등 분포 (full jitter)
+    """
+
+    def __init__(self, max_attempts=3, base_delay=0.2, max_delay=2.0, retry_statuses=(429, 500, 502, 503, 504)):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def delay(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def sleep(self, attempt):
+        time.sleep(self.delay(attempt))
+
+
+class CircuitBreaker:
+    """연속 실패가 쌓이면 일정 시간 호출을 차단
+
+    closed -> (failure_threshold 연속 실패) -> open -> (reset_timeout 경과) -> half-open
+    half-open 상태에서는 시험 호출 하나만 통과시키고, 성공하면 closed, 실패하면 다시 open
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self):
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def _refresh(self):
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+
+    def allow(self):
+        """호출 가능 여부 (half-open 에서는 시험 호출 1회만 허용)"""
+        with self._lock:
+            self._refresh()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._probe_in_flight = False
+
+
+class RateLimiter:
+    """토큰 버킷 요청 속도 제한 (초당 rate 개, 최대 burst 개까지 몰아서 허용)
+
+    여러 스레드가 같은 인스턴스를 공유하면 합산 속도가 rate 를 넘지 않습니다.
+    """
+
+    def __init__(self, rate, burst=1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+
+    def acquire(self):
+        """토큰 하나를 쓸 수 있을 때까지 대기"""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 토큰을 미리 빼 두고 (음수 가능) 부족한 만큼 잠 - 대기 순서대로 시간이 배정됨
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
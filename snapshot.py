@@ -0,0 +1,232 @@
+"""날짜별 메뉴를 정적 HTML/JSON 으로 내보내기
+
+점심시간에 보는 사람마다 Streamlit 세션을 띄우지 않도록, 메뉴/평점/투표/댓글을
+정적 파일로 만들어 아무 웹 서버나 CDN 에서 서빙할 수 있게 합니다.
+
+    out/
+      index.html, index.json        날짜 목록
+      20260202.html, 20260202.json  날짜별 페이지
+      manifest.json                 날짜별 입력 지문 (증분 생성용)
+
+날짜마다 입력(메뉴, 그날 메뉴의 투표/댓글)의 지문을 manifest.json 에 남기고,
+지문이 바뀐 날짜만 다시 씁니다. --watch 로 주기적으로 돌리면 바뀐 파일만 갱신됩니다.
+메뉴 조회에 실패한 날짜는 건너뛰어 이미 내보낸 페이지를 그대로 둡니다 (빈 메뉴로 덮어쓰지 않음).
+
+    python -m snapshot --out site --days 7
+    python -m snapshot --out site --watch 30
+"""
+import argparse
+import hashlib
+import html
+import json
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import storage
+from cold_archive import ColdArchive, merge_comments, merge_votes
+from menu_render import MENU_CSS, day_menu_html
+from metrics import timed
+from welplus_api import KST, LUNCH, UpstreamUnavailable, to_menu_dt
+
+MANIFEST_FILE = "manifest.json"
+
+logger = logging.getLogger(__name__)
+# 페이지 틀(템플릿)을 바꾸면 올려서 전체 재생성
+TEMPLATE_VERSION = 1
+WEEKDAYS = "월화수목금토일"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>{css}</style>
+</head>
+<body style="max-width: 960px; margin: 0 auto; padding: 1rem; font-family: sans-serif;">
+<p class="main-header">{title}</p>
+{nav}
+{body}
+<p style="color: #999; font-size: 0.8rem;">생성: {generated_at}</p>
+</body>
+</html>
+"""
+
+
+def _write_atomic(path, data):
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _dumps(data):
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def _date_title(menu_dt):
+    date = datetime.strptime(menu_dt, "%Y%m%d")
+    return f"{date.month}월 {date.day}일 ({WEEKDAYS[date.weekday()]}) 점심 메뉴"
+
+
+def _escape_comments(comments):
+    # 정적 페이지는 외부에 그대로 노출되므로 사용자 입력은 이스케이프
+    return {
+        menu_id: [dict(c, author=html.escape(c["author"]), text=html.escape(c["text"])) for c in items]
+        for menu_id, items in comments.items()
+    }
+
+
+def snapshot_data(day_menu, votes, comments):
+    """날짜별 JSON 내용 (그날 메뉴에 해당하는 투표/댓글만)"""
+    menu_ids = [item.menu_id for item in day_menu.items]
+    return dict(
+        day_menu.to_dict(),
+        date=day_menu.menu_dt,
+        votes={m: votes[m] for m in menu_ids if m in votes},
+        comments={m: comments[m] for m in menu_ids if m in comments},
+    )
+
+
+def render_page(day_menu, data, nav=""):
+    if day_menu:
+        body = day_menu_html(day_menu, _escape_comments(data["comments"]), data["votes"])
+    else:
+        body = "<p>메뉴 정보가 없습니다.</p>"
+    return PAGE_TEMPLATE.format(
+        title=_date_title(day_menu.menu_dt), css=MENU_CSS, nav=nav, body=body,
+        generated_at=datetime.now(KST).strftime("%Y-%m-%d %H:%M"),
+    )
+
+
+def render_index(dates):
+    links = "".join(f'<li><a href="{d}.html">{_date_title(d)}</a></li>' for d in dates)
+    return PAGE_TEMPLATE.format(
+        title="BOB SSAFY 메뉴", css=MENU_CSS, nav="", body=f"<ul>{links}</ul>",
+        generated_at=datetime.now(KST).strftime("%Y-%m-%d %H:%M"),
+    )
+
+
+class SnapshotExporter:
+    """client: get_menu(date, meal_type) 를 가진 객체 (보통 CachedMenuClient)"""
+
+    def __init__(self, client, out_dir, meal_type=LUNCH, archive=None):
+        self.client = client
+        self.out_dir = Path(out_dir)
+        self.meal_type = meal_type
+        self.archive = archive or ColdArchive()
+        # 직전 export 에서 메뉴 조회에 실패한 날짜 (menu_dt)
+        self.failed = []
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self):
+        try:
+            with open(self.out_dir / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if manifest.get("template_version") != TEMPLATE_VERSION:
+            return {}
+        return manifest.get("dates", {})
+
+    def _save_manifest(self):
+        data = {"template_version": TEMPLATE_VERSION, "dates": self.manifest}
+        _write_atomic(self.out_dir / MANIFEST_FILE, json.dumps(data, indent=2).encode("utf-8"))
+
+    @timed("snapshot.export")
+    def export(self, dates, force=False):
+        """dates 를 내보내고 다시 쓴 날짜(menu_dt) 목록 반환"""
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        votes = storage.load_votes()
+        comments = storage.load_comments()
+
+        written = []
+        self.failed = []
+        for date in dates:
+            try:
+                day_menu = self.client.get_menu(date, self.meal_type, strict=True)
+            except UpstreamUnavailable as e:
+                logger.warning("메뉴 조회 실패, 기존 페이지 유지 (%s): %s", to_menu_dt(date), e)
+                self.failed.append(to_menu_dt(date))
+                continue
+            menu_dt = day_menu.menu_dt
+            # 보관된 지난 날짜는 그날 세그먼트 내용과 합침
+            data = snapshot_data(day_menu, merge_votes(self.archive.votes_on(menu_dt), votes),
+                                 merge_comments(self.archive.comments_on(menu_dt), comments))
+            payload = _dumps(data)
+            fingerprint = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+            html_path = self.out_dir / f"{menu_dt}.html"
+            if not force and self.manifest.get(menu_dt) == fingerprint and html_path.exists():
+                continue
+
+            nav = '<p><a href="index.html">← 날짜 목록</a></p>'
+            _write_atomic(html_path, render_page(day_menu, data, nav).encode("utf-8"))
+            _write_atomic(self.out_dir / f"{menu_dt}.json", payload.encode("utf-8"))
+            self.manifest[menu_dt] = fingerprint
+            written.append(menu_dt)
+
+        index_missing = not (self.out_dir / "index.html").exists()
+        if written or index_missing:
+            all_dates = sorted(self.manifest, reverse=True)
+            _write_atomic(self.out_dir / "index.html", render_index(all_dates).encode("utf-8"))
+            _write_atomic(self.out_dir / "index.json", _dumps({"dates": all_dates}).encode("utf-8"))
+            self._save_manifest()
+        return written
+
+
+def default_dates(now=None, days=7):
+    """이번 주 월요일부터 days 일 중 평일"""
+    now = now or datetime.now(KST)
+    monday = now - timedelta(days=now.weekday())
+    return [monday + timedelta(days=i) for i in range(days) if (monday + timedelta(days=i)).weekday() < 5]
+
+
+def main():
+    from menu_cache import SWRCache, CachedMenuClient
+    from menu_http import load_credentials
+    from welplus_api import WelplusAPI
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default="site")
+    parser.add_argument("--days", type=int, default=7, help="이번 주 월요일부터 며칠")
+    parser.add_argument("--watch", type=float, help="N 초마다 다시 확인 (바뀐 날짜만 갱신)")
+    parser.add_argument("--force", action="store_true", help="지문과 관계없이 모두 다시 생성")
+    parser.add_argument("--secrets", default=".streamlit/secrets.toml")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    credentials = load_credentials(args.secrets)
+    api = WelplusAPI(base_url=credentials["base_url"])
+
+    def login():
+        return api.login(credentials.get("username"), credentials.get("password"))
+
+    if not login():
+        parser.exit(1, "로그인 실패\n")
+
+    exporter = SnapshotExporter(CachedMenuClient(api, SWRCache()), args.out)
+    force = args.force
+    while True:
+        started = time.perf_counter()
+        written = exporter.export(default_dates(days=args.days), force=force)
+        force = False
+        print(f"{datetime.now(KST):%H:%M:%S} 갱신 {len(written)}개 {written} "
+              + (f"조회 실패 {exporter.failed} " if exporter.failed else "")
+              + f"({(time.perf_counter() - started) * 1000:.0f}ms)")
+        if not args.watch:
+            break
+        time.sleep(args.watch)
+        if exporter.failed:
+            # 토큰 만료일 수 있으므로 다시 로그인 (실패하면 다음 주기에 다시 시도)
+            try:
+                login()
+            except UpstreamUnavailable as e:
+                logger.warning("다시 로그인 실패: %s", e)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""투표/댓글/게시판 데이터 저장소 (data/ 디렉토리의 JSON 파일)
+
+파일 형식은 codec 모듈의 코덱으로 고릅니다 (BOB_STORAGE_CODEC 환경 변수 / set_codec, 기본 json-pretty).
+읽을 때는 내용을 보고 형식을 고르므로 코덱을 바꿔도 기존 파일을 그대로 읽습니다
+(pickle 파일만은 저장 코덱이 pickle 일 때만 읽음).
+"""
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import codec
+from metrics import timed
+
+try:
+    import fcntl
+except ImportError:  # Windows - 프로세스 간 락 없이 프로세스 안 락만 사용
+    fcntl = None
+
+# 데이터 저장 디렉토리 (BOB_DATA_DIR 환경 변수로 변경 가능)
+DATA_DIR = Path(os.environ.get("BOB_DATA_DIR", "data"))
+DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+# Streamlit 세션들은 한 프로세스의 스레드로 실행되므로,
+# 읽기-수정-쓰기(add_*)를 이 락으로 묶어 동시 투표/댓글이 서로 덮어쓰지 않게 함
+_write_lock = threading.RLock()
+# cron 으로 도는 cold_archive 같은 다른 프로세스와는 이 파일의 flock 으로 배제
+WRITE_LOCK_FILE = ".write.lock"
+_lock_file = None
+_lock_depth = 0
+
+# 투표 이벤트 로그 (시각 기록, vote_rollup 의 시간대/요일 집계 원본)
+VOTE_EVENTS_FILE = "vote_events.jsonl"
+_KST = timezone(timedelta(hours=9))
+
+# 저장 코덱 (읽기는 형식 자동 판별)
+_codec = codec.get_codec(os.environ.get("BOB_STORAGE_CODEC", codec.DEFAULT_CODEC))
+
+# add_vote 직후 (쓰기 락 안에서) 호출되는 콜백 - 통계 인덱스 증분 갱신용
+# callback(menu_id, field, version_before, version_after)
+_vote_listeners = []
+
+
+def set_codec(name):
+    """저장 코덱 변경 (이전 코덱 이름 반환) - 다음 저장부터 적용"""
+    global _codec
+    previous = _codec.name
+    _codec = codec.get_codec(name)
+    return previous
+
+def _read_json(name, default):
+    path = DATA_DIR / name
+    if path.exists():
+        with open(path, 'rb') as f:
+            # pickle 파일은 저장 코덱이 pickle 일 때만 읽음 (직접 쓴 파일이라고 볼 수 있을 때)
+            return codec.decode(f.read(), allow=(_codec.name,))
+    return default
+
+def _write_json(name, data):
+    """임시 파일에 쓴 뒤 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)"""
+    path = DATA_DIR / name
+    tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(_codec.encode(data))
+    os.replace(tmp_path, path)
+
+def data_version(name):
+    """파일 변경 여부 확인용 (mtime_ns, 크기), 파일이 없으면 None"""
+    try:
+        stat = (DATA_DIR / name).stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+@contextmanager
+def write_locked():
+    """add_* 와 같은 쓰기 락 - 스레드 간(RLock) + 프로세스 간(flock), 같은 스레드에서 중첩 가능"""
+    global _lock_file, _lock_depth
+    with _write_lock:
+        if _lock_depth == 0 and fcntl is not None:
+            _lock_file = open(DATA_DIR / WRITE_LOCK_FILE, 'a')
+            fcntl.flock(_lock_file, fcntl.LOCK_EX)
+        _lock_depth += 1
+        try:
+            yield
+        finally:
+            _lock_depth -= 1
+            if _lock_depth == 0 and _lock_file is not None:
+                fcntl.flock(_lock_file, fcntl.LOCK_UN)
+                _lock_file.close()
+                _lock_file = None
+
+@timed("storage.load_votes")
+def load_votes():
+    """투표 데이터 로드"""
+    return _read_json("votes.json", {})
+
+@timed("storage.save_votes")
+def save_votes(votes):
+    """투표 데이터 저장"""
+    _write_json("votes.json", votes)
+
+@timed("storage.load_comments")
+def load_comments():
+    """댓글 데이터 로드"""
+    return _read_json("comments.json", {})
+
+@timed("storage.save_comments")
+def save_comments(comments):
+    """댓글 데이터 저장"""
+    _write_json("comments.json", comments)
+
+@timed("storage.load_board_posts")
+def load_board_posts():
+    """게시판 글 로드"""
+    return _read_json("board.json", [])
+
+@timed("storage.save_board_posts")
+def save_board_posts(posts):
+    """게시판 글 저장"""
+    _write_json("board.json", posts)
+
+
+def _append_vote_event(menu_id, field):
+    """투표 시각 기록 (add_vote 의 쓰기 락 안에서 호출)"""
+    event = {"ts": datetime.now(_KST).isoformat(timespec="seconds"), "menu_id": menu_id, "field": field}
+    with open(DATA_DIR / VOTE_EVENTS_FILE, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+@timed("storage.add_vote")
+def add_vote(menu_id, field):
+    """투표 1건 반영 (field: "좋아요" / "별로"), 반영 후 해당 메뉴 투표 수 반환"""
+    with write_locked():
+        votes = load_votes()
+        current_votes = votes.setdefault(menu_id, {"좋아요": 0, "별로": 0})
+        current_votes[field] += 1
+        version_before = data_version("votes.json")
+        save_votes(votes)
+        version_after = data_version("votes.json")
+        _append_vote_event(menu_id, field)
+        for callback in _vote_listeners:
+            callback(menu_id, field, version_before, version_after)
+        return current_votes
+
+def add_vote_listener(callback):
+    """add_vote 마다 호출할 콜백 등록"""
+    with _write_lock:
+        _vote_listeners.append(callback)
+
+@timed("storage.add_menu_comment")
+def add_menu_comment(menu_id, comment):
+    """메뉴 댓글 1건 추가 (comment: author/text/timestamp)"""
+    with write_locked():
+        comments = load_comments()
+        comments.setdefault(menu_id, []).append(comment)
+        save_comments(comments)
+
+@timed("storage.add_board_post")
+def add_board_post(post):
+    """게시글 추가 (id 는 여기서 부여), 저장된 글 반환"""
+    with write_locked():
+        posts = load_board_posts()
+        post = dict(post, id=len(posts))
+        post.setdefault("comments", [])
+        posts.insert(0, post)
+        save_board_posts(posts)
+        return post
+
+@timed("storage.add_board_comment")
+def add_board_comment(post_id, comment):
+    """게시글 댓글 추가 (글이 없으면 False)"""
+    with write_locked():
+        posts = load_board_posts()
+        for post in posts:
+            if post["id"] == post_id:
+                post.setdefault("comments", []).append(comment)
+                save_board_posts(posts)
+                return True
+        return False
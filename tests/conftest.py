@@ -0,0 +1,38 @@
+"""테스트 공용 설정
+
+storage 는 import 할 때 data/ 를 만들므로, 저장소의 data/ 를 건드리지 않도록
+어떤 모듈보다 먼저 BOB_DATA_DIR 을 임시 디렉토리로 바꿔 둡니다.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+os.environ["BOB_DATA_DIR"] = tempfile.mkdtemp(prefix="bob-test-")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+import storage
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """테스트마다 빈 data/ 디렉토리"""
+    monkeypatch.setattr(storage, "DATA_DIR", tmp_path)
+    return tmp_path
+
+
+class FakeClock:
+    """now 를 직접 옮기는 시계 (clock=time.monotonic 대신)"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
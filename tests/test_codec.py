@@ -0,0 +1,74 @@
+import pytest
+
+import codec
+import storage
+
+SAMPLE = {
+    "20260202_한식_불고기": {"좋아요": 3, "별로": 1},
+    "comments": [{"author": "익명", "text": "맛있어요 \"진짜\"\n", "ts": "2026-02-02T12:00:00"}],
+    "empty": {},
+    "numbers": [0, -1, 2 ** 40, 1.5],
+    "flags": [True, False, None],
+}
+
+
+@pytest.mark.parametrize("name", list(codec.CODECS))
+def test_round_trip(name):
+    c = codec.get_codec(name)
+    data = c.encode(SAMPLE)
+    assert isinstance(data, bytes)
+    assert c.decode(data) == SAMPLE
+    # 형식 자동 판별로도 같은 값
+    assert codec.decode(data, allow=(name,)) == SAMPLE
+
+
+def test_json_codecs_are_plain_json():
+    for name, c in codec.CODECS.items():
+        if not c.binary:
+            assert not c.encode(SAMPLE).startswith(codec.MAGIC)
+            assert codec.decode(c.encode(SAMPLE)) == SAMPLE
+
+
+def test_json_helpers():
+    assert codec.json_loads(codec.json_dumps(SAMPLE)) == SAMPLE
+    assert codec.json_loads(codec.json_bytes(SAMPLE)) == SAMPLE
+    assert "\n" not in codec.json_dumps(SAMPLE)
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        codec.get_codec("nope")
+    with pytest.raises(ValueError):
+        codec.decode(codec.MAGIC + b"?payload")
+
+
+def test_pickle_requires_allow():
+    data = codec.get_codec("pickle").encode(SAMPLE)
+    with pytest.raises(ValueError):
+        codec.decode(data)
+    assert codec.decode(data, allow=("pickle",)) == SAMPLE
+
+
+@pytest.mark.parametrize("name", list(codec.CODECS))
+def test_storage_switching_codec_keeps_reading_old_files(data_dir, name):
+    previous = storage.set_codec("json-pretty")
+    try:
+        storage.save_votes(SAMPLE)
+        storage.set_codec(name)
+        assert storage.load_votes() == SAMPLE
+        storage.save_votes(SAMPLE)
+        assert storage.load_votes() == SAMPLE
+    finally:
+        storage.set_codec(previous)
+
+
+def test_storage_reads_pickle_only_when_configured(data_dir):
+    previous = storage.set_codec("pickle")
+    try:
+        storage.save_votes(SAMPLE)
+        assert storage.load_votes() == SAMPLE
+        storage.set_codec("json")
+        with pytest.raises(ValueError):
+            storage.load_votes()
+    finally:
+        storage.set_codec(previous)
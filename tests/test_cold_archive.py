@@ -0,0 +1,163 @@
+import copy
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+import cold_archive
+import storage
+from cold_archive import ColdArchive, merge_comments
+
+TODAY = date(2026, 6, 30)
+# hot_days=30 -> 20260531 이전 메뉴가 보관 대상 (4월, 5월 두 달 세그먼트)
+HOT_DAYS = 30
+
+VOTES = {
+    "20260415_한식_불고기": {"좋아요": 3, "별로": 1},
+    "20260416_양식_파스타": {"좋아요": 2, "별로": 2},
+    "20260520_한식_비빔밥": {"좋아요": 5, "별로": 0},
+    "20260625_일품_돈까스": {"좋아요": 1, "별로": 4},
+    "공지_메뉴": {"좋아요": 1, "별로": 0},
+}
+COMMENTS = {
+    "20260415_한식_불고기": [{"author": "a", "text": "맛있어요", "ts": "2026-04-15T12:00:00"}],
+    "20260520_한식_비빔밥": [{"author": "b", "text": "짜요", "ts": "2026-05-20T12:00:00"}],
+    "20260625_일품_돈까스": [{"author": "c", "text": "바삭", "ts": "2026-06-25T12:00:00"}],
+}
+
+
+class Crash(Exception):
+    pass
+
+
+@pytest.fixture
+def archive(data_dir):
+    storage.save_votes(copy.deepcopy(VOTES))
+    storage.save_comments(copy.deepcopy(COMMENTS))
+    return ColdArchive(root=data_dir / "cold")
+
+
+def all_comments(archive):
+    merged = {}
+    for month in archive.months("comments"):
+        merged = merge_comments(merged, archive.segment("comments", month))
+    return merge_comments(merged, storage.load_comments())
+
+
+def assert_nothing_lost_or_doubled(archive, votes=VOTES, comments=COMMENTS):
+    assert archive.merged_votes(storage.load_votes()) == votes
+    assert all_comments(archive) == comments
+    assert not (archive.root / cold_archive.PENDING_FILE).exists()
+
+
+def test_archive_moves_old_entries(archive):
+    moved = archive.archive(HOT_DAYS, TODAY)
+    assert moved == {"votes": 3, "comments": 2}
+    assert set(storage.load_votes()) == {"20260625_일품_돈까스", "공지_메뉴"}
+    assert archive.months("votes") == ["202604", "202605"]
+    assert archive.vote("20260415_한식_불고기") == VOTES["20260415_한식_불고기"]
+    assert archive.comments("20260520_한식_비빔밥") == COMMENTS["20260520_한식_비빔밥"]
+    assert_nothing_lost_or_doubled(archive)
+
+    # 다시 실행해도 옮길 것이 없음
+    assert archive.archive(HOT_DAYS, TODAY) == {"votes": 0, "comments": 0}
+    assert_nothing_lost_or_doubled(archive)
+
+
+def test_recover_after_crash_during_hot_rewrite(archive, monkeypatch):
+    # votes.json 은 고쳤지만 comments.json 을 쓰기 전에 중단 (hot_done 은 votes 만)
+    def crash(comments):
+        raise Crash()
+
+    with monkeypatch.context() as m, pytest.raises(Crash):
+        m.setattr(storage, "save_comments", crash)
+        archive.archive(HOT_DAYS, TODAY)
+    assert "20260415_한식_불고기" not in storage.load_votes()
+    assert archive.months("votes") == []
+
+    assert ColdArchive(root=archive.root).recover()
+    assert_nothing_lost_or_doubled(archive)
+
+
+def test_recover_after_crash_between_segment_writes(archive, monkeypatch):
+    # hot 파일은 고쳤고, 세그먼트를 하나 쓴 뒤 중단
+    write_atomic = cold_archive._write_atomic
+    segments = []
+
+    def crash_on_second_segment(path, data):
+        if path.name.endswith(".json.gz"):
+            segments.append(path.name)
+            if len(segments) == 2:
+                raise Crash()
+        write_atomic(path, data)
+
+    with monkeypatch.context() as m, pytest.raises(Crash):
+        m.setattr(cold_archive, "_write_atomic", crash_on_second_segment)
+        archive.archive(HOT_DAYS, TODAY)
+    assert len(list(archive.root.glob("*.json.gz"))) == 1
+
+    assert ColdArchive(root=archive.root).recover()
+    # 이미 쓴 세그먼트에는 다시 더하지 않음
+    assert_nothing_lost_or_doubled(archive)
+
+
+def test_recover_after_segments_before_pending_removed(archive, monkeypatch):
+    unlink = Path.unlink
+
+    def crash_on_pending(path, *args, **kwargs):
+        if path.name == cold_archive.PENDING_FILE:
+            raise Crash()
+        return unlink(path, *args, **kwargs)
+
+    with monkeypatch.context() as m, pytest.raises(Crash):
+        m.setattr(Path, "unlink", crash_on_pending)
+        archive.archive(HOT_DAYS, TODAY)
+
+    assert ColdArchive(root=archive.root).recover()
+    assert_nothing_lost_or_doubled(archive)
+
+
+def test_votes_added_after_crash_are_kept(archive, monkeypatch):
+    def crash(votes):
+        raise Crash()
+
+    with monkeypatch.context() as m, pytest.raises(Crash):
+        m.setattr(storage, "save_votes", crash)
+        archive.archive(HOT_DAYS, TODAY)
+
+    # 복구 전에 보관 대상 메뉴에 새 투표 - 보관한 값은 세그먼트로, 새 투표만 hot 에 남음
+    storage.add_vote("20260415_한식_불고기", "좋아요")
+    assert archive.recover()
+    assert storage.load_votes()["20260415_한식_불고기"] == {"좋아요": 1, "별로": 0}
+
+    expected = copy.deepcopy(VOTES)
+    expected["20260415_한식_불고기"] = {"좋아요": 4, "별로": 1}
+    assert archive.merged_votes(storage.load_votes()) == expected
+
+    # 다음 보관에서 세그먼트로 합쳐도 그대로
+    archive.archive(HOT_DAYS, TODAY)
+    assert archive.vote("20260415_한식_불고기") == {"좋아요": 4, "별로": 1}
+    assert archive.merged_votes(storage.load_votes()) == expected
+
+
+def test_comments_added_after_partial_hot_rewrite_are_kept(archive, monkeypatch):
+    def crash(comments):
+        raise Crash()
+
+    with monkeypatch.context() as m, pytest.raises(Crash):
+        m.setattr(storage, "save_comments", crash)
+        archive.archive(HOT_DAYS, TODAY)
+
+    # votes.json 은 이미 고쳤으므로 새 투표는 그대로 두고, comments.json 은 보관한 댓글만 뺌
+    storage.add_vote("20260415_한식_불고기", "별로")
+    comment = {"author": "d", "text": "또 먹고 싶다", "ts": "2026-07-01T12:00:00"}
+    storage.add_menu_comment("20260415_한식_불고기", comment)
+    assert archive.recover()
+    assert storage.load_votes()["20260415_한식_불고기"] == {"좋아요": 0, "별로": 1}
+    assert storage.load_comments()["20260415_한식_불고기"] == [comment]
+
+    expected_votes = copy.deepcopy(VOTES)
+    expected_votes["20260415_한식_불고기"] = {"좋아요": 3, "별로": 2}
+    expected_comments = copy.deepcopy(COMMENTS)
+    expected_comments["20260415_한식_불고기"].append(comment)
+    assert_nothing_lost_or_doubled(archive, expected_votes, expected_comments)
@@ -0,0 +1,165 @@
+import threading
+from datetime import datetime
+
+import pytest
+
+from menu_cache import CachedMenuClient, SWRCache
+from menu_model import DayMenu, MenuItem
+from welplus_api import UpstreamUnavailable
+
+
+@pytest.fixture
+def cache(clock):
+    return SWRCache(soft_ttl=10, hard_ttl=100, clock=clock, prune_interval=50)
+
+
+def fail():
+    raise UpstreamUnavailable("업스트림 장애")
+
+
+def revalidate(cache, key, loader):
+    """오래된 값을 받은 뒤 백그라운드 갱신이 끝날 때까지 대기"""
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_loader():
+        started.set()
+        release.wait(5)
+        return loader()
+
+    value = cache.get(key, blocking_loader)
+    assert started.wait(5)
+    future = cache._inflight[key]
+    release.set()
+    future.exception(5)
+    return value
+
+
+def test_fresh_value_skips_loader(cache, clock):
+    assert cache.get("k", lambda: 1) == 1
+    clock.now = 9
+    assert cache.get("k", fail) == 1
+
+
+def test_stale_value_kept_when_revalidation_fails(cache, clock):
+    cache.get("k", lambda: "good")
+    clock.now = 20
+    assert revalidate(cache, "k", fail) == "good"
+    # 실패는 저장되지 않으므로 계속 이전 값을 주고, 다음 조회에서 다시 갱신 시도
+    assert cache.peek("k") == "good"
+    assert revalidate(cache, "k", lambda: "new") == "good"
+    assert cache.get("k", fail) == "new"
+
+
+def test_expired_value_with_failing_loader_raises(cache, clock):
+    cache.get("k", lambda: "good")
+    clock.now = 100
+    with pytest.raises(UpstreamUnavailable):
+        cache.get("k", fail)
+
+
+def test_concurrent_misses_load_once(cache):
+    calls = []
+    release = threading.Event()
+
+    def slow_loader():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("k", slow_loader))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    release.set()
+    for t in threads:
+        t.join(5)
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+
+
+def test_store_prunes_expired_entries(cache, clock):
+    cache.put("old", 1)
+    clock.now = 60
+    cache.put("new", 2)
+    assert len(cache) == 2  # 아직 hard_ttl 전
+
+    clock.now = 110
+    cache.put("newer", 3)
+    assert cache.peek("old") is None
+    assert "old" not in cache._entries
+    assert len(cache) == 2
+
+
+DAY = datetime(2026, 2, 2)
+
+
+class FakeAPI:
+    def __init__(self):
+        self.fail = False
+
+    def get_menu(self, date=None, meal_type="2", restaurant_code="R", strict=False):
+        if self.fail:
+            if strict:
+                raise UpstreamUnavailable("업스트림 장애")
+            return DayMenu.empty("20260202")
+        item = MenuItem.from_meal({"menuName": "냉면", "menuCourseName": "한식"}, "20260202")
+        return DayMenu.from_items("20260202", [item])
+
+
+def test_client_keeps_stale_menu_on_failure(cache, clock):
+    api = FakeAPI()
+    client = CachedMenuClient(api, cache)
+    menu = client.get_menu(DAY)
+    assert menu.items
+
+    api.fail = True
+    clock.now = 20
+    assert client.get_menu(DAY) is menu
+    future = cache._inflight.get(("menu", "REST000595", "20260202", "2"))
+    if future is not None:
+        future.exception(5)
+    # 실패한 갱신이 빈 메뉴로 덮어쓰지 않음
+    assert cache.peek(("menu", "REST000595", "20260202", "2")) is menu
+    assert client.get_menu(DAY) is menu
+
+
+def test_client_without_cache_returns_lenient_result_or_raises_when_strict(cache):
+    api = FakeAPI()
+    api.fail = True
+    client = CachedMenuClient(api, cache)
+    assert not client.get_menu(DAY)
+    with pytest.raises(UpstreamUnavailable):
+        client.get_menu(DAY, strict=True)
+    assert len(cache) == 0
+
+
+@pytest.fixture
+def stub(tmp_path):
+    import welplus_stub
+
+    welplus_stub.synthesize([datetime(2031, 3, 3), datetime(2031, 3, 4)], tmp_path)
+    server = welplus_stub.start_stub_server(welplus_stub.StubConfig(tmp_path))
+    yield server
+    server.shutdown()
+
+
+def test_range_does_not_cache_failed_dates(stub, cache):
+    from resilience import RetryPolicy
+    from welplus_api import WelplusAPI
+
+    api = WelplusAPI(base_url=stub.base_url, retry=RetryPolicy(max_attempts=1))
+    assert api.login("user", "password")
+    client = CachedMenuClient(api, cache)
+
+    stub.config.error_rate = 1.0
+    menus = {dt: m for dt, _, m in client.get_menus(datetime(2031, 3, 3), datetime(2031, 3, 4))}
+    assert set(menus) == {"20310303", "20310304"}
+    assert not any(menus.values())
+    assert len(cache) == 0
+
+    # 업스트림이 돌아오면 다음 기간 조회는 실제 메뉴 (빈 메뉴가 캐시되어 있지 않음)
+    stub.config.error_rate = 0.0
+    menus = {dt: m for dt, _, m in client.get_menus(datetime(2031, 3, 3), datetime(2031, 3, 4))}
+    assert all(menu.items for menu in menus.values())
+    assert cache.peek(("menu", "REST000595", "20310303", "2")) is menus["20310303"]
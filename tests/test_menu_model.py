@@ -0,0 +1,30 @@
+import pytest
+
+from menu_model import DINNER, LUNCH, MenuItem, build_day_menu, select_meals
+
+MEAL = {"courseTxt": "한식", "menuName": "불고기", "sumKcal": "850", "subMenuTxt": "밥,국"}
+
+
+@pytest.mark.parametrize("upstream_type", [None, "2", 2])
+def test_lunch_menu_id_unchanged(upstream_type):
+    meal = dict(MEAL, menuMealType=upstream_type)
+    assert MenuItem.from_meal(meal, "20260202").menu_id == "20260202_한식_불고기"
+    assert MenuItem.from_meal(meal, "20260202", meal_type=LUNCH).menu_id == "20260202_한식_불고기"
+
+
+@pytest.mark.parametrize("upstream_type", [None, "3", 3, 2])
+def test_requested_meal_type_wins(upstream_type):
+    meal = dict(MEAL, menuMealType=upstream_type)
+    assert MenuItem.from_meal(meal, "20260202", meal_type=DINNER).menu_id == "20260202_석식-한식_불고기"
+
+
+def test_int_meal_type_from_upstream():
+    assert MenuItem.from_meal(dict(MEAL, menuMealType=3), "20260202").menu_id == "20260202_석식-한식_불고기"
+    assert MenuItem.from_meal(MEAL, "20260202", meal_type=3).menu_id == "20260202_석식-한식_불고기"
+
+
+def test_build_day_menu_uses_requested_meal_type():
+    meals = [dict(MEAL, menuMealType=2), dict(MEAL, courseTxt="양식", menuName="파스타", menuMealType=2)]
+    selected = select_meals(meals)
+    lunch = build_day_menu("20260202", selected, [None] * len(selected), LUNCH)
+    assert [item.menu_id for item in lunch.items] == ["20260202_한식_불고기", "20260202_양식_파스타"]
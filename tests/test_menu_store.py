@@ -0,0 +1,23 @@
+from menu_model import DayMenu, MenuItem
+from menu_store import MenuStore
+
+
+def _day_menu(menu_dt):
+    item = MenuItem.from_meal({"menuName": "냉면", "menuCourseName": "한식"}, menu_dt)
+    return DayMenu.from_items(menu_dt, [item])
+
+
+def test_malformed_lines_are_skipped(data_dir):
+    store = MenuStore()
+    store.put_many([("2", _day_menu("20260202"))])
+    with open(store.path, "ab") as f:
+        f.write(b"{broken\n")
+        f.write(b'{"menu_dt": "20260203"}\n')
+        f.write(b"[1, 2]\n")
+        f.write(b'{"restaurant_code": "R", "meal_type": "2", "menu_dt": ["20260204"]}\n')
+    store.put_many([("2", _day_menu("20260205"))])
+
+    reloaded = MenuStore()
+    assert len(reloaded) == 2
+    assert reloaded.has("20260202", "2") and reloaded.has("20260205", "2")
+    assert reloaded.get("20260205", "2").items[0].name == "냉면"
@@ -0,0 +1,122 @@
+import pytest
+
+from resilience import CircuitBreaker, RetryPolicy
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(failure_threshold=3, reset_timeout=10.0, clock=clock)
+
+
+def test_opens_after_consecutive_failures(breaker):
+    for _ in range(2):
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_success_resets_failure_count(breaker):
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_allows_single_probe(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 9.9
+    assert not breaker.allow()
+
+    clock.now = 10.0
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    # 시험 호출이 끝나기 전에는 다른 호출을 막음
+    assert not breaker.allow()
+    assert not breaker.allow()
+
+
+def test_probe_success_closes(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 10.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow() and breaker.allow()
+
+
+def test_probe_failure_reopens(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 10.0
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    # 다시 연 시각부터 reset_timeout 이 지나야 다음 시험 호출
+    clock.now = 19.9
+    assert not breaker.allow()
+    clock.now = 20.0
+    assert breaker.allow()
+
+
+def test_retry_delay_bounds(monkeypatch):
+    policy = RetryPolicy(base_delay=0.2, max_delay=1.0)
+    monkeypatch.setattr("random.uniform", lambda low, high: high)
+    assert [policy.delay(n) for n in range(5)] == [0.2, 0.4, 0.8, 1.0, 1.0]
+    monkeypatch.setattr("random.uniform", lambda low, high: low)
+    assert policy.delay(3) == 0
+
+
+class FailingSession:
+    """요청마다 정해 둔 예외를 내거나 응답을 돌려주는 requests 세션 대용"""
+
+    def __init__(self, result):
+        self.result = result
+
+    def get(self, url, **kwargs):
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def _api(breaker, result):
+    from welplus_api import WelplusAPI
+
+    api = WelplusAPI(base_url="http://upstream.test", retry=RetryPolicy(max_attempts=1), breaker=breaker)
+    api.token = "token"
+    api.session = FailingSession(result)
+    return api
+
+
+def test_half_open_probe_released_on_any_request_error(breaker, clock):
+    import requests
+
+    api = _api(breaker, requests.exceptions.ChunkedEncodingError("끊긴 응답"))
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 10.0
+    assert api.fetch_meal_data("20990101") is None
+    # 시험 호출 실패가 기록되어 다시 open (반열림에 갇히지 않음)
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now = 20.0
+    assert breaker.allow()
+
+
+def test_non_json_200_is_a_failed_fetch(breaker):
+    import requests
+    from welplus_api import UpstreamUnavailable
+
+    response = requests.Response()
+    response.status_code = 200
+    response._content = "<html>점검 중</html>".encode("utf-8")
+    api = _api(breaker, response)
+    assert api.fetch_meal_data("20990102") is None
+    with pytest.raises(UpstreamUnavailable):
+        api.get_menu_rating("20990102", "1", "AA", "2", "REST000595", strict=True)
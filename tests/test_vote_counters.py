@@ -0,0 +1,65 @@
+import random
+
+import numpy as np
+
+from menu_stats import top_menus
+from vote_counters import VoteCounters
+
+
+def _votes(rng, n=300):
+    corners = ["한식", "양식", "일품", "샐러드"]
+    votes = {}
+    for i in range(n):
+        dt = f"2026{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"
+        votes[f"{dt}_{rng.choice(corners)}_메뉴{rng.randint(0, 40)}"] = {
+            "좋아요": rng.randint(0, 20), "별로": rng.randint(0, 20)}
+    votes["날짜없는메뉴"] = {"좋아요": 3, "별로": 1}
+    return votes
+
+
+def test_round_trip():
+    votes = _votes(random.Random(0))
+    counters = VoteCounters.from_votes(votes)
+    assert len(counters) == len(votes)
+    assert counters.to_votes() == votes
+    for menu_id, vote in votes.items():
+        assert menu_id in counters
+        assert counters.get(menu_id) == vote
+    assert counters.get("20260101_없는_메뉴") is None
+
+
+def test_intern_is_stable_and_grows():
+    counters = VoteCounters(capacity=2)
+    ids = [counters.intern(f"202603{d:02d}_한식_메뉴") for d in range(1, 20)]
+    assert ids == list(range(19))
+    assert [counters.intern(f"202603{d:02d}_한식_메뉴") for d in range(1, 20)] == ids
+    assert [counters.menu_id(i) for i in ids] == [f"202603{d:02d}_한식_메뉴" for d in range(1, 20)]
+
+
+def test_add_matches_dict():
+    rng = random.Random(1)
+    votes = _votes(rng, n=50)
+    counters = VoteCounters.from_votes(votes)
+    new_ids = [f"202612{d:02d}_양식_새메뉴" for d in range(1, 10)]
+    for _ in range(300):
+        menu_id = rng.choice(list(votes) + new_ids)
+        field = rng.choice(["좋아요", "별로"])
+        vote = votes.setdefault(menu_id, {"좋아요": 0, "별로": 0})
+        vote[field] += 1
+        assert counters.add(menu_id, field) == vote
+    assert counters.to_votes() == votes
+
+
+def test_totals_period_and_top_match_dict():
+    votes = _votes(random.Random(2))
+    counters = VoteCounters.from_votes(votes)
+    likes = sum(v["좋아요"] for v in votes.values())
+    dislikes = sum(v["별로"] for v in votes.values())
+    assert counters.totals() == (likes, dislikes, likes + dislikes)
+
+    ids = counters.ids_between("20260301", "20260331")
+    expected = sorted(m for m in votes if "20260301" <= m[:8] <= "20260331" and m[:8].isdigit())
+    assert sorted(counters.menu_id(i) for i in ids) == expected
+    assert np.all(np.diff(counters.dates()[ids]) >= 0)
+
+    assert counters.top(10) == top_menus(votes, 10)
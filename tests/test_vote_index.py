@@ -0,0 +1,86 @@
+import random
+from datetime import date
+
+import numpy as np
+import pytest
+
+from vote_index import FenwickTree, VoteIndex, parse_menu_id
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 16, 37])
+def test_fenwick_range_matches_naive_sum(n):
+    rng = np.random.default_rng(n)
+    values = rng.integers(0, 50, size=(n, 3, 2))
+    tree = FenwickTree(values)
+    assert len(tree) == n
+    for lo in range(n + 1):
+        for hi in range(lo, n + 1):
+            np.testing.assert_array_equal(tree.range(lo, hi), values[lo:hi].sum(axis=0))
+
+
+def test_fenwick_add_matches_naive_sum():
+    rng = np.random.default_rng(1)
+    values = rng.integers(0, 50, size=(23, 2, 2))
+    tree = FenwickTree(values)
+    for _ in range(200):
+        i = int(rng.integers(0, len(values)))
+        delta = rng.integers(0, 5, size=(2, 2))
+        values[i] += delta
+        tree.add(i, delta)
+        lo, hi = sorted(int(x) for x in rng.integers(0, len(values) + 1, size=2))
+        np.testing.assert_array_equal(tree.range(lo, hi), values[lo:hi].sum(axis=0))
+
+
+def test_parse_menu_id():
+    assert parse_menu_id("20260202_한식_불고기") == (date(2026, 2, 2), "한식")
+    assert parse_menu_id("20260230_한식_불고기") is None
+    assert parse_menu_id("menu_한식") is None
+
+
+def _votes(rng, days=40, corners=("한식", "양식", "일품")):
+    votes = {}
+    for d in range(days):
+        day = date(2026, 3, 1).toordinal() + d
+        dt = date.fromordinal(day).strftime("%Y%m%d")
+        for corner in rng.sample(corners, rng.randint(0, len(corners))):
+            votes[f"{dt}_{corner}_메뉴{d}"] = {"좋아요": rng.randint(0, 9), "별로": rng.randint(0, 9)}
+    # 날짜가 아닌 ID 는 기간 집계에서 빠짐
+    votes["공지_한식_메뉴"] = {"좋아요": 100, "별로": 0}
+    return votes
+
+
+def _naive(votes, start, end):
+    likes = dislikes = 0
+    for menu_id, vote in votes.items():
+        key = parse_menu_id(menu_id)
+        if key and start <= key[0] <= end:
+            likes += vote["좋아요"]
+            dislikes += vote["별로"]
+    return likes, dislikes, likes + dislikes
+
+
+def test_index_totals_match_naive_sum():
+    rng = random.Random(0)
+    votes = _votes(rng)
+    index = VoteIndex(votes)
+    for _ in range(100):
+        start = date(2026, 2, 20).toordinal() + rng.randint(0, 60)
+        end = start + rng.randint(-3, 30)
+        start, end = date.fromordinal(start), date.fromordinal(end)
+        assert index.totals(start, end) == _naive(votes, start, end)
+
+
+def test_index_incremental_add_matches_rebuild():
+    rng = random.Random(1)
+    votes = _votes(rng)
+    index = VoteIndex(votes)
+    menu_ids = [m for m in votes if parse_menu_id(m)]
+    for _ in range(50):
+        menu_id = rng.choice(menu_ids)
+        field = rng.choice(["좋아요", "별로"])
+        votes[menu_id][field] += 1
+        assert index.add(menu_id, field)
+    rebuilt = VoteIndex(votes)
+    assert index.totals() == rebuilt.totals()
+    assert index.by_corner() == rebuilt.by_corner()
+    assert index.totals("20260310", "20260320") == rebuilt.totals("20260310", "20260320")
@@ -0,0 +1,179 @@
+"""메뉴 ID 인턴 테이블 + 배열 기반 투표 수
+
+votes.json 의 {"YYYYMMDD_코너_메뉴명": {"좋아요": n, "별로": m}} 는 메뉴마다
+긴 문자열 키와 작은 dict 하나씩을 메모리에 올립니다. 여기서는
+
+- 메뉴 ID 를 날짜(YYYYMMDD 정수)와 나머지("코너_메뉴명")로 나누고, 나머지는 날짜 간에 반복되므로 사전 인코딩
+- (날짜 << 24 | 나머지 코드) 정수 키를 정렬 배열에 두고 searchsorted 로 찾음 -> 메뉴 ID 마다 문자열/dict 없음
+- 메뉴마다 추가된 순서대로 0, 1, 2 ... 정수 번호를 붙이고, 좋아요/별로 수는 그 번호로 찾는 int32 배열
+
+로 저장해 메뉴당 약 30바이트만 씁니다. 합계/좋아요율 순위/기간 조회는 배열 연산으로 처리합니다.
+저장 형식(votes.json)은 그대로이고, to_votes() 로 같은 dict 를 다시 만들 수 있습니다.
+"""
+import numpy as np
+
+from menu_stats import menu_name_from_id
+
+FIELDS = ("좋아요", "별로")
+REST_BITS = 24
+_REST_MASK = (1 << REST_BITS) - 1
+
+
+def split_menu_id(menu_id):
+    """메뉴 ID -> (YYYYMMDD 정수, 나머지), 날짜로 시작하지 않으면 (0, 메뉴 ID 전체)"""
+    if len(menu_id) > 9 and menu_id[8] == "_" and menu_id[:8].isdigit():
+        return int(menu_id[:8]), menu_id[9:]
+    return 0, menu_id
+
+
+def _to_dt(value):
+    """YYYYMMDD 문자열 / date / datetime -> YYYYMMDD 정수"""
+    if isinstance(value, str):
+        return int(value)
+    return value.year * 10000 + value.month * 100 + value.day
+
+
+class VoteCounters:
+    def __init__(self, capacity=1024):
+        # 나머지("코너_메뉴명") 사전
+        self.rests = []
+        self._rest_codes = {}
+        # 번호 -> 키 (추가 순서), 그리고 키 정렬 순서의 (키, 번호) - 찾기/기간 조회용
+        self.keys = np.zeros(capacity, dtype=np.int64)
+        self.sorted_keys = np.zeros(0, dtype=np.int64)
+        self.sorted_ids = np.zeros(0, dtype=np.int32)
+        self.counts = np.zeros((capacity, len(FIELDS)), dtype=np.int32)
+        self.size = 0
+
+    @classmethod
+    def from_votes(cls, votes):
+        """votes.json dict 에서 한 번에 생성 (votes 의 순서가 번호 순서)"""
+        counters = cls(capacity=max(len(votes), 1))
+        keys = np.fromiter((counters._key(menu_id) for menu_id in votes), dtype=np.int64, count=len(votes))
+        counters.keys[:len(keys)] = keys
+        for f, field in enumerate(FIELDS):
+            counters.counts[:len(keys), f] = np.fromiter(
+                (vote.get(field, 0) for vote in votes.values()), dtype=np.int32, count=len(votes))
+        counters.size = len(keys)
+        order = np.argsort(keys, kind="stable")
+        counters.sorted_keys = keys[order]
+        counters.sorted_ids = order.astype(np.int32)
+        return counters
+
+    def _key(self, menu_id):
+        dt, rest = split_menu_id(menu_id)
+        code = self._rest_codes.get(rest)
+        if code is None:
+            code = self._rest_codes[rest] = len(self.rests)
+            self.rests.append(rest)
+        return (dt << REST_BITS) | code
+
+    def _find_key(self, key):
+        pos = np.searchsorted(self.sorted_keys, key)
+        if pos < len(self.sorted_keys) and self.sorted_keys[pos] == key:
+            return int(self.sorted_ids[pos])
+        return None
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, menu_id):
+        return self.lookup(menu_id) is not None
+
+    def lookup(self, menu_id):
+        """메뉴 ID -> 번호 (없으면 None)"""
+        dt, rest = split_menu_id(menu_id)
+        code = self._rest_codes.get(rest)
+        if code is None:
+            return None
+        return self._find_key((dt << REST_BITS) | code)
+
+    def intern(self, menu_id):
+        """메뉴 ID -> 번호 (없으면 새로 추가)"""
+        key = self._key(menu_id)
+        found = self._find_key(key)
+        if found is not None:
+            return found
+        if self.size == len(self.keys):
+            # 배열을 두 배로 늘림 (추가는 평균 O(1), 정렬 배열 삽입은 하루 몇 건이라 O(n) 도 충분)
+            self.keys = np.resize(self.keys, 2 * self.size)
+            self.counts = np.concatenate([self.counts, np.zeros_like(self.counts)])
+        new_id = self.size
+        self.keys[new_id] = key
+        self.size += 1
+        pos = np.searchsorted(self.sorted_keys, key)
+        self.sorted_keys = np.insert(self.sorted_keys, pos, key)
+        self.sorted_ids = np.insert(self.sorted_ids, pos, new_id)
+        return new_id
+
+    def menu_id(self, i):
+        """번호 -> 메뉴 ID"""
+        key = int(self.keys[i])
+        dt, rest = key >> REST_BITS, self.rests[key & _REST_MASK]
+        return f"{dt}_{rest}" if dt else rest
+
+    def add(self, menu_id, field, count=1):
+        """투표 반영 후 해당 메뉴 투표 수 dict 반환"""
+        i = self.intern(menu_id)
+        self.counts[i, FIELDS.index(field)] += count
+        return self._vote(i)
+
+    def _vote(self, i):
+        return {field: int(self.counts[i, f]) for f, field in enumerate(FIELDS)}
+
+    def get(self, menu_id):
+        """메뉴 투표 수 dict (없으면 None)"""
+        i = self.lookup(menu_id)
+        return None if i is None else self._vote(i)
+
+    def to_votes(self):
+        """votes.json 형식 dict 로 변환"""
+        return {self.menu_id(i): self._vote(i) for i in range(self.size)}
+
+    def dates(self):
+        """번호별 YYYYMMDD 정수 배열 (날짜 없는 ID 는 0)"""
+        return self.keys[:self.size] >> REST_BITS
+
+    def rest_codes(self):
+        """번호별 나머지("코너_메뉴명") 코드 배열"""
+        return self.keys[:self.size] & _REST_MASK
+
+    def ids_between(self, start=None, end=None):
+        """기간 [start, end] 메뉴 번호 (날짜순) - 정렬된 키에서 searchsorted"""
+        lo = 0 if start is None else np.searchsorted(self.sorted_keys, _to_dt(start) << REST_BITS)
+        hi = (len(self.sorted_keys) if end is None
+              else np.searchsorted(self.sorted_keys, (_to_dt(end) + 1) << REST_BITS))
+        return self.sorted_ids[lo:hi]
+
+    def totals(self, ids=None):
+        """(총 좋아요, 총 별로, 총 투표수)"""
+        counts = self.counts[:self.size] if ids is None else self.counts[ids]
+        likes, dislikes = (int(x) for x in counts.sum(axis=0, dtype=np.int64))
+        return likes, dislikes, likes + dislikes
+
+    def top(self, limit=5, ids=None):
+        """좋아요율 높은 순 메뉴 목록 (menu_stats.top_menus 와 같은 형식)"""
+        ids = np.arange(self.size) if ids is None else np.sort(ids)
+        counts = self.counts[ids].astype(np.int64)
+        total = counts.sum(axis=1)
+        voted = total > 0
+        ids, counts, total = ids[voted], counts[voted], total[voted]
+        rate = counts[:, 0] / total * 100
+        # 같은 좋아요율이면 먼저 추가된 메뉴가 앞 (top_menus 의 안정 정렬과 같은 순서)
+        order = np.argsort(-rate, kind="stable")[:limit]
+        result = []
+        for j in order:
+            menu_id = self.menu_id(ids[j])
+            result.append({
+                "menu_id": menu_id,
+                "메뉴": menu_name_from_id(menu_id),
+                "좋아요": int(counts[j, 0]),
+                "별로": int(counts[j, 1]),
+                "좋아요율": float(rate[j]),
+                "총투표": int(total[j]),
+            })
+        return result
+
+    def nbytes(self):
+        """배열이 쓰는 바이트 수 (나머지 사전 제외)"""
+        return self.keys.nbytes + self.sorted_keys.nbytes + self.sorted_ids.nbytes + self.counts.nbytes
@@ -0,0 +1,233 @@
+"""기간별 투표 통계 인덱스
+
+votes.json 을 날짜(일) x 코너 단위로 묶어 펜윅 트리(누적 합 트리)에 담아 두고
+"A일 ~ B일 좋아요/별로 합계"를 기간 길이와 관계없이 O(log 일수)로 답합니다.
+새 투표는 트리에 바로 더하므로(O(log 일수)) 투표마다 votes.json 을 다시 훑지 않습니다.
+메뉴별 투표 수는 vote_counters.VoteCounters 배열로 들고 있어 기간 TOP 도 배열 연산으로 구합니다.
+
+메뉴 ID 는 "YYYYMMDD_코너_메뉴명" 형식이라 날짜/코너를 ID 에서 읽습니다.
+(코너 이름의 공백은 ID 에서 "_" 로 바뀌므로 코너는 첫 단어까지만 구분됩니다)
+"""
+import threading
+from datetime import date, datetime
+
+import numpy as np
+
+import storage
+from vote_counters import FIELDS, VoteCounters
+
+VOTES_FILE = "votes.json"
+
+
+def parse_menu_id(menu_id):
+    """메뉴 ID -> (date, 코너), 날짜로 시작하지 않으면 None"""
+    parts = menu_id.split("_", 2)
+    if len(parts) < 2 or len(parts[0]) != 8 or not parts[0].isdigit():
+        return None
+    dt = parts[0]
+    try:
+        # strptime 보다 빠름 (인덱스를 만들 때 메뉴 ID 마다 호출)
+        day = date(int(dt[:4]), int(dt[4:6]), int(dt[6:]))
+    except ValueError:
+        return None
+    return day, parts[1]
+
+
+def to_date(value):
+    """YYYYMMDD 문자열 / date / datetime -> date"""
+    if isinstance(value, str):
+        return datetime.strptime(value, "%Y%m%d").date()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _to_datetime64(dts):
+    """YYYYMMDD 정수 배열 -> datetime64[D] 배열 (날짜가 아니면 NaT)"""
+    year, month, day = dts // 10000, dts // 100 % 100, dts % 100
+    valid = (year >= 1970) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= 31)
+    months = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+    days = months.astype("datetime64[D]") + (day - 1).astype("timedelta64[D]")
+    # 2월 30일처럼 다음 달로 넘어가는 날짜도 제외
+    valid &= days.astype("datetime64[M]") == months
+    return np.where(valid, days, np.datetime64("NaT"))
+
+
+class FenwickTree:
+    """행 단위 누적 합 트리 (행 하나에 더하기 / 앞 i 행의 합 모두 O(log n))
+
+    values: (n, ...) 배열 - 각 행은 같은 모양의 벡터 (여기서는 코너 x 좋아요/별로)
+    """
+
+    def __init__(self, values):
+        n = len(values)
+        prefix = np.zeros((n + 1,) + values.shape[1:], dtype=np.int64)
+        np.cumsum(values, axis=0, out=prefix[1:])
+        # tree[i] = i 를 끝으로 하는 길이 lowbit(i) 구간의 합 (누적 합의 차로 한 번에 계산)
+        idx = np.arange(1, n + 1)
+        self.tree = np.zeros_like(prefix)
+        self.tree[1:] = prefix[idx] - prefix[idx - (idx & -idx)]
+
+    def __len__(self):
+        return len(self.tree) - 1
+
+    def add(self, i, delta):
+        """i 번째 행(0부터)에 delta 더하기"""
+        i += 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i):
+        """앞 i 개 행의 합"""
+        total = np.zeros(self.tree.shape[1:], dtype=np.int64)
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def range(self, lo, hi):
+        """[lo, hi) 행의 합"""
+        return self.prefix(hi) - self.prefix(lo)
+
+
+class VoteIndex:
+    """votes(dict) 의 날짜 x 코너 투표 수 인덱스
+
+    메뉴별 투표 수는 VoteCounters(인턴된 메뉴 ID + 배열)로 들고, 트리는 그 배열에서 한 번에 만듭니다.
+    """
+
+    def __init__(self, votes):
+        self.counters = VoteCounters.from_votes(votes)
+        counters = self.counters
+
+        # 나머지("코너_메뉴명") 코드 -> 코너 코드
+        rest_corners = [rest.split("_", 1)[0] for rest in counters.rests]
+        self.corners = sorted(set(rest_corners))
+        self._corner_idx = {corner: i for i, corner in enumerate(self.corners)}
+        rest_corner_idx = np.array([self._corner_idx[c] for c in rest_corners], dtype=np.int64)
+
+        days = _to_datetime64(counters.dates())
+        dated = ~np.isnat(days)
+        if not dated.any():
+            self.origin = None
+            self.tree = FenwickTree(np.zeros((0, len(self.corners), len(FIELDS)), dtype=np.int64))
+            return
+        first, last = days[dated].min(), days[dated].max()
+        self.origin = first.item()
+        self._last = last.item()
+        values = np.zeros(((last - first).astype(int) + 1, len(self.corners), len(FIELDS)), dtype=np.int64)
+        day_idx = (days[dated] - first).astype(np.int64)
+        corner_idx = rest_corner_idx[counters.rest_codes()[dated]]
+        np.add.at(values, (day_idx, corner_idx), counters.counts[:len(counters)][dated])
+        self.tree = FenwickTree(values)
+
+    @property
+    def first_date(self):
+        return self.origin
+
+    @property
+    def last_date(self):
+        return None if self.origin is None else self._last
+
+    def _bounds(self, start, end):
+        """[start, end] (포함) -> 트리 행 구간 [lo, hi)"""
+        lo = 0 if start is None else (to_date(start) - self.origin).days
+        hi = len(self.tree) if end is None else (to_date(end) - self.origin).days + 1
+        return max(lo, 0), min(max(hi, 0), len(self.tree))
+
+    def _range(self, start, end):
+        if self.origin is None:
+            return np.zeros((len(self.corners), len(FIELDS)), dtype=np.int64)
+        lo, hi = self._bounds(start, end)
+        if lo >= hi:
+            return np.zeros(self.tree.tree.shape[1:], dtype=np.int64)
+        return self.tree.range(lo, hi)
+
+    def totals(self, start=None, end=None):
+        """기간 (좋아요, 별로, 총투표) - start/end 생략 시 전체"""
+        likes, dislikes = (int(x) for x in self._range(start, end).sum(axis=0))
+        return likes, dislikes, likes + dislikes
+
+    def by_corner(self, start=None, end=None):
+        """기간 코너별 투표 목록 (총투표 많은 순, 투표 없는 코너 제외)"""
+        counts = self._range(start, end)
+        result = []
+        for corner, (likes, dislikes) in zip(self.corners, counts.tolist()):
+            total = likes + dislikes
+            if total:
+                result.append({"코너": corner, "좋아요": likes, "별로": dislikes, "총투표": total,
+                               "좋아요율": likes / total * 100})
+        result.sort(key=lambda x: x["총투표"], reverse=True)
+        return result
+
+    def _ids(self, start, end):
+        if self.origin is None:
+            return np.zeros(0, dtype=np.int32)
+        return self.counters.ids_between(to_date(start or self.origin), to_date(end or self._last))
+
+    def menu_ids(self, start=None, end=None):
+        """기간에 해당하는 메뉴 ID (날짜순)"""
+        return [self.counters.menu_id(i) for i in self._ids(start, end)]
+
+    def top_menus(self, start=None, end=None, limit=5):
+        """기간 내 메뉴 중 좋아요율 TOP (menu_stats.top_menus 와 같은 형식)"""
+        return self.counters.top(limit, self._ids(start, end))
+
+    def add(self, menu_id, field, count=1):
+        """투표 반영 - 날짜 범위/코너가 새로 늘어나 다시 만들어야 하면 False"""
+        self.counters.add(menu_id, field, count)
+        key = parse_menu_id(menu_id)
+        if key is None:
+            return True
+        day, corner = key
+        if self.origin is None or corner not in self._corner_idx:
+            return False
+        row = (day - self.origin).days
+        if not 0 <= row < len(self.tree):
+            return False
+        delta = np.zeros(self.tree.tree.shape[1:], dtype=np.int64)
+        delta[self._corner_idx[corner], FIELDS.index(field)] = count
+        self.tree.add(row, delta)
+        return True
+
+
+class VoteIndexCache:
+    """votes.json 이 바뀌면 인덱스를 다시 만들고, 이 프로세스의 투표는 증분 반영
+
+        cache = VoteIndexCache(archive=ColdArchive())
+        storage.add_vote_listener(cache.on_vote)
+        index = cache.get()
+
+    archive(cold_archive.ColdArchive)를 주면 보관된 지난 투표도 합쳐서 만듭니다
+    (보관 작업은 votes.json 도 바꾸므로 버전 확인은 그대로 votes.json 만 봄)
+    """
+
+    def __init__(self, archive=None):
+        self.archive = archive
+        self._lock = threading.Lock()
+        self._index = None
+        self._version = None
+
+    def get(self):
+        with self._lock:
+            version = storage.data_version(VOTES_FILE)
+            if self._index is None or version != self._version:
+                # 버전을 먼저 읽고 로드 -> 사이에 바뀌었으면 다음 get 에서 다시 만듦
+                votes = storage.load_votes()
+                if self.archive is not None:
+                    votes = self.archive.merged_votes(votes)
+                self._index = VoteIndex(votes)
+                self._version = version
+            return self._index
+
+    def on_vote(self, menu_id, field, version_before, version_after):
+        """storage.add_vote 직후 호출 (쓰기 락 안) - 인덱스가 직전 파일 기준이면 바로 더함"""
+        with self._lock:
+            if self._index is None or self._version != version_before:
+                return
+            if self._index.add(menu_id, field):
+                self._version = version_after
+            else:
+                self._index = None
+
@@ -0,0 +1,128 @@
+"""투표 시간대 x 요일 x 코너 집계
+
+storage.add_vote 가 남기는 투표 이벤트 로그(data/vote_events.jsonl)를 읽어
+(시각 0~23시, 요일 월~일, 코너, 좋아요/별로) 투표 수 격자에 더해 둡니다.
+읽은 위치와 격자를 data/vote_rollup.json 에 저장하므로, 다음에는 새로 추가된 이벤트만 읽습니다.
+통계 페이지의 히트맵은 이벤트를 다시 훑지 않고 이 격자만 읽습니다.
+
+시각 기록 전에 쌓인 투표(votes.json 만 있는 투표)는 집계에 포함되지 않습니다.
+"""
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+
+import numpy as np
+
+import storage
+from metrics import timed
+from vote_index import FIELDS, parse_menu_id
+
+ROLLUP_FILE = "vote_rollup.json"
+HOURS = 24
+WEEKDAYS = "월화수목금토일"
+
+logger = logging.getLogger(__name__)
+
+
+class VoteRollup:
+    def __init__(self, events_path=None, rollup_path=None):
+        self.events_path = events_path or storage.DATA_DIR / storage.VOTE_EVENTS_FILE
+        self.rollup_path = rollup_path or storage.DATA_DIR / ROLLUP_FILE
+        self._lock = threading.Lock()
+        self._reset()
+        self._load()
+
+    def _reset(self):
+        self.corners = []
+        self._corner_idx = {}
+        self.grid = np.zeros((HOURS, len(WEEKDAYS), 0, len(FIELDS)), dtype=np.int64)
+        self._offset = 0
+        self._inode = None
+
+    def _load(self):
+        try:
+            with open(self.rollup_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        self.corners = data["corners"]
+        self._corner_idx = {corner: i for i, corner in enumerate(self.corners)}
+        self.grid = np.array(data["grid"], dtype=np.int64).reshape(
+            HOURS, len(WEEKDAYS), len(self.corners), len(FIELDS))
+        self._offset = data["offset"]
+        self._inode = data["inode"]
+
+    def _save(self):
+        data = {"offset": self._offset, "inode": self._inode, "corners": self.corners,
+                "grid": self.grid.ravel().tolist()}
+        tmp_path = self.rollup_path.with_name(f".{self.rollup_path.name}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.rollup_path)
+
+    def _corner(self, corner):
+        idx = self._corner_idx.get(corner)
+        if idx is None:
+            idx = self._corner_idx[corner] = len(self.corners)
+            self.corners.append(corner)
+            self.grid = np.concatenate(
+                [self.grid, np.zeros(self.grid.shape[:2] + (1, len(FIELDS)), dtype=np.int64)], axis=2)
+        return idx
+
+    @timed("vote_rollup.refresh")
+    def refresh(self):
+        """이벤트 로그에 새로 추가된 투표를 격자에 반영 (반영한 건수 반환)"""
+        try:
+            stat = self.events_path.stat()
+        except FileNotFoundError:
+            return 0
+        with self._lock:
+            if stat.st_ino != self._inode or stat.st_size < self._offset:
+                # 로그가 새로 만들어졌으면 처음부터 다시 집계
+                self._reset()
+            elif stat.st_size == self._offset:
+                return 0
+
+            hours, weekdays, corners, fields = [], [], [], []
+            good_end = self._offset
+            with open(self.events_path, 'rb') as f:
+                f.seek(self._offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    good_end += len(line)
+                    try:
+                        event = json.loads(line)
+                        ts = datetime.fromisoformat(event["ts"])
+                        field = FIELDS.index(event["field"])
+                        key = parse_menu_id(event["menu_id"])
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        # 깨진 줄 / 필드가 빠졌거나 형식이 다른 이벤트 (한 줄 때문에 집계가 멈추지 않도록)
+                        logger.warning("%s: 읽을 수 없는 이벤트 건너뜀", self.events_path)
+                        continue
+                    hours.append(ts.hour)
+                    weekdays.append(ts.weekday())
+                    corners.append(self._corner(key[1] if key else ""))
+                    fields.append(field)
+
+            if hours:
+                np.add.at(self.grid, (hours, weekdays, corners, fields), 1)
+            self._offset = good_end
+            self._inode = stat.st_ino
+            self._save()
+            return len(hours)
+
+    def hour_weekday(self):
+        """(시각, 요일) 투표 수 - 모든 코너/좋아요+별로 합"""
+        return self.grid.sum(axis=(2, 3))
+
+    def weekday_corner(self):
+        """(요일, 코너) 좋아요/별로 수 -> (likes, dislikes) 두 배열"""
+        counts = self.grid.sum(axis=0)
+        return counts[..., 0], counts[..., 1]
+
+    @property
+    def total(self):
+        return int(self.grid.sum())
@@ -0,0 +1,349 @@
+"""웰스토리(welplus) API 클라이언트
+
+Streamlit 에 의존하지 않으므로 앱 외의 스크립트에서도 그대로 사용할 수 있습니다.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+import pytz
+import requests
+from requests.adapters import HTTPAdapter
+
+from menu_model import DayMenu, select_meals, build_day_menu, BREAKFAST, LUNCH, DINNER
+from metrics import timed
+from resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+# 한국 시간대 설정
+KST = pytz.timezone("Asia/Seoul")
+
+BASE_URL = "https://welplus.welstory.com"
+DEVICE_ID = "95CB2CC5-543E-4DA7-AD7D-3D2D463CB0A0"
+USER_AGENT = "Mozilla/5.0 (iPhone; CPU iPhone OS 18_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148 Welplus/1.01.08"
+
+# 삼성 부산 전기
+DEFAULT_RESTAURANT_CODE = "REST000595"
+# {식당 코드: 표시 이름} (secrets.toml 의 [restaurants] 로 변경)
+DEFAULT_RESTAURANTS = {DEFAULT_RESTAURANT_CODE: "삼성 부산 전기"}
+# 하루 메뉴 전체 조회 시 기본 식사 구분 (조식/중식/석식)
+MEAL_TYPES = (BREAKFAST, LUNCH, DINNER)
+
+# 기간 조회(get_menus) 동시 요청 수 - 날짜마다 평점 요청이 5~6개씩 따라오므로 작게
+DEFAULT_RANGE_WORKERS = 4
+
+# (connect, read) 초 - 응답 없는 연결이 Streamlit 스레드를 붙잡지 않도록
+DEFAULT_TIMEOUT = (3.05, 10)
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamUnavailable(Exception):
+    """재시도 후에도 업스트림 호출 실패 (또는 서킷 열림)"""
+
+
+# 서킷 브레이커는 세션이 아니라 업스트림(base_url) 단위로 공유
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(base_url):
+    with _breakers_lock:
+        if base_url not in _breakers:
+            _breakers[base_url] = CircuitBreaker()
+        return _breakers[base_url]
+
+
+class _LastGoodCache:
+    """마지막으로 성공한 GET 응답 (업스트림 장애 시 대신 제공)"""
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+        return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+_last_good = _LastGoodCache()
+
+
+def empty_rating():
+    return {"평균평점": 0, "참여자수": 0}
+
+
+def rating_args(meal):
+    """mealList 항목에서 평점 조회 인자 추출"""
+    return (
+        meal.get("menuDt"),
+        meal.get("hallNo"),
+        meal.get("menuCourseType"),
+        meal.get("menuMealType"),
+        meal.get("restaurantCode"),
+    )
+
+
+def to_menu_dt(date=None):
+    """datetime/date -> 'YYYYMMDD' (None 이면 오늘)"""
+    if date is None:
+        date = datetime.now(KST)
+    return date.strftime("%Y%m%d")
+
+
+def plan_dates(start, end, weekdays_only=False):
+    """start ~ end (양 끝 포함) 날짜 목록"""
+    days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    if weekdays_only:
+        days = [d for d in days if d.weekday() < 5]
+    return days
+
+
+class WelplusAPI:
+    def __init__(self, base_url=BASE_URL, pool_size=10, timeout=DEFAULT_TIMEOUT,
+                 retry=None, breaker=None, rate_limiter=None):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or get_breaker(base_url)
+        # 선택: 배치 작업(backfill 등)의 업스트림 요청 속도 제한 (resilience.RateLimiter)
+        self.rate_limiter = rate_limiter
+        self.device_id = DEVICE_ID
+        self.token = None
+        self.headers = {
+            "X-Device-Id": self.device_id,
+            "X-Autologin": "Y",
+            "User-Agent": USER_AGENT,
+        }
+        # 연결 재사용 (평점 조회가 메뉴 수만큼 반복되므로)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _auth_headers(self):
+        headers = self.headers.copy()
+        headers.update({"Authorization": self.token})
+        return headers
+
+    def _get_json(self, path, params):
+        """멱등 GET 호출 (타임아웃 + 재시도 + 서킷 브레이커, 장애 시 마지막 성공 응답)
+
+        200 이면 JSON, 그 외 상태 코드면 None 을 반환합니다.
+        업스트림 장애(200 인데 JSON 이 아닌 점검 페이지 등 포함)인데 캐시된 응답도 없으면
+        UpstreamUnavailable 을 발생시킵니다.
+        """
+        url = f"{self.base_url}{path}"
+        cache_key = (url, tuple(sorted(params.items())))
+
+        try:
+            response = self._get_with_retry(url, params)
+            if response.status_code != 200:
+                return None
+            try:
+                data = response.json()
+            except ValueError as e:
+                raise UpstreamUnavailable(f"JSON 이 아닌 응답: {e}") from e
+        except UpstreamUnavailable as e:
+            cached = _last_good.get(cache_key)
+            if cached is not None:
+                logger.warning("업스트림 장애, 캐시된 응답 사용 (%s): %s", path, e)
+                return cached
+            raise
+
+        _last_good.put(cache_key, data)
+        return data
+
+    def _get_with_retry(self, url, params):
+        last_error = None
+        for attempt in range(self.retry.max_attempts):
+            if not self.breaker.allow():
+                raise UpstreamUnavailable(CircuitOpenError(f"서킷 열림: {self.base_url}"))
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            try:
+                response = self.session.get(url, headers=self._auth_headers(),
+                                            params=params, timeout=self.timeout)
+            except requests.RequestException as e:
+                # 어떤 요청 오류든 결과를 기록해야 반열림 상태의 시험 요청이 풀림
+                last_error = e
+            else:
+                if response.status_code not in self.retry.retry_statuses:
+                    self.breaker.record_success()
+                    return response
+                last_error = requests.HTTPError(f"HTTP {response.status_code}", response=response)
+
+            self.breaker.record_failure()
+            if attempt + 1 < self.retry.max_attempts:
+                self.retry.sleep(attempt)
+
+        raise UpstreamUnavailable(last_error)
+
+    @timed("welplus.login")
+    def login(self, username, password):
+        url = f"{self.base_url}/login"
+
+        login_headers = self.headers.copy()
+        login_headers.update({
+            "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
+            "Authorization": "Bearer null",
+        })
+
+        data = {
+            "username": username,
+            "password": password,
+            "remember-me": "true"
+        }
+
+        # POST 는 멱등이 아니므로 재시도하지 않음
+        if not self.breaker.allow():
+            raise UpstreamUnavailable(CircuitOpenError(f"서킷 열림: {self.base_url}"))
+        try:
+            response = self.session.post(url, headers=login_headers, data=data, timeout=self.timeout)
+        except requests.RequestException as e:
+            self.breaker.record_failure()
+            raise UpstreamUnavailable(e)
+        self.breaker.record_success()
+
+        if response.status_code == 200:
+            self.token = response.headers.get("Authorization")
+            return True
+        else:
+            return False
+
+    @timed("welplus.get_menu")
+    def get_menu(self, date=None, meal_type=LUNCH, restaurant_code=DEFAULT_RESTAURANT_CODE, strict=False):
+        """메뉴 조회 (meal_type: 2=점심)
+
+        조회 실패 시 빈 메뉴를 돌려주지만, strict 이면 UpstreamUnavailable 을 올림
+        (메뉴 없는 날과 실패를 구분해야 하는 배치 작업용 - 평점 조회 실패도 실패로 봄)
+        """
+        menu_dt = to_menu_dt(date)
+        menu_data = self.fetch_meal_data(menu_dt, meal_type, restaurant_code)
+        if menu_data is None:
+            if strict:
+                raise UpstreamUnavailable(f"메뉴 조회 실패: {restaurant_code} {menu_dt} {meal_type}")
+            return DayMenu.empty(menu_dt)
+        return self._parse_menu(menu_data, menu_dt, strict, meal_type)
+
+    def get_menus(self, start, end, meal_types=(LUNCH,), restaurant_code=DEFAULT_RESTAURANT_CODE,
+                  max_workers=DEFAULT_RANGE_WORKERS, cached=None, weekdays_only=False, strict=False):
+        """start ~ end 메뉴를 (menu_dt, meal_type, DayMenu) 로 끝나는 순서대로 yield
+
+        cached(menu_dt, meal_type) 가 DayMenu 를 돌려주는 날짜는 조회하지 않고 먼저 내보내며,
+        나머지는 최대 max_workers 개씩 동시에 조회합니다.
+        strict 이면 조회에 실패한 날짜는 DayMenu 대신 None 으로 내보냅니다.
+        """
+        plan = []
+        for date in plan_dates(start, end, weekdays_only):
+            menu_dt = to_menu_dt(date)
+            for meal_type in meal_types:
+                hit = cached(menu_dt, meal_type) if cached else None
+                if hit is not None:
+                    yield menu_dt, meal_type, hit
+                else:
+                    plan.append((date, menu_dt, meal_type))
+        if not plan:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(plan)),
+                                thread_name_prefix="welplus-range") as pool:
+            futures = {pool.submit(self.get_menu, date, meal_type, restaurant_code, strict): (menu_dt, meal_type)
+                       for date, menu_dt, meal_type in plan}
+            try:
+                for future in as_completed(futures):
+                    menu_dt, meal_type = futures[future]
+                    if strict and isinstance(future.exception(), UpstreamUnavailable):
+                        logger.warning("%s", future.exception())
+                        yield menu_dt, meal_type, None
+                    else:
+                        yield menu_dt, meal_type, future.result()
+            finally:
+                # 호출자가 중간에 멈추면 남은 조회는 취소
+                for future in futures:
+                    future.cancel()
+
+    @timed("welplus.fetch_meal_data")
+    def fetch_meal_data(self, menu_dt, meal_type=LUNCH, restaurant_code=DEFAULT_RESTAURANT_CODE):
+        """/api/meal 원본 응답 조회 (실패 시 None)"""
+        if not self.token:
+            raise Exception("Not logged in")
+
+        params = {
+            "menuDt": menu_dt,
+            "menuMealType": meal_type,
+            "restaurantCode": restaurant_code,
+            "sortingFlag": "",
+            "mainDivRestaurantCode": restaurant_code,
+            "activeRestaurantCode": restaurant_code,
+        }
+
+        try:
+            return self._get_json("/api/meal", params)
+        except UpstreamUnavailable as e:
+            logger.warning("메뉴 조회 실패 (%s %s): %s", restaurant_code, menu_dt, e)
+            return None
+
+    @timed("welplus.get_menu_rating")
+    def get_menu_rating(self, menu_dt, hall_no, menu_course_type,
+                        menu_meal_type, restaurant_code, strict=False):
+        """메뉴 평점 조회 (실패 시 0점/0명, strict 이면 UpstreamUnavailable)"""
+        if not self.token:
+            if strict:
+                raise UpstreamUnavailable("Not logged in")
+            return empty_rating()
+
+        params = {
+            "menuDt": menu_dt,
+            "hallNo": hall_no,
+            "menuCourseType": menu_course_type,
+            "menuMealType": menu_meal_type,
+            "restaurantCode": restaurant_code,
+            "mainDivRestaurantCode": restaurant_code,
+        }
+
+        try:
+            body = self._get_json("/api/meal/getMenuEvalAvg", params)
+        except (UpstreamUnavailable, ValueError) as e:
+            logger.warning("평점 조회 실패 (%s %s): %s", menu_dt, menu_course_type, e)
+            if strict:
+                raise UpstreamUnavailable(e) from e
+            return empty_rating()
+
+        if body is None:
+            if strict:
+                raise UpstreamUnavailable(f"평점 조회 실패: {menu_dt} {menu_course_type}")
+            return empty_rating()
+        data = body.get("data") or {}
+        return {
+            "평균평점": data.get("MENU_GRADE_AVG", 0),
+            "참여자수": data.get("TOT_CNT", 0),
+        }
+
+    @timed("welplus.parse_menu")
+    def _parse_menu(self, menu_data, menu_dt, strict=False, meal_type=None):
+        """메뉴 데이터 파싱 (한 번의 순회로 일반/추가 배식대/라면 분류)"""
+        try:
+            meal_list = menu_data.get("data", {}).get("mealList", [])
+            selected = select_meals(meal_list)
+            ratings = [self.get_menu_rating(*rating_args(meal), strict=strict) for _, meal in selected]
+            return build_day_menu(menu_dt, selected, ratings, meal_type)
+        except UpstreamUnavailable:
+            raise
+        except Exception as e:
+            logger.exception("메뉴 파싱 오류 (%s)", menu_dt)
+            if strict:
+                raise UpstreamUnavailable(e) from e
+            return DayMenu.empty(menu_dt)
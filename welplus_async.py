@@ -0,0 +1,172 @@
+"""asyncio 기반 웰스토리 API 클라이언트
+
+WelplusAPI 와 같은 login/get_menu/get_menu_rating 을 제공하되,
+평점 조회와 여러 날짜 조회를 하나의 이벤트 루프에서 동시에 실행합니다.
+HTTP 호출 자체는 WelplusAPI 의 requests 세션을 스레드 풀에서 실행하며,
+스레드 풀 크기와 커넥션 풀 크기가 같은 값(max_connections)으로 제한됩니다.
+스레드 풀은 같은 크기의 클라이언트끼리 프로세스 전체에서 공유합니다.
+
+Streamlit 페이지처럼 동기 코드에서는 SyncWelplusAPI 를 사용하세요.
+"""
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from menu_model import DayMenu, select_meals, build_day_menu
+from welplus_api import (
+    WelplusAPI, UpstreamUnavailable, LUNCH, MEAL_TYPES, DEFAULT_RESTAURANT_CODE, rating_args, to_menu_dt,
+)
+
+DEFAULT_MAX_CONNECTIONS = 8
+
+logger = logging.getLogger(__name__)
+
+# HTTP 호출용 스레드 풀 (크기별로 프로세스당 하나 - 세션마다 클라이언트를 만들어도 스레드가 쌓이지 않음)
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def _shared_executor(max_workers):
+    with _executors_lock:
+        executor = _executors.get(max_workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="welplus")
+            _executors[max_workers] = executor
+        return executor
+
+
+class AsyncWelplusAPI:
+    def __init__(self, api=None, max_connections=DEFAULT_MAX_CONNECTIONS):
+        self.api = api or WelplusAPI(pool_size=max_connections)
+        self.max_connections = max_connections
+        self._executor = _shared_executor(max_connections)
+
+    @property
+    def token(self):
+        return self.api.token
+
+    async def _call(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def login(self, username, password):
+        return await self._call(self.api.login, username, password)
+
+    async def get_menu_rating(self, menu_dt, hall_no, menu_course_type,
+                              menu_meal_type, restaurant_code, strict=False):
+        """메뉴 평점 조회"""
+        return await self._call(self.api.get_menu_rating, menu_dt, hall_no,
+                                menu_course_type, menu_meal_type, restaurant_code, strict)
+
+    async def get_ratings(self, meals, strict=False):
+        """mealList 항목들의 평점을 동시에 조회 (입력 순서대로 반환)"""
+        return await asyncio.gather(*(self.get_menu_rating(*rating_args(meal), strict=strict) for meal in meals))
+
+    async def get_menu(self, date=None, meal_type=LUNCH, restaurant_code=DEFAULT_RESTAURANT_CODE, strict=False):
+        """메뉴 조회 (코너별 평점은 동시에 조회)
+
+        조회/파싱 실패 시 빈 메뉴를 돌려주지만, strict 이면 UpstreamUnavailable 을 올림
+        (캐시 갱신처럼 실패를 메뉴 없는 날과 구분해야 하는 경우)
+        """
+        menu_dt = to_menu_dt(date)
+        menu_data = await self._call(self.api.fetch_meal_data, menu_dt, meal_type, restaurant_code)
+        if menu_data is None:
+            if strict:
+                raise UpstreamUnavailable(f"메뉴 조회 실패: {restaurant_code} {menu_dt} {meal_type}")
+            return DayMenu.empty(menu_dt)
+
+        try:
+            meal_list = menu_data.get("data", {}).get("mealList", [])
+            selected = select_meals(meal_list)
+            ratings = await self.get_ratings((meal for _, meal in selected), strict)
+            return build_day_menu(menu_dt, selected, ratings, meal_type)
+        except UpstreamUnavailable:
+            raise
+        except Exception as e:
+            logger.exception("메뉴 파싱 오류 (%s)", menu_dt)
+            if strict:
+                raise UpstreamUnavailable(e) from e
+            return DayMenu.empty(menu_dt)
+
+    async def get_menus_for_dates(self, dates, meal_type=LUNCH):
+        """여러 날짜 메뉴를 동시에 조회 -> {menu_dt: DayMenu}"""
+        menus = await asyncio.gather(*(self.get_menu(d, meal_type) for d in dates))
+        return {menu.menu_dt: menu for menu in menus}
+
+    async def get_menus_for_restaurants(self, date, restaurant_codes, meal_type=LUNCH):
+        """여러 식당의 같은 날 메뉴를 동시에 조회 -> {식당 코드: DayMenu}"""
+        restaurant_codes = list(restaurant_codes)
+        menus = await asyncio.gather(*(self.get_menu(date, meal_type, code) for code in restaurant_codes))
+        return dict(zip(restaurant_codes, menus))
+
+    async def get_day_menus(self, date=None, meal_types=MEAL_TYPES, restaurant_code=DEFAULT_RESTAURANT_CODE):
+        """하루의 식사별 메뉴를 (평점 포함) 동시에 조회 -> {식사 구분: DayMenu}"""
+        meal_types = list(meal_types)
+        menus = await asyncio.gather(*(self.get_menu(date, mt, restaurant_code) for mt in meal_types))
+        return dict(zip(meal_types, menus))
+
+    def close(self):
+        """HTTP 커넥션 정리 (스레드 풀은 공유하므로 그대로 둠)"""
+        self.api.session.close()
+
+
+# 동기 코드에서 사용하는 공용 이벤트 루프 (프로세스당 하나)
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop():
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="welplus-loop", daemon=True)
+            thread.start()
+            _loop = loop
+        return _loop
+
+
+class SyncWelplusAPI:
+    """AsyncWelplusAPI 의 동기 래퍼 (Streamlit 페이지용)"""
+
+    def __init__(self, max_connections=DEFAULT_MAX_CONNECTIONS, api=None):
+        self.aio = AsyncWelplusAPI(api=api, max_connections=max_connections)
+
+    @property
+    def token(self):
+        return self.aio.token
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
+
+    def login(self, username, password):
+        return self._run(self.aio.login(username, password))
+
+    def get_menu(self, date=None, meal_type=LUNCH, restaurant_code=DEFAULT_RESTAURANT_CODE, strict=False):
+        return self._run(self.aio.get_menu(date, meal_type, restaurant_code, strict))
+
+    def get_menu_rating(self, menu_dt, hall_no, menu_course_type,
+                        menu_meal_type, restaurant_code, strict=False):
+        return self._run(self.aio.get_menu_rating(menu_dt, hall_no, menu_course_type,
+                                                  menu_meal_type, restaurant_code, strict))
+
+    def get_ratings(self, meals, strict=False):
+        return self._run(self.aio.get_ratings(list(meals), strict))
+
+    def get_menus_for_dates(self, dates, meal_type=LUNCH):
+        return self._run(self.aio.get_menus_for_dates(dates, meal_type))
+
+    def get_menus(self, *args, **kwargs):
+        """기간 조회 스트리밍 (WelplusAPI.get_menus 와 같음)"""
+        return self.aio.api.get_menus(*args, **kwargs)
+
+    def get_menus_for_restaurants(self, date, restaurant_codes, meal_type=LUNCH):
+        return self._run(self.aio.get_menus_for_restaurants(date, restaurant_codes, meal_type))
+
+    def get_day_menus(self, date=None, meal_types=MEAL_TYPES, restaurant_code=DEFAULT_RESTAURANT_CODE):
+        return self._run(self.aio.get_day_menus(date, meal_types, restaurant_code))
+
+    def close(self):
+        self.aio.close()
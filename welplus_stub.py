@@ -0,0 +1,338 @@
+"""웰스토리 API 응답 녹화/재생 도구
+
+실제 계정 없이 클라이언트/캐시 성능을 측정할 수 있도록
+/login, /api/meal, /api/meal/getMenuEvalAvg 응답을 파일로 저장하고,
+로컬 스텁 서버에서 지연/지터/오류율을 조절해 재생합니다.
+
+사용 예:
+    # 실제 서버 응답 녹화 (WELSTORY_USERNAME / WELSTORY_PASSWORD 환경 변수 필요)
+    python welplus_stub.py record --start 20260201 --end 20260228
+
+    # 녹화 없이 가짜 응답 생성
+    python welplus_stub.py synthesize --start 20260101 --end 20261231
+
+    # 스텁 서버 실행 (앱에서는 secrets 의 welstory.base_url 을 이 주소로 지정)
+    python welplus_stub.py serve --port 8765 --latency 0.08 --jitter 0.03 --error-rate 0.01
+"""
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+DEFAULT_FIXTURE_DIR = Path("fixtures") / "welplus"
+STUB_TOKEN = "Bearer stub-token"
+
+LOGIN_PATH = "/login"
+MEAL_PATH = "/api/meal"
+RATING_PATH = "/api/meal/getMenuEvalAvg"
+
+
+def fixture_name(path, params):
+    """요청 경로/파라미터 -> 픽스처 파일 이름"""
+    def p(name):
+        return str(params.get(name) or "-")
+
+    if path == LOGIN_PATH:
+        return "login.json"
+    if path == MEAL_PATH:
+        return f"meal/{p('menuDt')}_{p('menuMealType')}_{p('restaurantCode')}.json"
+    if path == RATING_PATH:
+        return (f"rating/{p('menuDt')}_{p('menuMealType')}_{p('restaurantCode')}"
+                f"_{p('hallNo')}_{p('menuCourseType')}.json")
+    return None
+
+
+def save_fixture(fixture_dir, path, params, status, headers, body):
+    name = fixture_name(path, params)
+    if name is None:
+        return None
+    target = Path(fixture_dir) / name
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, 'w', encoding='utf-8') as f:
+        json.dump({"status": status, "headers": headers, "body": body}, f, ensure_ascii=False, indent=2)
+    return target
+
+
+def load_fixture(fixture_dir, path, params):
+    name = fixture_name(path, params)
+    if name is None:
+        return None
+    target = Path(fixture_dir) / name
+    if not target.exists():
+        return None
+    with open(target, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class RecordingSession(requests.Session):
+    """응답을 픽스처로 저장하는 requests 세션
+
+    로그인 응답은 본문(사용자 이름, 사번 등 개인정보)과 토큰을 저장하지 않고
+    빈 본문 + STUB_TOKEN 만 저장합니다 (login 은 Authorization 헤더만 씀).
+    로그인 요청 본문의 계정 정보도 저장하지 않습니다.
+    """
+
+    def __init__(self, fixture_dir=DEFAULT_FIXTURE_DIR):
+        super().__init__()
+        self.fixture_dir = Path(fixture_dir)
+
+    def request(self, method, url, params=None, **kwargs):
+        response = super().request(method, url, params=params, **kwargs)
+        path = urlparse(url).path
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+
+        # 일시적인 오류 응답은 녹화하지 않음 (재시도된 응답이 저장됨)
+        if response.status_code >= 500 or response.status_code == 429:
+            return response
+
+        headers = {}
+        if path == LOGIN_PATH:
+            body = {}
+            if response.status_code == 200:
+                headers["Authorization"] = STUB_TOKEN
+        save_fixture(self.fixture_dir, path, params or {}, response.status_code, headers, body)
+        return response
+
+
+def install_recorder(api, fixture_dir=DEFAULT_FIXTURE_DIR):
+    """api 의 세션을 녹화 세션으로 바꿈 (로그인 응답도 녹화하려면 로그인 전에 호출)"""
+    session = RecordingSession(fixture_dir)
+    session.adapters = api.session.adapters
+    api.session = session
+    return session
+
+
+def record(api, dates, fixture_dir=DEFAULT_FIXTURE_DIR, meal_types=("2",),
+           restaurant_codes=("REST000595",)):
+    """api 를 녹화 세션으로 바꾼 뒤 (이미 바뀌어 있으면 그대로) dates 를 조회"""
+    if not isinstance(api.session, RecordingSession):
+        install_recorder(api, fixture_dir)
+    for date in dates:
+        for meal_type in meal_types:
+            for restaurant_code in restaurant_codes:
+                api.get_menu(date, meal_type, restaurant_code)
+
+
+# 가짜 응답 생성 --------------------------------------------------------------
+
+_CORNERS = ["한식", "양식", "일품", "샐러드"]
+_DISHES = ["돼지불고기", "제육볶음", "치킨까스", "비빔밥", "김치찌개", "된장찌개", "카레라이스",
+           "스파게티", "함박스테이크", "닭갈비", "연어덮밥", "우동", "쌀국수", "냉면", "돈까스"]
+_SIDES = ["쌀밥", "잡곡밥", "배추김치", "깍두기", "미역국", "콩나물국", "계란찜", "잡채",
+          "샐러드", "요구르트", "과일", "어묵볶음", "시금치나물"]
+_RAMEN = ["신라면", "진라면", "짜파게티", "너구리"]
+_TOPPINGS = ["계란", "치즈", "떡", "만두"]
+
+
+def synthetic_meal_list(menu_dt, meal_type="2", restaurant_code="REST000595", rng=random):
+    """녹화 없이 사용할 그럴듯한 mealList 생성"""
+    def meal(course_no, course_txt, menu_name, sub_menu):
+        return {
+            "menuDt": menu_dt,
+            "hallNo": "E1",
+            "menuCourseType": f"AA{course_no}",
+            "menuMealType": meal_type,
+            "restaurantCode": restaurant_code,
+            "courseTxt": course_txt,
+            "menuName": menu_name,
+            "sumKcal": str(rng.randint(450, 1100)),
+            "subMenuTxt": ",".join(sub_menu),
+            "photoUrl": "https://example.invalid/photo/",
+            "photoCd": f"{menu_dt}_{course_no}.jpg",
+        }
+
+    meals = [meal(i + 1, corner, rng.choice(_DISHES), rng.sample(_SIDES, 5))
+             for i, corner in enumerate(_CORNERS)]
+    meals.append(meal(5, "추가 배식대", rng.choice(_DISHES), rng.sample(_SIDES, 3)))
+    meals.append(meal(6, "SELF 배식대", "셀프 바", rng.sample(_SIDES, 3)))
+    meals.append(meal(7, "마이보글", "[라면] 오늘의 라면",
+                      ["라면"] + rng.sample(_RAMEN, 2) + ["[토핑]"] + rng.sample(_TOPPINGS, 2)))
+    return meals
+
+
+def synthesize(dates, fixture_dir=DEFAULT_FIXTURE_DIR, meal_types=("2",),
+               restaurant_code="REST000595", seed=0):
+    rng = random.Random(seed)
+    save_fixture(fixture_dir, LOGIN_PATH, {}, 200, {"Authorization": STUB_TOKEN}, {})
+    for date in dates:
+        menu_dt = date.strftime("%Y%m%d")
+        for meal_type in meal_types:
+            meals = synthetic_meal_list(menu_dt, meal_type, restaurant_code, rng)
+            params = {"menuDt": menu_dt, "menuMealType": meal_type, "restaurantCode": restaurant_code}
+            save_fixture(fixture_dir, MEAL_PATH, params, 200, {}, {"data": {"mealList": meals}})
+            for m in meals:
+                rating_params = dict(params, hallNo=m["hallNo"], menuCourseType=m["menuCourseType"])
+                body = {"data": {"MENU_GRADE_AVG": round(rng.uniform(2.5, 5.0), 1),
+                                 "TOT_CNT": rng.randint(0, 120)}}
+                save_fixture(fixture_dir, RATING_PATH, rating_params, 200, {}, body)
+
+
+# 스텁 서버 -------------------------------------------------------------------
+
+class StubConfig:
+    def __init__(self, fixture_dir=DEFAULT_FIXTURE_DIR, latency=0.0, jitter=0.0, error_rate=0.0, seed=None):
+        self.fixture_dir = Path(fixture_dir)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.request_count = 0
+        self.error_count = 0
+        self._lock = threading.Lock()
+
+    def next_delay_and_error(self):
+        with self._lock:
+            self.request_count += 1
+            delay = max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+            failed = self.rng.random() < self.error_rate
+            if failed:
+                self.error_count += 1
+        return delay, failed
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    config = None  # make_stub_server 에서 지정
+    protocol_version = "HTTP/1.1"
+    # keep-alive 에서 헤더/본문을 나눠 쓸 때 Nagle + delayed ACK 로 ~40ms 씩 지연되는 것 방지
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body, headers=None):
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _serve(self, path, params):
+        delay, failed = self.config.next_delay_and_error()
+        if delay:
+            time.sleep(delay)
+        if failed:
+            self._send_json(503, {"message": "stub error"})
+            return
+
+        fixture = load_fixture(self.config.fixture_dir, path, params)
+        if fixture is not None:
+            self._send_json(fixture["status"], fixture["body"], fixture.get("headers"))
+        elif path == LOGIN_PATH:
+            self._send_json(200, {}, {"Authorization": STUB_TOKEN})
+        elif path == MEAL_PATH:
+            self._send_json(200, {"data": {"mealList": []}})
+        elif path == RATING_PATH:
+            self._send_json(200, {"data": {}})
+        else:
+            self._send_json(404, {"message": "not found"})
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+        self._serve(url.path, params)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        self._serve(urlparse(self.path).path, {})
+
+
+class _StubServer(ThreadingHTTPServer):
+    # 기본 listen backlog(5)로는 부하 테스트의 동시 접속에서 연결이 거부됨
+    request_queue_size = 128
+
+
+def make_stub_server(config=None, host="127.0.0.1", port=0):
+    """스텁 서버 생성 (port=0 이면 빈 포트 사용). base_url 은 server.base_url"""
+    handler = type("StubHandler", (_StubHandler,), {"config": config or StubConfig()})
+    server = _StubServer((host, port), handler)
+    server.daemon_threads = True
+    server.config = handler.config
+    server.base_url = f"http://{host}:{server.server_address[1]}"
+    return server
+
+
+def start_stub_server(config=None, host="127.0.0.1", port=0):
+    """백그라운드 스레드에서 스텁 서버 실행 (벤치마크/부하 테스트용)"""
+    server = make_stub_server(config, host, port)
+    threading.Thread(target=server.serve_forever, name="welplus-stub", daemon=True).start()
+    return server
+
+
+def date_range(start, end):
+    """'YYYYMMDD' 두 개 -> 양 끝 포함 datetime 목록"""
+    day = datetime.strptime(start, "%Y%m%d")
+    last = datetime.strptime(end, "%Y%m%d")
+    dates = []
+    while day <= last:
+        dates.append(day)
+        day += timedelta(days=1)
+    return dates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="웰스토리 API 녹화/재생")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    for name in ("record", "synthesize"):
+        p = sub.add_parser(name)
+        p.add_argument("--start", required=True, help="YYYYMMDD")
+        p.add_argument("--end", required=True, help="YYYYMMDD")
+        p.add_argument("--fixtures", default=str(DEFAULT_FIXTURE_DIR))
+        p.add_argument("--meal-types", default="2", help="쉼표 구분 (예: 1,2,3)")
+        p.add_argument("--restaurants", default="REST000595", help="식당 코드, 쉼표 구분")
+
+    p = sub.add_parser("serve")
+    p.add_argument("--fixtures", default=str(DEFAULT_FIXTURE_DIR))
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    p.add_argument("--jitter", type=float, default=0.0, help="지연 편차 (초, ±)")
+    p.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율 (0~1)")
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        config = StubConfig(args.fixtures, args.latency, args.jitter, args.error_rate)
+        server = make_stub_server(config, args.host, args.port)
+        print(f"스텁 서버 실행 중: {server.base_url} (fixtures: {args.fixtures})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    dates = date_range(args.start, args.end)
+    meal_types = tuple(args.meal_types.split(","))
+    restaurant_codes = tuple(args.restaurants.split(","))
+    if args.command == "synthesize":
+        for i, restaurant_code in enumerate(restaurant_codes):
+            synthesize(dates, args.fixtures, meal_types, restaurant_code, seed=i)
+    else:
+        from welplus_api import WelplusAPI
+
+        api = WelplusAPI()
+        # /login 응답도 픽스처로 남도록 로그인 전에 녹화 세션으로 바꿈
+        install_recorder(api, args.fixtures)
+        if not api.login(os.environ["WELSTORY_USERNAME"], os.environ["WELSTORY_PASSWORD"]):
+            raise SystemExit("로그인 실패")
+        record(api, dates, args.fixtures, meal_types, restaurant_codes)
+    print(f"{len(dates)}일치 픽스처 저장: {args.fixtures}")
+
+
+if __name__ == "__main__":
+    main()
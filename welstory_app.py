@@ -1,10 +1,33 @@
 import streamlit as st
-import requests
+import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
-import pytz
-import json
 import os
-from pathlib import Path
+
+from welplus_api import (
+    KST, BASE_URL, DEFAULT_RESTAURANT_CODE, DEFAULT_RESTAURANTS, MEAL_TYPES, WelplusAPI,
+)
+from welplus_async import SyncWelplusAPI
+from menu_model import LUNCH, MEAL_TYPE_NAMES
+from menu_cache import SWRCache, CachedMenuClient
+from metrics import timed, set_sample_rate, start_metrics_server, METRICS_PORT
+from profiler import profile_run, slowest_runs
+from storage import (
+    DATA_DIR, load_votes, load_comments, load_board_posts,
+    add_vote, add_vote_listener, add_menu_comment, add_board_post, add_board_comment,
+)
+from vote_index import VoteIndexCache
+from cold_archive import ColdArchive, DEFAULT_HOT_DAYS
+from vote_rollup import VoteRollup, WEEKDAYS
+from menu_http import start_menu_api_server, HTTP_API_PORT
+from menu_store import MenuStore
+from menu_archive import MenuArchive
+from menu_nutrition import kcal_trend, kcal_distribution, kcal_histogram, kcal_outliers
+from menu_render import (
+    MENU_CSS,
+    menu_title_html, menu_header_html, menu_image_html, rating_html, calories_html,
+    ingredients_html, item_list_html, extra_station_html, comment_html, heatmap_html,
+)
 
 hide_streamlit_style = """
 <style>
@@ -24,387 +47,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# 한국 시간대 설정
-KST = pytz.timezone("Asia/Seoul")
-
-# 데이터 저장 디렉토리
-DATA_DIR = Path("data")
-DATA_DIR.mkdir(exist_ok=True)
-
 # CSS 스타일링
-st.markdown("""
-    <style>
-    /* 다크모드/라이트모드 대응 */
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: 900;
-        text-align: center;
-        margin-bottom: 2rem;
-        padding: 1rem;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }
-    
-    .menu-card {
-        border: 2px solid rgba(102, 126, 234, 0.3);
-        border-radius: 20px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: 0 8px 20px rgba(0,0,0,0.1);
-        transition: transform 0.3s, box-shadow 0.3s;
-        background: rgba(255, 255, 255, 0.05);
-        height: 100%;
-        display: flex;
-        flex-direction: column;
-    }
-    
-    .menu-card:hover {
-        transform: translateY(-8px);
-        box-shadow: 0 12px 30px rgba(102, 126, 234, 0.2);
-        border-color: rgba(102, 126, 234, 0.6);
-    }
-    
-    .menu-header {
-        display: flex;
-        align-items: center;
-        gap: 1rem;
-        margin-bottom: 1rem;
-        padding-bottom: 1rem;
-        border-bottom: 2px solid rgba(102, 126, 234, 0.2);
-    }
-    
-    .menu-corner {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 0.5rem 1.2rem;
-        border-radius: 25px;
-        font-size: 0.9rem;
-        font-weight: bold;
-        display: inline-block;
-        box-shadow: 0 4px 10px rgba(102, 126, 234, 0.3);
-        white-space: nowrap;
-    }
-    
-    .menu-name {
-        font-size: 1.3rem;
-        font-weight: 900;
-        flex: 1;
-        line-height: 1.3;
-    }
-    
-    .menu-content {
-        flex: 1;
-        display: flex;
-        flex-direction: column;
-        gap: 1rem;
-    }
-    
-    .menu-image-container {
-        width: 100%;
-        height: 200px;
-        border-radius: 15px;
-        overflow: hidden;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-    }
-    
-    .menu-image {
-        width: 100%;
-        height: 100%;
-        object-fit: cover;
-    }
-    
-    .menu-image-placeholder {
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(135deg, #e0e0e0 0%, #f5f5f5 100%);
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        color: #999;
-        font-size: 1rem;
-    }
-    
-    .menu-rating-small {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.3rem;
-        background: linear-gradient(135deg, #FFD93D 0%, #FF6B35 100%);
-        color: white;
-        padding: 0.4rem 0.8rem;
-        border-radius: 10px;
-        font-size: 0.85rem;
-        font-weight: bold;
-        box-shadow: 0 2px 8px rgba(255, 107, 53, 0.2);
-        margin-top: 0.5rem;
-    }
-    
-    .menu-rating-small .score {
-        font-size: 1rem;
-    }
-    
-    .menu-rating-small .count {
-        font-size: 0.75rem;
-        opacity: 0.9;
-    }
-    
-    .menu-calories {
-        font-size: 1rem;
-        font-weight: bold;
-        color: #667eea;
-        margin-top: 0.8rem;
-        padding: 0.5rem;
-        background: rgba(102, 126, 234, 0.1);
-        border-radius: 8px;
-        text-align: center;
-    }
-    
-    .menu-ingredients {
-        font-size: 0.9rem;
-        line-height: 1.8;
-        padding: 1rem;
-        background: rgba(102, 126, 234, 0.05);
-        border-radius: 10px;
-        border-left: 4px solid #667eea;
-        margin-top: 1rem;
-        flex: 1;
-    }
-    
-    .ingredient-item {
-        padding: 0.3rem 0;
-        border-bottom: 1px solid rgba(102, 126, 234, 0.1);
-    }
-    
-    .ingredient-item:last-child {
-        border-bottom: none;
-    }
-    
-    .comment-box {
-        background: rgba(102, 126, 234, 0.08);
-        padding: 1rem;
-        border-radius: 12px;
-        margin: 0.8rem 0;
-        border-left: 4px solid #667eea;
-    }
-    
-    .comment-author {
-        color: #667eea;
-        font-weight: bold;
-        font-size: 1rem;
-    }
-    
-    .stat-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: 20px;
-        text-align: center;
-        box-shadow: 0 8px 20px rgba(102, 126, 234, 0.3);
-    }
-    
-    .board-post {
-        border: 2px solid rgba(102, 126, 234, 0.2);
-        border-radius: 15px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        transition: all 0.3s;
-    }
-    
-    .board-post:hover {
-        box-shadow: 0 8px 20px rgba(102, 126, 234, 0.15);
-        border-color: rgba(102, 126, 234, 0.4);
-    }
-    
-    /* 버튼 스타일 */
-    .stButton>button {
-        border-radius: 12px;
-        font-weight: 600;
-        transition: all 0.2s;
-        font-size: 1rem;
-    }
-    
-    .stButton>button:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 6px 12px rgba(0,0,0,0.2);
-    }
-    
-    /* 반응형 */
-    @media (max-width: 768px) {
-        .menu-name {
-            font-size: 1.1rem;
-        }
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
-
-class WelplusAPI:
-    def __init__(self):
-        self.base_url = "https://welplus.welstory.com"
-        self.device_id = "95CB2CC5-543E-4DA7-AD7D-3D2D463CB0A0"
-        self.token = None
-        self.headers = {
-            "X-Device-Id": self.device_id,
-            "X-Autologin": "Y",
-            "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 18_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148 Welplus/1.01.08",
-        }
-
-    def login(self, username, password):
-        url = f"{self.base_url}/login"
-
-        login_headers = self.headers.copy()
-        login_headers.update({
-            "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
-            "Authorization": "Bearer null",
-        })
-
-        data = {
-            "username": username,
-            "password": password,
-            "remember-me": "true"
-        }
-
-        response = requests.post(url, headers=login_headers, data=data)
-
-        if response.status_code == 200:
-            self.token = response.headers.get("Authorization")
-            return True
-        else:
-            return False
-
-    def get_menu(self, date=None, meal_type="2"):
-        """메뉴 조회 (meal_type: 2=점심)"""
-        if not self.token:
-            raise Exception("Not logged in")
-
-        url = f"{self.base_url}/api/meal"
-        headers = self.headers.copy()
-        headers.update({"Authorization": self.token})
-
-        if date is None:
-            date = datetime.now(KST)
-
-        menu_dt = date.strftime("%Y%m%d")
-
-        params = {
-            "menuDt": menu_dt,
-            "menuMealType": meal_type,
-            "restaurantCode": "REST000595",
-            "sortingFlag": "",
-            "mainDivRestaurantCode": "REST000595",
-            "activeRestaurantCode": "REST000595",
-        }
-
-        response = requests.get(url, headers=headers, params=params)
-
-        if response.status_code == 200:
-            menu_data = response.json()
-            return self._parse_menu(menu_data, menu_dt)
-        else:
-            return {"점심": [], "추가배식대": None}
-
-    def get_menu_rating(self, menu_dt, hall_no, menu_course_type, 
-                        menu_meal_type, restaurant_code):
-        """메뉴 평점 조회"""
-        if not self.token:
-            return {"평균평점": 0, "참여자수": 0}
-
-        url = f"{self.base_url}/api/meal/getMenuEvalAvg"
-        headers = self.headers.copy()
-        headers.update({"Authorization": self.token})
-
-        params = {
-            "menuDt": menu_dt,
-            "hallNo": hall_no,
-            "menuCourseType": menu_course_type,
-            "menuMealType": menu_meal_type,
-            "restaurantCode": restaurant_code,
-            "mainDivRestaurantCode": restaurant_code,
-        }
-
-        try:
-            response = requests.get(url, headers=headers, params=params)
-            if response.status_code == 200:
-                data = response.json().get("data", {})
-                return {
-                    "평균평점": data.get("MENU_GRADE_AVG", 0),
-                    "참여자수": data.get("TOT_CNT", 0),
-                }
-        except:
-            pass
-
-        return {"평균평점": 0, "참여자수": 0}
-
-    def _parse_menu(self, menu_data, menu_dt):
-        """메뉴 데이터 파싱 (추가 배식대 처리 포함)"""
-        try:
-            menu_items = []
-            extra_station = None # 추가 배식대 정보 저장
-            meal_list = menu_data.get("data", {}).get("mealList", [])
-
-            # 전체 항목 중 '추가 배식대' 먼저 찾기
-            for meal in meal_list:
-                course_txt = meal.get("courseTxt", "")
-                if "추가 배식대" in course_txt or "추가배식대" in course_txt:
-                    extra_station = self._build_menu_info(meal, menu_dt)
-                    break
-
-            # 일반 메뉴 처리 (최대 4개 항목 처리, SELF 배식대 전까지)
-            count = 0
-            for meal in meal_list:
-                if count >= 4:
-                    break
-
-                course_txt = meal.get("courseTxt", "")
-                if course_txt == "SELF 배식대" or "추가 배식대" in course_txt or "추가배식대" in course_txt:
-                    continue
-
-                menu_info = self._build_menu_info(meal, menu_dt)
-                menu_items.append(menu_info)
-                count += 1
-
-            # 라면 메뉴 추가
-            for meal in meal_list:
-                if meal.get("courseTxt", "") == "마이보글" or "[라면" in meal.get("menuName", ""):
-                    menu_info = self._build_menu_info(meal, menu_dt)
-                    menu_items.append(menu_info)
-                    break
-
-            return {"점심": menu_items, "추가배식대": extra_station}
-        except Exception as e:
-            st.error(f"메뉴 파싱 오류: {str(e)}")
-            return {"점심": [], "추가배식대": None}
-
-    def _build_menu_info(self, meal, menu_dt):
-        """식단 객체 생성 공통 로직"""
-        course_txt = meal.get("courseTxt", "")
-        menu_name = meal.get("menuName", "")
-        kcal = meal.get("sumKcal", "")
-        sub_menu_txt = meal.get("subMenuTxt", "").split(",")
-
-        photo_url = meal.get("photoUrl", "")
-        photo_cd = meal.get("photoCd", "")
-        image_url = f"{photo_url}{photo_cd}" if photo_url and photo_cd else None
-
-        rating_info = self.get_menu_rating(
-            meal.get("menuDt"),
-            meal.get("hallNo"),
-            meal.get("menuCourseType"),
-            meal.get("menuMealType"),
-            meal.get("restaurantCode"),
-        )
-
-        return {
-            "코너": course_txt,
-            "메뉴명": menu_name,
-            "칼로리": kcal,
-            "구성": sub_menu_txt,
-            "이미지": image_url,
-            "평균평점": rating_info["평균평점"],
-            "참여자수": rating_info["참여자수"],
-            "menu_id": f"{menu_dt}_{course_txt}_{menu_name}".replace(" ", "_"),
-        }
+st.markdown(f"<style>{MENU_CSS}</style>", unsafe_allow_html=True)
 
 
 # 데이터 저장/로드 함수들
@@ -414,54 +58,164 @@ def get_welstory_credentials():
         if hasattr(st, 'secrets') and 'welstory' in st.secrets:
             return {
                 'username': st.secrets['welstory']['username'],
-                'password': st.secrets['welstory']['password']
+                'password': st.secrets['welstory']['password'],
+                # 선택: 스텁 서버 등 다른 API 주소 (welplus_stub.py 참고)
+                'base_url': st.secrets['welstory'].get('base_url', BASE_URL),
+                # 선택: 메뉴 페이지에서 볼 식당
+                'restaurant_code': st.secrets['welstory'].get('restaurant_code', DEFAULT_RESTAURANT_CODE),
+                # 선택: 표시할 식사 구분 (1=조식, 2=중식, 3=석식)
+                'meal_types': tuple(st.secrets['welstory'].get('meal_types', MEAL_TYPES)),
             }
     except Exception as e:
         st.error(f"Secrets 로드 실패: {str(e)}")
 
     return {}
 
-def load_votes():
-    """투표 데이터 로드"""
-    vote_file = DATA_DIR / "votes.json"
-    if vote_file.exists():
-        with open(vote_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+def get_restaurants():
+    """식당 목록 {코드: 이름} (secrets 의 [restaurants])"""
+    try:
+        restaurants = dict(st.secrets.get("restaurants", {}))
+    except Exception:
+        restaurants = {}
+    return restaurants or dict(DEFAULT_RESTAURANTS)
+
+# 프로파일 결과 저장 위치
+PROFILE_DIR = DATA_DIR / "profiles"
+PAGE_SLUGS = {
+    "🍽️ 오늘의 메뉴": "menu",
+    "📋 BOB HUB": "board",
+    "📊 통계": "stats",
+    "🏢 식당별 메뉴": "restaurants",
+    "🥗 영양 통계": "nutrition",
+    "🛠️ 프로파일": "profile",
+}
+
+def get_profiling_config():
+    """프로파일링 설정 (secrets 의 [profiling])"""
+    try:
+        return dict(st.secrets.get("profiling", {}))
+    except Exception:
+        return {}
+
+def profiling_requested(config):
+    """이번 실행을 프로파일링할지 (enabled = true 이거나 ?profile=<token>)"""
+    if config.get("enabled"):
+        return True
+    token = config.get("token")
+    return bool(token) and st.query_params.get("profile") == token
+
+def is_profiling_admin(config):
+    """프로파일 페이지 접근 허용 여부 (?admin=<token>)"""
+    token = config.get("token")
+    return bool(token) and st.query_params.get("admin") == token
+
+@st.cache_resource
+def start_metrics():
+    """/metrics 엔드포인트 시작 (secrets 의 [metrics] enabled = true 일 때, 프로세스당 한 번)"""
+    try:
+        config = st.secrets.get("metrics", {})
+    except Exception:
+        config = {}
+    if "sample_rate" in config:
+        set_sample_rate(config["sample_rate"])
+    if not config.get("enabled"):
+        return None
+    return start_metrics_server(port=int(config.get("port", METRICS_PORT)))
+
+@st.cache_resource
+def get_menu_cache():
+    """메뉴/평점 캐시 (모든 세션이 공유, stale-while-revalidate)"""
+    return SWRCache()
+
+@st.cache_resource
+def get_vote_index_cache():
+    """기간별 투표 통계 인덱스 (모든 세션이 공유, 이 프로세스의 투표는 바로 반영)"""
+    cache = VoteIndexCache(archive=get_cold_archive())
+    add_vote_listener(cache.on_vote)
+    return cache
+
+@st.cache_resource
+def get_cold_archive():
+    """오래된 투표/댓글 보관소 (프로세스당 한 번 중단된 보관 작업을 마치고,
+    secrets 의 [retention] enabled = true 이면 hot_days 일보다 오래된 항목을 옮김)"""
+    try:
+        config = st.secrets.get("retention", {})
+    except Exception:
+        config = {}
+    archive = ColdArchive()
+    archive.recover()
+    if config.get("enabled"):
+        archive.archive(int(config.get("hot_days", DEFAULT_HOT_DAYS)))
+    return archive
+
+def get_menu_votes(votes, menu_id):
+    """메뉴 투표 수 (보관된 지난 메뉴면 보관된 값과 합침)"""
+    current = votes.get(menu_id, {"좋아요": 0, "별로": 0})
+    archived = get_cold_archive().vote(menu_id)
+    if archived:
+        current = {field: current.get(field, 0) + archived.get(field, 0) for field in ("좋아요", "별로")}
+    return current
+
+def get_menu_comments(comments, menu_id):
+    """메뉴 댓글 (보관된 지난 메뉴면 보관된 댓글 다음에 새 댓글)"""
+    return get_cold_archive().comments(menu_id) + comments.get(menu_id, [])
+
+@st.cache_resource
+def get_vote_rollup():
+    """투표 시간대 x 요일 x 코너 집계 (모든 세션이 공유, 새 이벤트만 읽어 갱신)"""
+    return VoteRollup()
+
+@st.cache_resource
+def get_menu_store():
+    """지난 메뉴 저장소 (모든 세션이 공유, backfill 로 채움)"""
+    return MenuStore()
+
+def has_menu_history():
+    """지난 메뉴 저장소에 데이터가 있는지 (다른 프로세스가 추가한 줄 반영)"""
+    store = get_menu_store()
+    store.refresh()
+    return len(store) > 0
+
+def get_menu_archive():
+    """지난 메뉴 컬럼형 아카이브 (저장소가 바뀌었으면 다시 빌드, 비어 있으면 None)"""
+    if not has_menu_history():
+        return None
+    return MenuArchive.open_for(get_menu_store())
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def nutrition_report(build_id, start, end, period, restaurant_code, meal_type, _archive):
+    """영양 페이지 집계 (아카이브 빌드 + 조회 구간별로 캐시)"""
+    query = dict(restaurant_code=restaurant_code, meal_type=meal_type)
+    return {
+        "trend": kcal_trend(_archive, start, end, period, **query),
+        "distribution": kcal_distribution(_archive, start, end, **query),
+        "histogram": kcal_histogram(_archive, start, end, **query),
+        "outliers": kcal_outliers(_archive, start, end, **query),
+    }
 
-def save_votes(votes):
-    """투표 데이터 저장"""
-    vote_file = DATA_DIR / "votes.json"
-    with open(vote_file, 'w', encoding='utf-8') as f:
-        json.dump(votes, f, ensure_ascii=False, indent=2)
-
-def load_comments():
-    """댓글 데이터 로드"""
-    comment_file = DATA_DIR / "comments.json"
-    if comment_file.exists():
-        with open(comment_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+@st.cache_resource
+def start_http_api(username, password, base_url):
+    """JSON API 시작 (secrets 의 [http_api] enabled = true 일 때, 프로세스당 한 번)
 
-def save_comments(comments):
-    """댓글 데이터 저장"""
-    comment_file = DATA_DIR / "comments.json"
-    with open(comment_file, 'w', encoding='utf-8') as f:
-        json.dump(comments, f, ensure_ascii=False, indent=2)
+    앱과 같은 메뉴 캐시를 쓰므로 API 요청이 업스트림 호출을 늘리지 않음
+    """
+    try:
+        config = st.secrets.get("http_api", {})
+    except Exception:
+        config = {}
+    if not config.get("enabled"):
+        return None
+    api = WelplusAPI(base_url=base_url)
 
-def load_board_posts():
-    """게시판 글 로드"""
-    board_file = DATA_DIR / "board.json"
-    if board_file.exists():
-        with open(board_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return []
+    def login():
+        return api.login(username, password)
 
-def save_board_posts(posts):
-    """게시판 글 저장"""
-    board_file = DATA_DIR / "board.json"
-    with open(board_file, 'w', encoding='utf-8') as f:
-        json.dump(posts, f, ensure_ascii=False, indent=2)
+    if not login():
+        return None
+    # 토큰이 만료되면 조회 실패 시 다시 로그인 (프로세스 동안 계속 실행되므로)
+    return start_menu_api_server(CachedMenuClient(api, get_menu_cache()),
+                                 host=config.get("host", "127.0.0.1"),
+                                 port=int(config.get("port", HTTP_API_PORT)), login=login)
 
 
 def display_menu_card(menu_item, show_voting=True):
@@ -472,42 +226,18 @@ def display_menu_card(menu_item, show_voting=True):
     st.markdown('<div class="menu-content">', unsafe_allow_html=True)
 
     # 이미지
-    if menu_item.get("이미지"):
-        st.markdown(f"""
-        <div class="menu-image-container">
-            <img src="{menu_item["이미지"]}" class="menu-image">
-        </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown("""
-        <div class="menu-image-container">
-            <div class="menu-image-placeholder">이미지 없음</div>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(menu_image_html(menu_item), unsafe_allow_html=True)
 
     # 평점 (작게)
-    if menu_item.get('평균평점', 0) > 0:
-        st.markdown(f"""
-        <div class="menu-rating-small">
-            <span class="score">⭐ {menu_item['평균평점']:.1f}</span>
-            <span class="count">({menu_item['참여자수']}명)</span>
-        </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown("""
-        <div class="menu-rating-small">
-            <span class="score">⭐</span>
-            <span class="count">(평가 없음)</span>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(rating_html(menu_item), unsafe_allow_html=True)
 
     # 칼로리
-    st.markdown(f'<div class="menu-calories">🔥 {menu_item["칼로리"]}kcal</div>', unsafe_allow_html=True)
+    st.markdown(calories_html(menu_item), unsafe_allow_html=True)
 
     # 구성 (한 줄씩)
-    if menu_item['구성']:
+    if menu_item.components:
         ingredients_html = '<div class="menu-ingredients">📋 <strong>구성</strong><br>'
-        for ingredient in filter(None, menu_item['구성']):
+        for ingredient in menu_item.components:
             ingredients_html += f'<div class="ingredient-item">• {ingredient}</div>'
         ingredients_html += '</div>'
         st.markdown(ingredients_html, unsafe_allow_html=True)
@@ -517,43 +247,31 @@ def display_menu_card(menu_item, show_voting=True):
     # 투표 버튼
     if show_voting:
         votes = load_votes()
-        menu_id = menu_item['menu_id']
-        current_votes = votes.get(menu_id, {"좋아요": 0, "별로": 0})
+        menu_id = menu_item.menu_id
+        current_votes = get_menu_votes(votes, menu_id)
 
         col1, col2 = st.columns(2)
 
         with col1:
             if st.button(f"👍 {current_votes['좋아요']}", key=f"like_{menu_id}", use_container_width=True):
-                current_votes['좋아요'] += 1
-                votes[menu_id] = current_votes
-                save_votes(votes)
+                add_vote(menu_id, '좋아요')
                 st.rerun()
 
         with col2:
             if st.button(f"👎 {current_votes['별로']}", key=f"dislike_{menu_id}", use_container_width=True):
-                current_votes['별로'] += 1
-                votes[menu_id] = current_votes
-                save_votes(votes)
+                add_vote(menu_id, '별로')
                 st.rerun()
 
     # 댓글 섹션
     with st.expander("💬 댓글 보기/작성"):
         comments = load_comments()
-        menu_id = menu_item['menu_id']
-        menu_comments = comments.get(menu_id, [])
+        menu_id = menu_item.menu_id
+        menu_comments = get_menu_comments(comments, menu_id)
 
         # 댓글 표시
         if menu_comments:
             for comment in menu_comments:
-                st.markdown(f"""
-                <div class="comment-box">
-                    <div>
-                        <span class="comment-author">{comment['author']}</span>
-                        <span style="color: #999; font-size: 0.85rem;">· {comment['timestamp']}</span>
-                    </div>
-                    <div style="margin-top: 0.5rem;">{comment['text']}</div>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(comment_html(comment), unsafe_allow_html=True)
         else:
             st.info("첫 댓글을 남겨보세요!")
 
@@ -568,21 +286,141 @@ def display_menu_card(menu_item, show_voting=True):
             submit = st.form_submit_button("작성", use_container_width=True)
 
             if submit and comment_text:
-                if menu_id not in comments:
-                    comments[menu_id] = []
-
-                comments[menu_id].append({
+                add_menu_comment(menu_id, {
                     "author": author if author else "익명",
                     "text": comment_text,
                     "timestamp": datetime.now(KST).strftime("%Y-%m-%d %H:%M")
                 })
-                save_comments(comments)
                 st.success("댓글이 작성되었습니다!")
                 st.rerun()
 
     # st.markdown('</div>', unsafe_allow_html=True)  # menu-card 종료
 
 
+def show_day_menu(menu_data):
+    """식사 하나의 메뉴 표시 (메인/추가 배식대/라면)"""
+    # 일반 메뉴와 라면 메뉴 (파싱 시 분류됨)
+    regular_menus = menu_data.regular
+    ramen_menus = menu_data.ramen
+
+    # 일반 메뉴 표시
+    if regular_menus:
+        st.markdown("### 🍱 메인 메뉴")
+
+        # 메뉴 개수만큼 컬럼 생성 (최대 4개)
+        num_cols = min(len(regular_menus), 4)
+        
+        # 메뉴 카드
+        cols = st.columns(num_cols)
+        for idx, menu in enumerate(regular_menus):
+            with cols[idx % num_cols]:
+                # 컨테이너로 카드 생성
+                with st.container():
+                    # 코너 + 메뉴명
+                    st.markdown(menu_title_html(menu), unsafe_allow_html=True)
+
+                    # 이미지
+                    st.markdown(menu_image_html(menu), unsafe_allow_html=True)
+
+                    # 평점
+                    st.markdown(rating_html(menu), unsafe_allow_html=True)
+
+                    # 칼로리
+                    st.markdown(calories_html(menu), unsafe_allow_html=True)
+
+                    # 구성
+                    st.markdown(ingredients_html(menu), unsafe_allow_html=True)
+
+                    # 카드 종료
+                    st.markdown('</div>', unsafe_allow_html=True)
+                
+                # 투표 버튼
+                votes = load_votes()
+                menu_id = menu.menu_id
+                current_votes = get_menu_votes(votes, menu_id)
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    if st.button(f"👍 {current_votes['좋아요']}", key=f"like_{menu_id}", use_container_width=True):
+                        add_vote(menu_id, '좋아요')
+                        st.rerun()
+                
+                with col2:
+                    if st.button(f"👎 {current_votes['별로']}", key=f"dislike_{menu_id}", use_container_width=True):
+                        add_vote(menu_id, '별로')
+                        st.rerun()
+                
+                # 댓글 섹션
+                with st.expander("💬 댓글 보기/작성"):
+                    comments = load_comments()
+                    menu_comments = get_menu_comments(comments, menu_id)
+                    
+                    # 댓글 표시
+                    if menu_comments:
+                        for comment in menu_comments:
+                            st.markdown(comment_html(comment), unsafe_allow_html=True)
+                    else:
+                        st.info("첫 댓글을 남겨보세요!")
+                    
+                    # 댓글 작성
+                    with st.form(key=f"comment_{menu_id}"):
+                        c_col1, c_col2 = st.columns([1, 3])
+                        with c_col1:
+                            author = st.text_input("이름", key=f"author_{menu_id}", placeholder="익명")
+                        with c_col2:
+                            comment_text = st.text_input("댓글", key=f"text_{menu_id}", placeholder="이 메뉴 어떠셨나요?")
+                        
+                        submit = st.form_submit_button("작성", use_container_width=True)
+                        
+                        if submit and comment_text:
+                            add_menu_comment(menu_id, {
+                                "author": author if author else "익명",
+                                "text": comment_text,
+                                "timestamp": datetime.now(KST).strftime("%Y-%m-%d %H:%M")
+                            })
+                            st.success("댓글이 작성되었습니다!")
+                            st.rerun()
+
+    # 추가 배식대 표시 (맨 밑)
+    extra = menu_data.extra
+    if extra:
+        st.markdown("---")
+        st.markdown("### ➕ 추가 배식대")
+        
+        with st.container():
+            ecol1, ecol2 = st.columns([1, 2])
+            with ecol1:
+                st.markdown(menu_image_html(extra, height=200), unsafe_allow_html=True)
+
+            with ecol2:
+                st.markdown(extra_station_html(extra), unsafe_allow_html=True)
+
+
+    # 라면 메뉴
+    if ramen_menus:
+        st.markdown("---")
+        st.markdown("### 🍜 라면 메뉴")
+
+        for menu in ramen_menus:
+            # 헤더
+            st.markdown(menu_header_html(menu), unsafe_allow_html=True)
+
+            col1, col2 = st.columns([1, 2])
+
+            with col1:
+                st.markdown(menu_image_html(menu, height=250), unsafe_allow_html=True)
+
+            # 라면 종류와 토핑 (파싱 시 분리됨)
+            with col2:
+                if menu.ramen_types:
+                    st.markdown(item_list_html("라면 종류", menu.ramen_types), unsafe_allow_html=True)
+
+                if menu.toppings:
+                    st.markdown(item_list_html("🥚 토핑", menu.toppings), unsafe_allow_html=True)
+
+
+@timed("page.show_menu_page")
 def show_menu_page():
     """BOB SSAFY 메뉴 페이지"""
     # st.markdown('<p class="main-header">🍽️ BOB SSAFY 점심 메뉴</p>', unsafe_allow_html=True)
@@ -600,7 +438,11 @@ password = "your_password"
         st.markdown("자세한 내용은 사이드바 하단의 '🔧 설정 필요'를 참고하세요.")
         return
 
-    # 날짜 선택
+    credentials = get_welstory_credentials()
+    meal_types = list(credentials.get('meal_types', MEAL_TYPES))
+    restaurant_code = credentials.get('restaurant_code', DEFAULT_RESTAURANT_CODE)
+
+    # 날짜/식사 선택 (기본은 중식)
     col1, col2 = st.columns([3, 1])
     with col1:
         selected_date = st.date_input(
@@ -608,276 +450,73 @@ password = "your_password"
             value=datetime.now(KST).date(),
             max_value=datetime.now(KST).date() + timedelta(days=7)
         )
+    meal_type = LUNCH if LUNCH in meal_types else meal_types[0]
+    if len(meal_types) > 1:
+        with col2:
+            meal_type = st.radio("🍽️ 식사", meal_types, index=meal_types.index(meal_type),
+                                 format_func=lambda m: MEAL_TYPE_NAMES.get(m, m), key="menu_meal_type")
 
-    # 메뉴 로드
+    # 메뉴 로드 - 고른 식사만 기다리고, 나머지 식사는 백그라운드에서 캐시에 채워 둠
+    # (식사를 늘려도 페이지 지연은 한 식사 조회 그대로)
     try:
         with st.spinner("메뉴를 불러오는 중... 추가 배식대 가져오는 중... 🚚💦"):
             menu_date = datetime.combine(selected_date, datetime.min.time())
             menu_date = KST.localize(menu_date)
-            menu_data = st.session_state.api.get_menu(date=menu_date)
+            menu_client = CachedMenuClient(st.session_state.api, get_menu_cache())
+            menu_data = menu_client.get_menu(menu_date, meal_type, restaurant_code)
+            menu_client.prefetch(menu_date, [mt for mt in meal_types if mt != meal_type], restaurant_code)
 
-        if not menu_data.get("점심") and not menu_data.get("추가배식대"):
-            st.warning("해당 날짜의 메뉴가 없습니다.")
+        if not menu_data:
+            st.warning(f"해당 날짜의 {MEAL_TYPE_NAMES.get(meal_type, meal_type)} 메뉴가 없습니다.")
             return
+        show_day_menu(menu_data)
+    except Exception as e:
+        st.error(f"메뉴 로드 중 오류 발생: {str(e)}")
 
-        # 일반 메뉴와 라면 메뉴 분리
-        regular_menus = [m for m in menu_data["점심"] if "[라면" not in m.get("메뉴명", "")]
-        ramen_menus = [m for m in menu_data["점심"] if "[라면" in m.get("메뉴명", "")]
-
-        # 일반 메뉴 표시
-        if regular_menus:
-            st.markdown("### 🍱 메인 메뉴")
-
-            # 메뉴 개수만큼 컬럼 생성 (최대 4개)
-            num_cols = min(len(regular_menus), 4)
-            
-            # 메뉴 카드
-            cols = st.columns(num_cols)
-            for idx, menu in enumerate(regular_menus):
-                with cols[idx % num_cols]:
-                    # 컨테이너로 카드 생성
-                    with st.container():
-                        # 코너 + 메뉴명
-                        st.markdown(f"""
-                        <div style="
-                            display: flex;
-                            flex-direction: column;
-                            align-items: center;
-                            gap: 0.8rem;
-                            margin-bottom: 1rem;
-                            padding-bottom: 1rem;
-                            border-bottom: 2px solid rgba(102, 126, 234, 0.2);
-                        ">
-                            <div class="menu-corner">{menu['코너']}</div>
-                            <div style="
-                                font-size: 1.2rem;
-                                font-weight: 700;
-                                line-height: 1.3;
-                                text-align: center;
-                                color: #667eea;
-                            ">{menu['메뉴명']}</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        # 이미지
-                        if menu.get("이미지"):
-                            st.markdown(f"""
-                            <div class="menu-image-container">
-                                <img src="{menu["이미지"]}" class="menu-image">
-                            </div>
-                            """, unsafe_allow_html=True)
-                        else:
-                            st.markdown("""
-                            <div class="menu-image-container">
-                                <div class="menu-image-placeholder">이미지 없음</div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        
-                        # 평점
-                        if menu.get('평균평점', 0) > 0:
-                            st.markdown(f"""
-                            <div class="menu-rating-small">
-                                <span class="score">⭐ {menu['평균평점']:.1f}</span>
-                                <span class="count">({menu['참여자수']}명)</span>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        else:
-                            st.markdown("""
-                            <div class="menu-rating-small">
-                                <span class="score">⭐</span>
-                                <span class="count">(평가 없음)</span>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        
-                        # 칼로리
-                        st.markdown(f'<div class="menu-calories">🔥 {menu["칼로리"]}kcal</div>', unsafe_allow_html=True)
-                        
-                        # 구성
-                        if menu['구성']:
-                            ingredients_list = [ing for ing in menu['구성'] if ing]
-                            ingredients_items = ''.join([f'<div class="ingredient-item">• {ing}</div>' for ing in ingredients_list])
-                            st.markdown(f"""
-                            <div class="menu-ingredients" style="min-height: 150px; max-height: 150px; overflow-y: auto;">
-                                📋 <strong>구성</strong><br>
-                                {ingredients_items}
-                            </div>
-                            """, unsafe_allow_html=True)
-                        else:
-                            st.markdown("""
-                            <div class="menu-ingredients" style="min-height: 150px; max-height: 150px;">
-                                📋 <strong>구성</strong><br>
-                                <div style="color: #999;">구성 정보 없음</div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        
-                        # 카드 종료
-                        st.markdown('</div>', unsafe_allow_html=True)
-                    
-                    # 투표 버튼
-                    votes = load_votes()
-                    menu_id = menu['menu_id']
-                    current_votes = votes.get(menu_id, {"좋아요": 0, "별로": 0})
-                    
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        if st.button(f"👍 {current_votes['좋아요']}", key=f"like_{menu_id}", use_container_width=True):
-                            current_votes['좋아요'] += 1
-                            votes[menu_id] = current_votes
-                            save_votes(votes)
-                            st.rerun()
-                    
-                    with col2:
-                        if st.button(f"👎 {current_votes['별로']}", key=f"dislike_{menu_id}", use_container_width=True):
-                            current_votes['별로'] += 1
-                            votes[menu_id] = current_votes
-                            save_votes(votes)
-                            st.rerun()
-                    
-                    # 댓글 섹션
-                    with st.expander("💬 댓글 보기/작성"):
-                        comments = load_comments()
-                        menu_comments = comments.get(menu_id, [])
-                        
-                        # 댓글 표시
-                        if menu_comments:
-                            for comment in menu_comments:
-                                st.markdown(f"""
-                                <div class="comment-box">
-                                    <div>
-                                        <span class="comment-author">{comment['author']}</span>
-                                        <span style="color: #999; font-size: 0.85rem;">· {comment['timestamp']}</span>
-                                    </div>
-                                    <div style="margin-top: 0.5rem;">{comment['text']}</div>
-                                </div>
-                                """, unsafe_allow_html=True)
-                        else:
-                            st.info("첫 댓글을 남겨보세요!")
-                        
-                        # 댓글 작성
-                        with st.form(key=f"comment_{menu_id}"):
-                            c_col1, c_col2 = st.columns([1, 3])
-                            with c_col1:
-                                author = st.text_input("이름", key=f"author_{menu_id}", placeholder="익명")
-                            with c_col2:
-                                comment_text = st.text_input("댓글", key=f"text_{menu_id}", placeholder="이 메뉴 어떠셨나요?")
-                            
-                            submit = st.form_submit_button("작성", use_container_width=True)
-                            
-                            if submit and comment_text:
-                                if menu_id not in comments:
-                                    comments[menu_id] = []
-                                
-                                comments[menu_id].append({
-                                    "author": author if author else "익명",
-                                    "text": comment_text,
-                                    "timestamp": datetime.now(KST).strftime("%Y-%m-%d %H:%M")
-                                })
-                                save_comments(comments)
-                                st.success("댓글이 작성되었습니다!")
-                                st.rerun()
-
-        # 추가 배식대 표시 (맨 밑)
-        extra = menu_data.get("추가배식대")
-        if extra:
-            st.markdown("---")
-            st.markdown("### ➕ 추가 배식대")
-            
-            with st.container():
-                ecol1, ecol2 = st.columns([1, 2])
-                with ecol1:
-                    if extra.get("이미지"):
-                        st.markdown(f"""
-                        <div class="menu-image-container" style="height: 200px;">
-                            <img src="{extra["이미지"]}" class="menu-image">
-                        </div>
-                        """, unsafe_allow_html=True)
-                    else:
-                        st.markdown("""
-                        <div class="menu-image-container" style="height: 200px;">
-                            <div class="menu-image-placeholder">이미지 없음</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                with ecol2:
-                    st.markdown(f"""
-                    <div style="background: rgba(102, 126, 234, 0.05); padding: 1.5rem; border-radius: 15px; border: 1px">
-                        <div class="menu-corner" style="background: #FF6B35; margin-bottom: 10px;">{extra['메뉴명']}</div>
-                        <div style="font-size: 0.9rem; color: #555;">📋 <strong>구성:</strong> {' / '.join(filter(None, extra['구성']))}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-
-        # 라면 메뉴
-        if ramen_menus:
-            st.markdown("---")
-            st.markdown("### 🍜 라면 메뉴")
-
-            for menu in ramen_menus:
-                # 헤더
-                st.markdown(f"""
-                <div class="menu-header">
-                    <div class="menu-corner">{menu['코너']}</div>
-                    <div class="menu-name">{menu['메뉴명']}</div>
-                </div>
-                """, unsafe_allow_html=True)
-
-                # 라면 종류와 토핑 분리
-                ramen_types = []
-                toppings = []
-                topping_idx = -1
-
-                for i, item in enumerate(menu.get("구성", [])):
-                    if "[토핑" in item:
-                        topping_idx = i
-                        break
-
-                if topping_idx > 0:
-                    ramen_types = menu["구성"][1:topping_idx]
-                    toppings = menu["구성"][topping_idx+1:]
-                else:
-                    ramen_types = menu["구성"][1:] if len(menu["구성"]) > 1 else []
 
-                col1, col2 = st.columns([1, 2])
+@timed("page.show_restaurants_page")
+def show_restaurants_page():
+    """식당별 메뉴를 나란히 표시 (식당들은 동시에 조회)"""
+    st.markdown('<p class="main-header">🏢 식당별 메뉴</p>', unsafe_allow_html=True)
 
-                with col1:
-                    if menu.get("이미지"):
-                        st.markdown(f"""
-                        <div class="menu-image-container" style="height: 250px;">
-                            <img src="{menu["이미지"]}" class="menu-image">
-                        </div>
-                        """, unsafe_allow_html=True)
-                    else:
-                        st.markdown("""
-                        <div class="menu-image-container" style="height: 250px;">
-                            <div class="menu-image-placeholder">이미지 없음</div>
-                        </div>
-                        """, unsafe_allow_html=True)
+    if 'api' not in st.session_state or st.session_state.api is None:
+        st.warning("⚠️ 웰스토리 API에 연결되지 않았습니다.")
+        return
 
-                with col2:
-                    if ramen_types:
-                        ramen_list = [ing for ing in ramen_types]
-                        ramen_items = ''.join([f'<div class="ingredient-item">• {ing}</div>' for ing in ramen_list])
-                        st.markdown(f"""
-                        <div class="menu-ingredients" style="min-height: 150px; max-height: 150px; overflow-y: auto;">
-                            📋 <strong>라면 종류</strong><br>
-                            {ramen_items}
-                        </div>
-                        """, unsafe_allow_html=True)
+    restaurants = get_restaurants()
+    selected_date = st.date_input(
+        "📅 날짜 선택",
+        value=datetime.now(KST).date(),
+        max_value=datetime.now(KST).date() + timedelta(days=7),
+        key="restaurants_date"
+    )
+    menu_date = KST.localize(datetime.combine(selected_date, datetime.min.time()))
 
-                    if toppings:
-                        toppings_list = [ing for ing in toppings]
-                        toppings_items = ''.join([f'<div class="ingredient-item">• {ing}</div>' for ing in toppings_list])
-                        st.markdown(f"""
-                        <div class="menu-ingredients" style="min-height: 150px; max-height: 150px; overflow-y: auto;">
-                            📋 <strong>🥚 토핑</strong><br>
-                            {toppings_items}
-                        </div>
-                        """, unsafe_allow_html=True)
+    try:
+        with st.spinner("식당별 메뉴를 불러오는 중..."):
+            menu_client = CachedMenuClient(st.session_state.api, get_menu_cache())
+            menus = menu_client.get_menus_for_restaurants(menu_date, restaurants)
     except Exception as e:
         st.error(f"메뉴 로드 중 오류 발생: {str(e)}")
+        return
 
-
+    cols = st.columns(len(restaurants))
+    for col, (code, name) in zip(cols, restaurants.items()):
+        with col:
+            st.markdown(f"### {name}")
+            day_menu = menus[code]
+            if not day_menu:
+                st.info("메뉴가 없습니다.")
+                continue
+            for menu in day_menu.items:
+                st.markdown(menu_title_html(menu), unsafe_allow_html=True)
+                st.markdown(rating_html(menu), unsafe_allow_html=True)
+                st.markdown(calories_html(menu), unsafe_allow_html=True)
+            if day_menu.extra:
+                st.markdown(extra_station_html(day_menu.extra), unsafe_allow_html=True)
+
+
+@timed("page.show_board_page")
 def show_board_page():
     """게시판 페이지"""
     st.markdown('<p class="main-header">📋 BOB HUB</p>', unsafe_allow_html=True)
@@ -910,16 +549,13 @@ def show_board_page():
                 st.rerun()
 
             if submit and title and content:
-                new_post = {
-                    "id": len(posts),
+                add_board_post({
                     "title": title,
                     "author": author if author else "익명",
                     "content": content,
                     "timestamp": datetime.now(KST).strftime("%Y-%m-%d %H:%M"),
                     "comments": []
-                }
-                posts.insert(0, new_post)
-                save_board_posts(posts)
+                })
                 st.session_state.writing = False
                 st.success("게시글이 작성되었습니다!")
                 st.rerun()
@@ -960,33 +596,37 @@ def show_board_page():
                     c_submit = st.form_submit_button("댓글 작성", use_container_width=True)
 
                     if c_submit and c_text:
-                        if 'comments' not in post:
-                            post['comments'] = []
-
-                        post['comments'].append({
+                        add_board_comment(post['id'], {
                             "author": c_author if c_author else "익명",
                             "text": c_text,
                             "timestamp": datetime.now(KST).strftime("%Y-%m-%d %H:%M")
                         })
-                        save_board_posts(posts)
                         st.success("댓글이 작성되었습니다!")
                         st.rerun()
 
 
+@timed("page.show_stats_page")
 def show_stats_page():
     """통계 페이지"""
     st.markdown('<p class="main-header">📊 메뉴 통계</p>', unsafe_allow_html=True)
 
-    votes = load_votes()
+    # 날짜 x 코너 누적 합 인덱스 (메뉴별 투표 수는 인턴된 메뉴 ID + 배열)
+    index = get_vote_index_cache().get()
 
-    if not votes:
+    if not len(index.counters):
         st.info("아직 투표 데이터가 없습니다.")
         return
 
-    # 전체 통계 카드
-    total_likes = sum(v['좋아요'] for v in votes.values())
-    total_dislikes = sum(v['별로'] for v in votes.values())
-    total_votes = total_likes + total_dislikes
+    # 기간 선택 (기간 길이와 관계없이 바로 집계)
+    start = end = None
+    if index.first_date:
+        date_range = st.date_input("📅 기간", value=(index.first_date, index.last_date),
+                                   min_value=index.first_date, max_value=index.last_date, key="stats_range")
+        if len(date_range) == 2:
+            start, end = date_range
+
+    # 통계 카드
+    total_likes, total_dislikes, total_votes = index.totals(start, end)
 
     col1, col2, col3 = st.columns(3)
 
@@ -1022,23 +662,10 @@ def show_stats_page():
     # 인기 메뉴 TOP 5
     st.markdown("### 🏆 인기 메뉴 TOP 5")
 
-    menu_scores = []
-    for menu_id, vote_data in votes.items():
-        total = vote_data['좋아요'] + vote_data['별로']
-        if total > 0:
-            score = vote_data['좋아요'] / total * 100
-            menu_scores.append({
-                "메뉴": menu_id.split('_')[-1] if '_' in menu_id else menu_id,
-                "좋아요": vote_data['좋아요'],
-                "별로": vote_data['별로'],
-                "좋아요율": score,
-                "총투표": total
-            })
-
-    menu_scores.sort(key=lambda x: x['좋아요율'], reverse=True)
+    menu_scores = index.top_menus(start, end, 5)
 
     if menu_scores:
-        for idx, menu in enumerate(menu_scores[:5], 1):
+        for idx, menu in enumerate(menu_scores, 1):
             # 메달 이모지
             medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"{idx}."
 
@@ -1067,8 +694,144 @@ def show_stats_page():
     else:
         st.info("투표 데이터가 없습니다.")
 
+    # 코너별 투표
+    corner_stats = index.by_corner(start, end)
+    if corner_stats:
+        st.markdown("### 🍱 코너별 투표")
+        st.dataframe(
+            [dict(row, 좋아요율=round(row["좋아요율"], 1)) for row in corner_stats],
+            use_container_width=True, hide_index=True,
+        )
+
+    # 투표 시간대/요일 (시각이 기록된 투표만, 미리 집계된 격자에서 읽음)
+    rollup = get_vote_rollup()
+    rollup.refresh()
+    if rollup.total:
+        st.markdown("### ⏰ 투표 시간대")
+        counts = rollup.hour_weekday().astype(float)
+        counts[counts == 0] = np.nan
+        voted_hours = np.flatnonzero(~np.isnan(counts).all(axis=1))
+        hours = range(voted_hours.min(), voted_hours.max() + 1)
+        st.markdown(heatmap_html([f"{h}시" for h in hours], list(WEEKDAYS), counts[hours.start:hours.stop]),
+                    unsafe_allow_html=True)
+
+        st.markdown("### 📅 요일별 코너 좋아요율")
+        likes, dislikes = rollup.weekday_corner()
+        total = likes + dislikes
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rate = np.where(total > 0, likes / total * 100, np.nan)
+        days = [d for d in range(len(WEEKDAYS)) if total[d].any()]
+        st.markdown(heatmap_html([WEEKDAYS[d] for d in days], rollup.corners, rate[days], fmt="{:.0f}%"),
+                    unsafe_allow_html=True)
+
+
+NUTRITION_PERIODS = {"일별": "day", "주별": "week", "월별": "month"}
+
+@timed("page.show_nutrition_page")
+def show_nutrition_page():
+    """영양 통계 페이지 (지난 메뉴의 코너별 칼로리)"""
+    st.markdown('<p class="main-header">🥗 영양 통계</p>', unsafe_allow_html=True)
+
+    archive = get_menu_archive()
+    if archive is None or not len(archive):
+        st.info("지난 메뉴가 없습니다. `python -m backfill --start YYYYMMDD` 로 먼저 수집하세요.")
+        return
+
+    first_date = pd.Timestamp(archive["date"][0]).date()
+    last_date = pd.Timestamp(archive["date"][-1]).date()
+    default_start = max(first_date, last_date - timedelta(days=90))
+
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        date_range = st.date_input("📅 기간", value=(default_start, last_date),
+                                   min_value=first_date, max_value=last_date, key="nutrition_range")
+    with col2:
+        period_label = st.radio("단위", list(NUTRITION_PERIODS), horizontal=True, key="nutrition_period")
+    with col3:
+        meal_types = [str(m) for m in np.unique(archive["meal_type"])]
+        meal_type = st.selectbox("식사", meal_types, index=meal_types.index("2") if "2" in meal_types else 0,
+                                 format_func=lambda m: MEAL_TYPE_NAMES.get(m, m), key="nutrition_meal")
+
+    if len(date_range) != 2:
+        st.info("기간의 시작일과 종료일을 선택하세요.")
+        return
+    start, end = (d.strftime("%Y%m%d") for d in date_range)
+
+    restaurants = archive.dicts["restaurant"]
+    restaurant_code = get_welstory_credentials().get("restaurant_code", DEFAULT_RESTAURANT_CODE)
+    if len(restaurants) > 1:
+        names = get_restaurants()
+        restaurant_code = st.selectbox(
+            "🏢 식당", restaurants,
+            index=restaurants.index(restaurant_code) if restaurant_code in restaurants else 0,
+            format_func=lambda code: names.get(code, code), key="nutrition_restaurant")
+    elif restaurants:
+        restaurant_code = restaurants[0]
+
+    report = nutrition_report(archive.path.name, start, end, NUTRITION_PERIODS[period_label],
+                              restaurant_code, meal_type, archive)
+    distribution = report["distribution"]
+    if not distribution:
+        st.info("해당 기간의 칼로리 정보가 없습니다.")
+        return
+
+    # 코너별 평균 칼로리 추이
+    st.markdown(f"### 📈 코너별 {period_label} 평균 칼로리")
+    trend = report["trend"]
+    st.line_chart(pd.DataFrame(trend["mean"], index=pd.DatetimeIndex(trend["periods"]),
+                               columns=trend["corners"]))
+
+    # 분포
+    st.markdown("### 📊 코너별 칼로리 분포")
+    st.dataframe(
+        [{k: (round(v) if isinstance(v, float) else v) for k, v in row.items()} for row in distribution],
+        use_container_width=True, hide_index=True,
+    )
+    histogram = report["histogram"]
+    st.bar_chart(pd.DataFrame(histogram["count"], index=[f"{int(b)}" for b in histogram["bins"]],
+                              columns=histogram["corners"]))
+
+    # 이상치
+    st.markdown("### 🔎 코너 평균에서 크게 벗어난 메뉴")
+    if report["outliers"]:
+        st.dataframe(
+            [dict(row, 칼로리=round(row["칼로리"]), **{"코너 평균": round(row["코너 평균"]), "z": round(row["z"], 1)})
+             for row in report["outliers"]],
+            use_container_width=True, hide_index=True,
+        )
+    else:
+        st.info("이상치가 없습니다.")
+
+
+def show_profile_page():
+    """프로파일 페이지 (최근 실행 중 느린 순)"""
+    st.markdown('<p class="main-header">🛠️ 느린 실행 목록</p>', unsafe_allow_html=True)
+
+    runs = slowest_runs(PROFILE_DIR)
+    if not runs:
+        st.info("저장된 프로파일이 없습니다. `?profile=<token>`으로 접속하면 해당 실행이 기록됩니다.")
+        return
+
+    st.dataframe(
+        [{"시작": r["started_at"], "페이지": r["label"], "소요(ms)": r["duration_ms"],
+          "샘플 수": r["samples"], "파일": r["file"]} for r in runs],
+        use_container_width=True,
+        hide_index=True,
+    )
+
+    selected = st.selectbox("프로파일 파일", [r["file"] for r in runs])
+    if selected:
+        with open(PROFILE_DIR / selected, 'r', encoding='utf-8') as f:
+            collapsed = f.read()
+        st.download_button("⬇️ collapsed stack 다운로드 (speedscope/flamegraph)", collapsed,
+                           file_name=selected, use_container_width=True)
+        st.code("\n".join(collapsed.splitlines()[:20]) or "(샘플 없음)", language="text")
+
 
 def main():
+    start_metrics()
+    get_cold_archive()
+
     # 계정 정보 가져오기 (Streamlit Secrets에서)
     credentials = get_welstory_credentials()
 
@@ -1081,13 +844,19 @@ def main():
     if not st.session_state.logged_in and credentials.get('username') and credentials.get('password'):
         try:
             with st.spinner("BOB SSAFY 불러오는 중..."):
-                api = WelplusAPI()
+                api = SyncWelplusAPI(api=WelplusAPI(base_url=credentials['base_url']))
                 if api.login(credentials['username'], credentials['password']):
                     st.session_state.api = api
                     st.session_state.logged_in = True
         except Exception as e:
             st.error(f"API 연결 실패: {str(e)}")
 
+    if credentials.get('username') and credentials.get('password'):
+        try:
+            start_http_api(credentials['username'], credentials['password'], credentials['base_url'])
+        except Exception as e:
+            st.warning(f"JSON API 시작 실패: {str(e)}")
+
     # 사이드바
     with st.sidebar:
         st.markdown("## 🍽️ BOB SSAFY")
@@ -1104,9 +873,18 @@ def main():
         st.markdown("---")
 
         # 메뉴 선택
+        pages = ["🍽️ 오늘의 메뉴", "📋 BOB HUB", "📊 통계"]
+        if len(get_restaurants()) > 1:
+            pages.append("🏢 식당별 메뉴")
+        if has_menu_history():
+            pages.append("🥗 영양 통계")
+        if is_profiling_admin(get_profiling_config()):
+            pages.append("🛠️ 프로파일")
+
         page = st.radio(
             "페이지 선택",
-            ["🍽️ 오늘의 메뉴", "📋 BOB HUB", "📊 통계"],
+            pages,
+            key="page",
             label_visibility="collapsed"
         )
 
@@ -1175,7 +953,19 @@ def main():
         show_board_page()
     elif page == "📊 통계":
         show_stats_page()
+    elif page == "🏢 식당별 메뉴":
+        show_restaurants_page()
+    elif page == "🥗 영양 통계":
+        show_nutrition_page()
+    elif page == "🛠️ 프로파일":
+        show_profile_page()
 
 
 if __name__ == "__main__":
-    main()
+    profiling = get_profiling_config()
+    if profiling_requested(profiling):
+        label = PAGE_SLUGS.get(st.session_state.get("page"), "main")
+        with profile_run(PROFILE_DIR, label=label):
+            main()
+    else:
+        main()